@@ -0,0 +1,64 @@
+"""0002
+
+Revision ID: b694e4cb3512
+Revises: 9ab9ca504f05
+Create Date: 2024-06-03 10:12:41.215907
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b694e4cb3512"
+down_revision: Union[str, None] = "9ab9ca504f05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade db."""
+    op.create_table(
+        "advertisement_stat",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("model", sa.String(length=100), nullable=False),
+        sa.Column("adv_date", sa.Date(), nullable=True),
+        sa.Column("adv_count", sa.Integer(), nullable=False),
+        sa.Column("min_price", sa.Integer(), nullable=False),
+        sa.Column("max_price", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("advertisement_stat_pkey")),
+        sa.UniqueConstraint(
+            "name",
+            "model",
+            "adv_date",
+            name=op.f("advertisement_stat_name_key"),
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+    op.create_index(
+        "advertisement_lower_name_lower_model_idx",
+        "advertisement",
+        [sa.text("lower(name)"), sa.text("lower(model)")],
+    )
+    op.execute(
+        """
+        INSERT INTO advertisement_stat
+            (name, model, adv_date, adv_count, min_price, max_price)
+        SELECT lower(name), lower(model), adv_date, count(*), min(price), max(price)
+        FROM advertisement
+        GROUP BY lower(name), lower(model), adv_date
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade db."""
+    op.drop_index(
+        "advertisement_lower_name_lower_model_idx",
+        table_name="advertisement",
+    )
+    op.drop_table("advertisement_stat")
@@ -0,0 +1,65 @@
+"""0003
+
+Revision ID: 96b12cd1eece
+Revises: b694e4cb3512
+Create Date: 2024-06-10 09:31:07.482113
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "96b12cd1eece"
+down_revision: Union[str, None] = "b694e4cb3512"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade db."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "advertisement_adv_date_id_idx",
+            "advertisement",
+            [sa.text("adv_date NULLS FIRST"), "id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "advertisement_lower_model_idx",
+            "advertisement",
+            [sa.text("lower(model)")],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "advertisement_created_at_brin_idx",
+            "advertisement",
+            ["created_at"],
+            postgresql_using="brin",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "advertisement_reverse_url_idx",
+            "advertisement",
+            [sa.text("reverse(url) text_pattern_ops")],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade db."""
+    with op.get_context().autocommit_block():
+        for index_name in (
+            "advertisement_reverse_url_idx",
+            "advertisement_created_at_brin_idx",
+            "advertisement_lower_model_idx",
+            "advertisement_adv_date_id_idx",
+        ):
+            op.drop_index(
+                index_name,
+                table_name="advertisement",
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,61 @@
+"""0004
+
+Revision ID: 82776963c44d
+Revises: 96b12cd1eece
+Create Date: 2024-06-12 11:05:43.906218
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "82776963c44d"
+down_revision: Union[str, None] = "96b12cd1eece"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade db."""
+    op.add_column(
+        "advertisement",
+        sa.Column(
+            "url_slug",
+            sa.String(length=255),
+            sa.Computed("substring(rtrim(url, '/') from '[^/]*$')", persisted=True),
+            nullable=False,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "advertisement_url_slug_idx",
+            "advertisement",
+            ["url_slug"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "advertisement_reverse_url_idx",
+            table_name="advertisement",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade db."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "advertisement_reverse_url_idx",
+            "advertisement",
+            [sa.text("reverse(url) text_pattern_ops")],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "advertisement_url_slug_idx",
+            table_name="advertisement",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("advertisement", "url_slug")
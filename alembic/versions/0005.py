@@ -0,0 +1,86 @@
+"""0005
+
+Revision ID: f699179fb8c8
+Revises: 82776963c44d
+Create Date: 2024-06-17 08:44:19.530871
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f699179fb8c8"
+down_revision: Union[str, None] = "82776963c44d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade db."""
+    op.execute(
+        r"""
+        CREATE FUNCTION advertisement_url_key(url text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE
+        AS $$
+            SELECT lower(
+                regexp_replace(
+                    rtrim(split_part(split_part(url, '#', 1), '?', 1), '/'),
+                    '^[a-z][a-z0-9+.-]*://(www\.)?',
+                    '',
+                    'i'
+                )
+            )
+        $$
+        """
+    )
+    op.add_column(
+        "advertisement",
+        sa.Column(
+            "url_key",
+            sa.String(length=255),
+            sa.Computed("advertisement_url_key(url)", persisted=True),
+            nullable=False,
+        ),
+    )
+    op.execute(
+        """
+        DELETE FROM advertisement AS duplicate
+        USING advertisement
+        WHERE duplicate.url_key = advertisement.url_key
+            AND duplicate.id < advertisement.id
+        """
+    )
+    op.execute("DELETE FROM advertisement_stat")
+    op.execute(
+        """
+        INSERT INTO advertisement_stat
+            (name, model, adv_date, adv_count, min_price, max_price)
+        SELECT lower(name), lower(model), adv_date, count(*), min(price), max(price)
+        FROM advertisement
+        GROUP BY lower(name), lower(model), adv_date
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "advertisement_url_key_key",
+            "advertisement",
+            ["url_key"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade db."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "advertisement_url_key_key",
+            table_name="advertisement",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("advertisement", "url_key")
+    op.execute("DROP FUNCTION advertisement_url_key(text)")
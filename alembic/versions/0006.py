@@ -0,0 +1,170 @@
+"""0006
+
+Revision ID: 5ffbd129bcb1
+Revises: f699179fb8c8
+Create Date: 2024-06-19 09:27:53.402118
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5ffbd129bcb1"
+down_revision: Union[str, None] = "f699179fb8c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PREMAKE_DAYS = 7
+ADV_COLUMNS = (
+    "id, url, name, price, model, region, run, color, salon, seller, "
+    "adv_date, created_at"
+)
+
+
+def create_advertisement_table(table_name: str, partitioned: bool) -> None:
+    """Create advertisement table without constraints and indexes."""
+    op.execute(
+        """
+        CREATE TABLE {table_name} (
+            id integer DEFAULT nextval('advertisement_id_seq') NOT NULL,
+            url varchar(255) NOT NULL,
+            name varchar(100) NOT NULL,
+            price integer NOT NULL,
+            model varchar(100) NOT NULL,
+            region varchar(100) NOT NULL,
+            run integer NOT NULL,
+            color varchar(100),
+            salon varchar(50),
+            seller varchar(255) NOT NULL,
+            adv_date date,
+            created_at timestamp with time zone
+                DEFAULT CURRENT_TIMESTAMP NOT NULL,
+            url_slug varchar(255) GENERATED ALWAYS AS
+                (substring(rtrim(url, '/') from '[^/]*$')) STORED NOT NULL,
+            url_key varchar(255) GENERATED ALWAYS AS
+                (advertisement_url_key(url)) STORED NOT NULL
+        ) {partition_by}
+        """.format(
+            table_name=table_name,
+            partition_by="PARTITION BY RANGE (created_at)" if partitioned else "",
+        )
+    )
+
+
+def replace_advertisement_table(partitioned: bool, copy_select: str) -> None:
+    """Replace advertisement table with a new one, copying rows."""
+    op.rename_table("advertisement", "advertisement_old")
+    create_advertisement_table("advertisement", partitioned)
+    if partitioned:
+        op.execute(
+            "CREATE TABLE advertisement_default PARTITION OF advertisement DEFAULT"
+        )
+        op.execute(
+            """
+            SELECT advertisement_create_partitions(
+                (now() AT TIME ZONE 'UTC')::date - 2,
+                (now() AT TIME ZONE 'UTC')::date + {premake_days}
+            )
+            """.format(
+                premake_days=PREMAKE_DAYS
+            )
+        )
+    op.execute(
+        "INSERT INTO advertisement ({columns}) {copy_select}".format(
+            columns=ADV_COLUMNS,
+            copy_select=copy_select,
+        )
+    )
+    op.execute("ALTER SEQUENCE advertisement_id_seq OWNED BY NONE")
+    op.drop_table("advertisement_old")
+    op.execute("ALTER SEQUENCE advertisement_id_seq OWNED BY advertisement.id")
+
+
+def create_advertisement_indexes(unique_key: Sequence[str]) -> None:
+    """Create advertisement indexes, url key index with given columns."""
+    op.create_index(
+        "advertisement_lower_name_lower_model_idx",
+        "advertisement",
+        [sa.text("lower(name)"), sa.text("lower(model)")],
+    )
+    op.create_index(
+        "advertisement_adv_date_id_idx",
+        "advertisement",
+        [sa.text("adv_date ASC NULLS FIRST"), "id"],
+    )
+    op.create_index(
+        "advertisement_lower_model_idx",
+        "advertisement",
+        [sa.text("lower(model)")],
+    )
+    op.create_index(
+        "advertisement_created_at_brin_idx",
+        "advertisement",
+        ["created_at"],
+        postgresql_using="brin",
+    )
+    op.create_index("advertisement_url_slug_idx", "advertisement", ["url_slug"])
+    op.create_index(
+        "advertisement_url_key_key",
+        "advertisement",
+        unique_key,
+        unique=True,
+    )
+
+
+def upgrade() -> None:
+    """Upgrade db."""
+    op.execute(
+        """
+        CREATE FUNCTION advertisement_create_partitions(from_day date, to_day date)
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            partition_day date;
+        BEGIN
+            FOR partition_day IN
+                SELECT generate_series(from_day, to_day, interval '1 day')::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF advertisement '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'advertisement_p' || to_char(partition_day, 'YYYYMMDD'),
+                    partition_day::timestamp AT TIME ZONE 'UTC',
+                    (partition_day + 1)::timestamp AT TIME ZONE 'UTC'
+                );
+            END LOOP;
+        END
+        $$
+        """
+    )
+    replace_advertisement_table(
+        partitioned=True,
+        copy_select="SELECT {columns} FROM advertisement_old".format(
+            columns=ADV_COLUMNS,
+        ),
+    )
+    op.create_primary_key(
+        "advertisement_pkey",
+        "advertisement",
+        ["id", "created_at"],
+    )
+    create_advertisement_indexes(["url_key", "created_at"])
+
+
+def downgrade() -> None:
+    """Downgrade db."""
+    replace_advertisement_table(
+        partitioned=False,
+        copy_select=(
+            "SELECT DISTINCT ON (url_key) {columns} FROM advertisement_old "
+            "ORDER BY url_key, id DESC"
+        ).format(columns=ADV_COLUMNS),
+    )
+    op.create_primary_key("advertisement_pkey", "advertisement", ["id"])
+    create_advertisement_indexes(["url_key"])
+    op.execute("DROP FUNCTION advertisement_create_partitions(date, date)")
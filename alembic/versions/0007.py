@@ -0,0 +1,66 @@
+"""0007
+
+Revision ID: bf4d297f40ab
+Revises: 5ffbd129bcb1
+Create Date: 2024-06-21 11:05:37.918264
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "bf4d297f40ab"
+down_revision: Union[str, None] = "5ffbd129bcb1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade db."""
+    op.add_column(
+        "advertisement",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('simple', name || ' ' || model || ' ' || region"
+                " || ' ' || coalesce(color, '') || ' ' || seller)",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "advertisement_search_vector_idx",
+        "advertisement",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT FROM pg_available_extensions WHERE name = 'pg_trgm'
+            ) THEN
+                CREATE EXTENSION IF NOT EXISTS pg_trgm;
+                CREATE INDEX advertisement_name_model_trgm_idx
+                ON advertisement
+                USING gin (lower(name || ' ' || model) gin_trgm_ops);
+            END IF;
+        END
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade db."""
+    op.execute("DROP INDEX IF EXISTS advertisement_name_model_trgm_idx")
+    op.drop_index("advertisement_search_vector_idx", table_name="advertisement")
+    op.drop_column("advertisement", "search_vector")
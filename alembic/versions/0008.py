@@ -0,0 +1,121 @@
+"""0008
+
+Revision ID: 3c9e1a7d52f4
+Revises: bf4d297f40ab
+Create Date: 2024-06-24 10:12:41.527306
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9e1a7d52f4"
+down_revision: Union[str, None] = "bf4d297f40ab"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade db."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION advertisement_create_partitions(
+            from_day date,
+            to_day date
+        )
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            partition_day date;
+            partition_name text;
+            day_start timestamp with time zone;
+            day_end timestamp with time zone;
+            adv_columns text;
+        BEGIN
+            SELECT string_agg(quote_ident(attname), ', ' ORDER BY attnum)
+            INTO adv_columns
+            FROM pg_attribute
+            WHERE attrelid = 'advertisement'::regclass
+                AND attnum > 0
+                AND NOT attisdropped
+                AND attgenerated = '';
+            FOR partition_day IN
+                SELECT generate_series(from_day, to_day, interval '1 day')::date
+            LOOP
+                partition_name := 'advertisement_p'
+                    || to_char(partition_day, 'YYYYMMDD');
+                CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+                day_start := partition_day::timestamp AT TIME ZONE 'UTC';
+                day_end := (partition_day + 1)::timestamp AT TIME ZONE 'UTC';
+                BEGIN
+                    EXECUTE format(
+                        'CREATE TEMP TABLE advertisement_moved AS '
+                        'SELECT %s FROM advertisement_default WITH NO DATA',
+                        adv_columns
+                    );
+                    EXECUTE format(
+                        'WITH moved AS (DELETE FROM advertisement_default '
+                        'WHERE created_at >= %L AND created_at < %L '
+                        'RETURNING %s) '
+                        'INSERT INTO advertisement_moved SELECT * FROM moved',
+                        day_start,
+                        day_end,
+                        adv_columns
+                    );
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF advertisement '
+                        'FOR VALUES FROM (%L) TO (%L)',
+                        partition_name,
+                        day_start,
+                        day_end
+                    );
+                    EXECUTE format(
+                        'INSERT INTO advertisement (%s) '
+                        'SELECT %s FROM advertisement_moved',
+                        adv_columns,
+                        adv_columns
+                    );
+                    DROP TABLE advertisement_moved;
+                EXCEPTION WHEN OTHERS THEN
+                    RAISE WARNING 'Partition % is not created: %',
+                        partition_name, SQLERRM;
+                END;
+            END LOOP;
+        END
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade db."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION advertisement_create_partitions(
+            from_day date,
+            to_day date
+        )
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            partition_day date;
+        BEGIN
+            FOR partition_day IN
+                SELECT generate_series(from_day, to_day, interval '1 day')::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF advertisement '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'advertisement_p' || to_char(partition_day, 'YYYYMMDD'),
+                    partition_day::timestamp AT TIME ZONE 'UTC',
+                    (partition_day + 1)::timestamp AT TIME ZONE 'UTC'
+                );
+            END LOOP;
+        END
+        $$
+        """
+    )
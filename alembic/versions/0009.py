@@ -0,0 +1,45 @@
+"""0009
+
+Revision ID: 8a4f2b6c1e93
+Revises: 3c9e1a7d52f4
+Create Date: 2024-06-25 08:41:17.203954
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8a4f2b6c1e93"
+down_revision: Union[str, None] = "3c9e1a7d52f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade db."""
+    op.add_column(
+        "advertisement",
+        sa.Column("last_seen_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute("UPDATE advertisement SET last_seen_at = created_at")
+    op.alter_column(
+        "advertisement",
+        "last_seen_at",
+        nullable=False,
+        server_default=sa.text("CURRENT_TIMESTAMP"),
+    )
+    op.create_index(
+        "advertisement_last_seen_at_idx",
+        "advertisement",
+        ["last_seen_at"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade db."""
+    op.drop_index("advertisement_last_seen_at_idx", table_name="advertisement")
+    op.drop_column("advertisement", "last_seen_at")
@@ -1,47 +1,227 @@
 """Auxiliary functionality of advertisement apps."""
 
-from dataclasses import dataclass
+import csv
+import io
+import json
+import re
 from datetime import date
-from typing import Sequence
+from typing import Mapping, Sequence
 
+import orjson
 from dateutil.relativedelta import relativedelta
 
+from apps.advertisements.schemas import ADV_OUT_FIELDS, AdvNameModelQuerySchema
+from apps.common.cache import VersionedCache
+from apps.common.common_utilities import decode_cursor, encode_cursor
+from apps.common.enum import ExportFormat
+from apps.common.exceptions import BackendError
+from apps.common.responses import ConditionalGet
+from settings import Settings
 
-@dataclass
-class AdvStat:
-    """Advertisement statistical data."""
+PRICE_PERCENTILES = (
+    ('p10', 0.1),
+    ('p25', 0.25),
+    ('median', 0.5),
+    ('p75', 0.75),
+    ('p90', 0.9),
+)
 
-    min_price: int = 100000000
-    max_price: int = 0
-    num_day: int = 0
-    num_week: int = 0
-    num_month: int = 0
+# Statistics min and max prices without matching advertisements.
+EMPTY_STAT_MIN_PRICE = 100000000
+EMPTY_STAT_MAX_PRICE = 0
 
 
 class AdvAuxiliaryFunc:
     """Auxiliary functionality for advertisement apps."""
 
-    def get_statistical_info(self, model_data: Sequence) -> AdvStat:
+    def get_stat_dates(self) -> tuple[date, date, date]:
         """
-        Get statistical model data.
+        Get start dates of statistical periods.
 
-        :param model_data: Sequence Advertisement model data, selected with filters.
-        :return: AdvStat instance.
+        :return: tuple Day, week and month ago dates.
         """
-        stat_data = AdvStat()
-        day_ago = date.today() + relativedelta(days=-1)
-        week_ago = date.today() + relativedelta(days=-7)
-        month_ago = date.today() + relativedelta(months=-1)
-        for model in model_data:
-            stat_data.min_price = min(stat_data.min_price, model.price)
-            stat_data.max_price = max(stat_data.max_price, model.price)
-            if model.adv_date >= day_ago:
-                stat_data.num_day += 1
-            if model.adv_date >= week_ago:
-                stat_data.num_week += 1
-            if model.adv_date >= month_ago:
-                stat_data.num_month += 1
-        return stat_data
+        today = date.today()
+        return (
+            today + relativedelta(days=-1),
+            today + relativedelta(days=-7),
+            today + relativedelta(months=-1),
+        )
+
+    def get_stat_cache_key(
+        self,
+        car_info: AdvNameModelQuerySchema,
+        stat_name: str = 'name_model',
+    ) -> str:
+        """
+        Get statistical info cache key from normalized car info.
+
+        Key contains current date, since day/week/month counts depend on it.
+
+        :param car_info: AdvNameModelQuerySchema Car name and model filters.
+        :param stat_name: str Kind of statistical info.
+        :return: str Cache key.
+        """
+        return json.dumps(
+            [
+                stat_name,
+                car_info.name.lower() if car_info.name else None,
+                car_info.model.lower() if car_info.model else None,
+                date.today().isoformat(),
+            ],
+        )
+
+    def get_period_cursor(self, adv_date: date | None, adv_id: int) -> str:
+        """
+        Get period list cursor pointing after advertisement with given adv_date.
+
+        :param adv_date: date | None Advertisement adv_date.
+        :param adv_id: int Advertisement id.
+        :return: str Opaque cursor.
+        """
+        return encode_cursor([adv_date.isoformat() if adv_date else None, adv_id])
+
+    def parse_period_cursor(self, cursor: str) -> tuple[date | None, int]:
+        """
+        Parse period list cursor.
+
+        :param cursor: str Opaque cursor, got with get_period_cursor.
+        :return: tuple Advertisement adv_date and id, cursor points after.
+        """
+        try:
+            return self._get_period_cursor_values(*decode_cursor(cursor))
+        except (TypeError, ValueError):
+            raise BackendError(message='Invalid cursor.')
+
+    def _get_period_cursor_values(
+        self,
+        adv_date: str | None,
+        adv_id: int,
+    ) -> tuple[date | None, int]:
+        """Convert decoded period list cursor values."""
+        if adv_date is None:
+            return None, int(adv_id)
+        return date.fromisoformat(adv_date), int(adv_id)
+
+    def get_search_cursor(self, rank: float, adv_id: int) -> str:
+        """
+        Get search list cursor pointing after advertisement with given rank.
+
+        :param rank: float Advertisement search rank.
+        :param adv_id: int Advertisement id.
+        :return: str Opaque cursor.
+        """
+        return encode_cursor([rank, adv_id])
+
+    def parse_search_cursor(self, cursor: str) -> tuple[float, int]:
+        """
+        Parse search list cursor.
+
+        :param cursor: str Opaque cursor, got with get_search_cursor.
+        :return: tuple Advertisement search rank and id, cursor points after.
+        """
+        try:
+            return self._get_search_cursor_values(*decode_cursor(cursor))
+        except (TypeError, ValueError):
+            raise BackendError(message='Invalid cursor.')
+
+    def _get_search_cursor_values(self, rank: float, adv_id: int) -> tuple[float, int]:
+        """Convert decoded search list cursor values."""
+        return float(rank), int(adv_id)
+
+    def get_search_ts_query(self, search_string: str) -> str:
+        """
+        Get tsquery text, matching all search words as lexeme prefixes.
+
+        :param search_string: str Search string.
+        :return: str Text for to_tsquery.
+        """
+        return ' & '.join(
+            '{word}:*'.format(word=word)
+            for word in re.findall(r'\w+', search_string.lower())
+        )
+
+    def get_export_header(self) -> str:
+        """
+        Get advertisement csv export header line.
+
+        :return: str Csv line with AdvOut field names.
+        """
+        return self._get_csv_lines([ADV_OUT_FIELDS])
+
+    def get_export_chunk(self, rows: Sequence, file_format: str) -> str:
+        """
+        Get advertisement export chunk from rows batch.
+
+        Rows are serialized as they are, without AdvOut validation, so rows
+        with null adv_date do not break already started response.
+
+        :param rows: Sequence Advertisement row mappings.
+        :param file_format: str ExportFormat value.
+        :return: str Ndjson or csv lines.
+        """
+        if file_format == ExportFormat.CSV:
+            return self._get_csv_lines([self._get_csv_row(row) for row in rows])
+        ndjson_option = orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE
+        return b''.join(
+            orjson.dumps(dict(row), option=ndjson_option) for row in rows
+        ).decode()
+
+    def _get_csv_row(self, row: Mapping) -> list:
+        """Get csv values of row, dates are formatted like in ndjson."""
+        csv_row = []
+        for field in ADV_OUT_FIELDS:
+            field_value = row[field]
+            if isinstance(field_value, date):
+                field_value = orjson.dumps(field_value, option=orjson.OPT_UTC_Z)
+                field_value = field_value.decode().strip('"')
+            csv_row.append(field_value)
+        return csv_row
+
+    def _get_csv_lines(self, rows: Sequence) -> str:
+        """Get csv lines from sequence of values rows."""
+        csv_buffer = io.StringIO()
+        csv.writer(csv_buffer, lineterminator='\n').writerows(rows)
+        return csv_buffer.getvalue()
+
+    def get_price_distribution(self, rows: Sequence, buckets: int) -> dict:
+        """
+        Get price distribution from price_distribution_statement rows.
+
+        :param rows: Sequence Rows with price bounds, percentiles and bucket counts.
+        :param buckets: int Histogram buckets number.
+        :return: dict Percentiles and zero filled histogram.
+        """
+        first_row = rows[0]
+        percentiles = first_row.percentiles or [None for _ in PRICE_PERCENTILES]
+        distribution: dict = {
+            percentile_name: percentile
+            for (percentile_name, _), percentile in zip(PRICE_PERCENTILES, percentiles)
+        }
+        distribution['histogram'] = []
+        if first_row.min_price is not None:
+            distribution['histogram'] = self._get_price_histogram(rows, buckets)
+        return distribution
+
+    def _get_price_histogram(self, rows: Sequence, buckets: int) -> list[dict]:
+        """Get zero filled price histogram from price_distribution_statement rows."""
+        min_price = rows[0].min_price
+        width = (rows[0].max_price + 1 - min_price) / buckets
+        bucket_counts = {row.bucket: row.adv_count for row in rows}
+        return [
+            {
+                'lower_price': min_price + width * (bucket - 1),
+                'upper_price': min_price + width * bucket,
+                'adv_count': bucket_counts.get(bucket, 0),
+            }
+            for bucket in range(1, buckets + 1)
+        ]
 
 
 adv_auxiliary_func = AdvAuxiliaryFunc()
+adv_stat_cache = VersionedCache(
+    namespace='adv_stat',
+    max_size=Settings.STAT_CACHE_MAX_SIZE,
+    ttl=Settings.STAT_CACHE_TTL,
+    redis_enabled=Settings.CACHE_REDIS_ENABLED,
+)
+adv_conditional_get = ConditionalGet(adv_stat_cache)
@@ -1,42 +1,156 @@
 """Advertisement apps handlers."""
 
-from datetime import datetime
-from typing import Any, Sequence
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Optional, Sequence
 
 from fastapi import Request
-from sqlalchemy import Executable
+from sqlalchemy import Executable, RowMapping
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateTable
 
-from apps.advertisements.adv_utilities import adv_auxiliary_func
+from apps.advertisements.adv_utilities import adv_auxiliary_func, adv_stat_cache
 from apps.advertisements.models import Advertisement
 from apps.advertisements.schemas import (
+    ADV_OUT_FIELDS,
+    AdvExportQuerySchema,
+    AdvFacetQuerySchema,
     AdvInList,
     AdvNameModelQuerySchema,
     AdvPeriodQuerySchema,
+    AdvSearchQuerySchema,
+    AdvTrendQuerySchema,
     CreateAdvIn,
     UrlSchema,
 )
-from apps.advertisements.statements import adv_statements
+from apps.advertisements.statements import adv_stat_statements, adv_statements
+from apps.common.common_types import NameModelPairs, RowBatches
+from apps.common.common_utilities import get_sparse_rows
+from apps.common.db import (
+    REPLICA_READS,
+    async_session_factory,
+    replica_reads,
+    use_primary_after_replica_error,
+)
+from apps.common.enum import AdvFacet, ExportFormat
 from apps.common.orm_services import statement_executor as executor
+from apps.common.schemas import PageQuerySchema
+from settings import Settings
+
+logger = logging.getLogger(__name__)
 
 
 class AdvHandlers:
     """Advertisement handlers."""
 
-    async def get_adv_period_list(
+    @replica_reads
+    async def get_adv_period_page(
         self,
         request: Request,
         session: AsyncSession,
         period: AdvPeriodQuerySchema,
-    ) -> list[Any] | Sequence[list[Any]] | None:
-        """Handle request of getting advertisement period list."""
-        statement: Executable = adv_statements.period_list_statement(period=period)
-        return await executor.execute_return_statement(
-            session,
-            statement,
-            many=True,
+        page: PageQuerySchema,
+        fields: Sequence[str] = ADV_OUT_FIELDS,
+    ) -> tuple[list[dict], str | None]:
+        """Handle request of getting advertisement period list page.
+
+        Return advertisements page, as dicts with given fields, and next page
+        cursor, None for the last page.
+        """
+        after = None
+        if page.cursor:
+            after = adv_auxiliary_func.parse_period_cursor(page.cursor)
+        statement: Executable = adv_statements.period_list_statement(
+            period=period,
+            after=after,
+            limit=page.limit + 1,
+            fields=fields,
+        )
+        advs = await executor.execute_dicts_statement(session, statement)
+        next_cursor = None
+        if len(advs) > page.limit:
+            advs = advs[: page.limit]
+            next_cursor = adv_auxiliary_func.get_period_cursor(
+                advs[-1]['adv_date'],
+                advs[-1]['id'],
+            )
+        return get_sparse_rows(advs, fields), next_cursor
+
+    @replica_reads
+    async def search_adv(
+        self,
+        request: Request,
+        session: AsyncSession,
+        search: AdvSearchQuerySchema,
+        page: PageQuerySchema,
+        fields: Sequence[str] = ADV_OUT_FIELDS,
+    ) -> tuple[list[dict], str | None]:
+        """Handle request of searching advertisements page, ordered by rank.
+
+        Return advertisements page, as dicts with given fields, and next page
+        cursor, None for the last page.
+        """
+        after = None
+        if page.cursor:
+            after = adv_auxiliary_func.parse_search_cursor(page.cursor)
+        statement: Executable = adv_statements.search_statement(
+            search=search,
+            after=after,
+            limit=page.limit + 1,
+            fields=fields,
         )
+        rows = await executor.execute_dicts_statement(session, statement)
+        advs = rows[: page.limit]
+        next_cursor = None
+        if len(rows) > page.limit:
+            next_cursor = adv_auxiliary_func.get_search_cursor(
+                advs[-1]['rank'],
+                advs[-1]['id'],
+            )
+        return get_sparse_rows(advs, fields), next_cursor
+
+    async def stream_adv_period(
+        self,
+        request: Request,
+        period: AdvExportQuerySchema,
+    ) -> AsyncIterator[str]:
+        """Handle request of streaming advertisement period export in batches.
+
+        Own session is used, since request dependencies are closed before
+        streaming response body is sent. If replica fails before the first
+        batch is read, export is restarted on primary. Later failures abort
+        the response, since its rows are already partly sent.
+        """
+        if period.file_format == ExportFormat.CSV:
+            yield adv_auxiliary_func.get_export_header()
+        statement: Executable = adv_statements.period_export_statement(period=period)
+        async with async_session_factory(info={REPLICA_READS: True}) as session:
+            try:
+                batches, rows = await self._start_stream(session, statement)
+            except (DBAPIError, OSError) as error:
+                await use_primary_after_replica_error(session, error)
+                batches, rows = await self._start_stream(session, statement)
+            while rows:
+                yield adv_auxiliary_func.get_export_chunk(rows, period.file_format)
+                rows = await anext(batches, [])
+
+    async def _start_stream(
+        self,
+        session: AsyncSession,
+        statement: Executable,
+    ) -> tuple[RowBatches, Sequence[RowMapping]]:
+        """Start streaming statement in batches, return batches and first one."""
+        batches = aiter(
+            executor.stream_mapping_statement(
+                session,
+                statement,
+                Settings.EXPORT_BATCH_SIZE,
+            ),
+        )
+        return batches, await anext(batches, [])
 
     async def get_name_model_stat(
         self,
@@ -47,69 +161,446 @@ class AdvHandlers:
         """
         Handle request of getting name and model statistics.
 
-        Statistics concerning min/max price and number/period.
+        Statistics concerning min/max price and number/period. Result is cached
+        until advertisements data changes.
         """
-        statement: Executable = adv_statements.name_model_stat_statement(
-            car_info=car_info,
+
+        async def get_stat_data() -> dict:  # noqa: WPS430
+            """Get statistics from rollup."""
+            statement: Executable = adv_stat_statements.name_model_stat_statement(
+                car_info=car_info,
+                stat_dates=adv_auxiliary_func.get_stat_dates(),
+            )
+            stat_row = await executor.execute_mapping_statement(session, statement)
+            return dict(stat_row)
+
+        return await adv_stat_cache.get_or_create(
+            adv_auxiliary_func.get_stat_cache_key(car_info),
+            get_stat_data,
         )
-        advs = await executor.execute_fetchmany_statement(
-            session,
-            statement,
+
+    async def get_price_distribution(
+        self,
+        request: Request,
+        session: AsyncSession,
+        car_info: AdvNameModelQuerySchema,
+    ) -> dict:
+        """
+        Handle request of getting name and model price distribution.
+
+        Result is cached until advertisements data changes.
+        """
+
+        async def get_distribution_data() -> dict:  # noqa: WPS430
+            """Get price percentiles and histogram."""
+            statement: Executable = adv_statements.price_distribution_statement(
+                car_info=car_info,
+                buckets=Settings.PRICE_HISTOGRAM_BUCKETS,
+            )
+            rows = await executor.execute_fetchall_statement(session, statement)
+            return adv_auxiliary_func.get_price_distribution(
+                rows,
+                Settings.PRICE_HISTOGRAM_BUCKETS,
+            )
+
+        return await adv_stat_cache.get_or_create(
+            adv_auxiliary_func.get_stat_cache_key(car_info, 'price_distribution'),
+            get_distribution_data,
         )
-        stat_data = adv_auxiliary_func.get_statistical_info(advs)
-        return stat_data.__dict__
+
+    @replica_reads
+    async def get_price_trend(
+        self,
+        request: Request,
+        session: AsyncSession,
+        trend_info: AdvTrendQuerySchema,
+    ) -> list[dict]:
+        """Handle request of getting name and model price time series."""
+        statement: Executable = adv_statements.price_trend_statement(
+            trend_info=trend_info,
+        )
+        rows = await executor.execute_fetchall_statement(session, statement)
+        return [row._asdict() for row in rows]
+
+    @replica_reads
+    async def get_facets(
+        self,
+        request: Request,
+        session: AsyncSession,
+        facet_info: AdvFacetQuerySchema,
+        facets: Sequence[AdvFacet],
+    ) -> dict[str, list[dict]]:
+        """Handle request of getting top values counts of requested facets."""
+        facets = list(dict.fromkeys(facets))
+        statement: Executable = adv_statements.facet_statement(
+            facet_info=facet_info,
+            facets=facets,
+        )
+        rows = await executor.execute_fetchall_statement(session, statement)
+        facet_counts: dict[str, list[dict]] = {facet.value: [] for facet in facets}
+        for row in rows:
+            facet_counts[row.facet].append(
+                {'value': row.value, 'adv_count': row.adv_count},
+            )
+        return facet_counts
 
     async def bulk_create_adv(
         self,
         request: Request,
         session: AsyncSession,
         advs: AdvInList,
+        returning: bool = False,
+    ) -> Sequence[Advertisement] | None:
+        """Create many advertisements.
+
+        Without returning, advertisements are upserted by url through COPY,
+        much faster and without materializing created rows.
+        """
+        if returning:
+            statement: Executable = adv_statements.create_many_statement(advs)
+            created_advs: Sequence[Advertisement] = (
+                await executor.execute_return_statement(  # type: ignore
+                    session,
+                    statement,
+                    many=True,
+                )
+            )
+            await self.add_stat(session, [adv.id for adv in created_advs], commit=True)
+            return created_advs
+        await self.upsert_advs(session, advs.item_list, commit=True)
+        return None
+
+    async def upsert_advs(
+        self,
+        session: AsyncSession,
+        advs: Sequence[CreateAdvIn],
+        commit: bool = False,
+    ) -> None:
+        """Insert advertisements or update changed ones, found by normalized url.
+
+        Advertisements are copied to temporary staging table and upserted from it.
+        """
+        await self._copy_to_staging(session, advs)
+        previous_pairs = await executor.execute_fetchall_statement(
+            session,
+            adv_statements.staging_stat_pairs_statement(),
+        )
+        changed_pairs = await executor.execute_fetchall_statement(
+            session,
+            adv_statements.upsert_staging_statement(),
+        )
+        await executor.execute_statement(
+            session,
+            adv_statements.touch_staging_statement(),
+        )
+        await self.refresh_stat(
+            session,
+            list({*previous_pairs, *changed_pairs}),
+            commit=commit,
+        )
+
+    async def _copy_to_staging(
+        self,
+        session: AsyncSession,
+        advs: Sequence[CreateAdvIn],
     ) -> None:
-        """Create many advertisements."""
-        statement: Executable = adv_statements.create_many_statement(advs)
-        await executor.execute_return_statement(
+        """Take upsert lock and copy advertisements to temporary staging table."""
+        await executor.execute_statement(
             session,
-            statement,
-            commit=True,
-            many=True,
+            adv_statements.upsert_lock_statement(),
+        )
+        await executor.execute_statement(
+            session,
+            CreateTable(adv_statements.staging_table),
+        )
+        columns = adv_statements.upsert_columns
+        await executor.execute_copy_records(
+            session,
+            adv_statements.staging_table.name,
+            columns,
+            [tuple(getattr(adv, col) for col in columns) for adv in advs],
         )
 
-    def create_adv(
+    def upsert_adv(
         self,
         session: Session,
         adv: CreateAdvIn,
     ) -> None:
-        """Create single advertisement."""
-        statement: Executable = adv_statements.create_statement(schema=adv)
-        executor.sync_execute_return_statement(session, statement, commit=True)
+        """Insert single advertisement or update its changed fields, found by url."""
+        executor.sync_execute_statement(session, adv_statements.upsert_lock_statement())
+        previous_pairs = executor.sync_execute_fetchall_statement(
+            session,
+            adv_statements.url_stat_pairs_statement([adv.url]),
+        )
+        changed_pairs = executor.sync_execute_fetchall_statement(
+            session,
+            adv_statements.upsert_statement([adv]),
+        )
+        executor.sync_execute_statement(
+            session,
+            adv_statements.touch_statement([adv.url]),
+        )
+        if changed_pairs:
+            self.sync_refresh_stat(
+                session,
+                list({*previous_pairs, *changed_pairs}),
+                commit=True,
+            )
+            return
+        session.commit()
 
     def delete_old_adv(
         self,
         session: Session,
         old_date: datetime,
+        chunk_size: Optional[int] = None,
+        chunk_sleep: float = 0,
+        max_chunks: Optional[int] = None,
+    ) -> dict:
+        """Delete advertisements, last seen before old_date.
+
+        Whole daily partitions before old_date UTC day without rows seen since
+        old_date are dropped. Other old rows are deleted at once or, with
+        chunk_size given, in chunks ordered by id, each committed and followed
+        by chunk_sleep seconds pause. With max_chunks given, deletion stops
+        after that number of full chunks. Return number of deleted rows,
+        duration, rows per second and whether deletion is completed.
+        """
+        start_time = time.monotonic()
+        deleted_count = self._drop_old_partitions(session, old_date)
+        after_id = None
+        chunk_number = 0
+        while True:  # noqa: WPS457
+            chunk_count, after_id = self._delete_old_chunk(
+                session,
+                old_date,
+                after_id,
+                chunk_size,
+            )
+            deleted_count += chunk_count
+            if chunk_size is None or chunk_count < chunk_size:
+                break
+            chunk_number += 1
+            if chunk_number == max_chunks:
+                return self._get_delete_report(
+                    deleted_count,
+                    start_time,
+                    completed=False,
+                )
+            logger.info(
+                'Deleted %s old advertisements, %s rows per second.',
+                deleted_count,
+                self._get_delete_report(deleted_count, start_time)['rows_per_second'],
+            )
+            time.sleep(chunk_sleep)
+        return self._get_delete_report(deleted_count, start_time)
+
+    def _delete_old_chunk(
+        self,
+        session: Session,
+        old_date: datetime,
+        after_id: Optional[int],
+        chunk_size: Optional[int],
+    ) -> tuple[int, Optional[int]]:
+        """Delete chunk of advertisements, last seen before old_date, after id.
+
+        Deletion is committed. Return number of deleted rows and max deleted id.
+        """
+        statement: Executable = adv_statements.delete_old_statement(
+            old_date=old_date,
+            after_id=after_id,
+            chunk_size=chunk_size,
+        )
+        deleted_rows = executor.sync_execute_fetchall_statement(session, statement)
+        self._commit_deleted(session, {(row.name, row.model) for row in deleted_rows})
+        return (
+            sum(row.adv_count for row in deleted_rows),
+            max((row.max_id for row in deleted_rows), default=None),
+        )
+
+    def _drop_old_partitions(self, session: Session, old_date: datetime) -> int:
+        """Drop daily partitions before old_date UTC day, return their rows number.
+
+        Partitions with rows seen since old_date are kept. Partition is locked
+        before checking, so upsert can't mark its rows as seen before drop.
+        """
+        executor.sync_execute_statement(
+            session,
+            adv_statements.lock_timeout_statement(Settings.ADV_PARTITION_LOCK_TIMEOUT),
+        )
+        partition_rows = executor.sync_execute_fetchall_statement(
+            session,
+            adv_statements.old_partitions_statement(
+                old_date.astimezone(timezone.utc).date(),
+            ),
+        )
+        pairs: set = set()
+        deleted_count = sum(
+            self._drop_old_partition(
+                session,
+                partition_row.partition_name,
+                old_date,
+                pairs,
+            )
+            for partition_row in partition_rows
+        )
+        self._commit_deleted(session, pairs)
+        return deleted_count
+
+    def _drop_old_partition(
+        self,
+        session: Session,
+        partition_name: str,
+        old_date: datetime,
+        pairs: set,
+    ) -> int:
+        """Lock and drop partition without rows seen since old_date.
+
+        Name/model pairs of dropped rows are added to pairs. Return number of
+        dropped rows.
+        """
+        executor.sync_execute_statement(
+            session,
+            adv_statements.lock_partition_statement(partition_name),
+        )
+        if executor.sync_execute_fetchall_statement(
+            session,
+            adv_statements.partition_seen_statement(partition_name, old_date),
+        ):
+            return 0
+        stat_rows = executor.sync_execute_fetchall_statement(
+            session,
+            adv_statements.partition_stat_pairs_statement(partition_name),
+        )
+        pairs.update((row.name, row.model) for row in stat_rows)
+        executor.sync_execute_statement(
+            session,
+            adv_statements.drop_partition_statement(partition_name),
+        )
+        return sum(row.adv_count for row in stat_rows)
+
+    def _commit_deleted(self, session: Session, pairs: set) -> None:
+        """Commit deletion, recomputing statistics of deleted name/model pairs.
+
+        Without deleted rows statistics and cache are left as they are.
+        """
+        if pairs:
+            self.sync_refresh_stat(session, list(pairs), commit=True)
+            return
+        session.commit()
+
+    def _get_delete_report(
+        self,
+        deleted_count: int,
+        start_time: float,
+        completed: bool = True,
+    ) -> dict:
+        """Get number of deleted rows, duration, rows per second and completion."""
+        duration = time.monotonic() - start_time
+        return {
+            'deleted_count': deleted_count,
+            'duration': round(duration, 3),
+            'rows_per_second': round(deleted_count / duration, 1) if duration else 0,
+            'completed': completed,
+        }
+
+    def create_partitions(
+        self,
+        session: Session,
+        days_ahead: int,
+    ) -> None:
+        """Create missing daily partitions from today UTC for days ahead.
+
+        Rows of default partition, belonging to created partition, are moved
+        to it. Partition, failed to be created, is skipped with db warning.
+        """
+        today = datetime.now(timezone.utc).date()
+        statement: Executable = adv_statements.create_partitions_statement(
+            today,
+            today + timedelta(days=days_ahead),
+        )
+        executor.sync_execute_statement(session, statement, commit=True)
+
+    async def get_stat_pairs(
+        self,
+        session: AsyncSession,
+        adv_ids: Sequence[int],
+    ) -> NameModelPairs:
+        """Get lowered name/model pairs of advertisements with given ids."""
+        statement: Executable = adv_statements.stat_pairs_statement(adv_ids)
+        return await executor.execute_fetchall_statement(session, statement)
+
+    async def add_stat(
+        self,
+        session: AsyncSession,
+        adv_ids: Sequence[int],
+        commit: bool = False,
+    ) -> None:
+        """Add advertisements with given ids to statistics rollup.
+
+        Statistics cache is invalidated, if changes are committed.
+        """
+        statement: Executable = adv_stat_statements.add_stat_statement(adv_ids)
+        await executor.execute_statement(session, statement, commit=commit)
+        if commit:
+            await adv_stat_cache.invalidate()
+
+    async def refresh_stat(
+        self,
+        session: AsyncSession,
+        pairs: NameModelPairs,
+        commit: bool = False,
     ) -> None:
-        """Delete advertisements, older than argument."""
-        statement: Executable = adv_statements.delete_old_statement(old_date=old_date)
-        executor.sync_execute_delete_statement(session, statement)
+        """Recompute statistics rollup for given lowered name/model pairs.
 
+        Statistics cache is invalidated, if changes are committed.
+        """
+        await executor.execute_statement(
+            session,
+            adv_stat_statements.clear_stat_statement(pairs),
+        )
+        await executor.execute_statement(
+            session,
+            adv_stat_statements.fill_stat_statement(pairs),
+            commit=commit,
+        )
+        if commit:
+            await adv_stat_cache.invalidate()
+
+    def sync_refresh_stat(
+        self,
+        session: Session,
+        pairs: Optional[NameModelPairs] = None,
+        commit: bool = False,
+    ) -> None:
+        """Recompute statistics rollup for given name/model pairs or whole one.
+
+        Statistics cache is invalidated, if changes are committed.
+        """
+        executor.sync_execute_statement(
+            session,
+            adv_stat_statements.clear_stat_statement(pairs),
+        )
+        executor.sync_execute_statement(
+            session,
+            adv_stat_statements.fill_stat_statement(pairs),
+            commit=commit,
+        )
+        if commit:
+            adv_stat_cache.sync_invalidate()
+
+    @replica_reads
     async def get_adv_by_url(
         self,
         request: Request,
         session: AsyncSession,
         url: UrlSchema,
-    ) -> Any:
-        """Get advertisement by url."""
-        statement: Executable = adv_statements.get_adv_by_url_statement(url)
-        advertisements: Advertisement | Sequence[Advertisement] | None = (
-            await executor.execute_return_statement(
-                session,
-                statement,
-                many=True,
-            )
-        )
-        if advertisements:
-            return advertisements[0]
-        return None
+        fields: Sequence[str] = ADV_OUT_FIELDS,
+    ) -> Optional[dict]:
+        """Get advertisement by url, as dict with given fields, or None."""
+        statement: Executable = adv_statements.get_adv_by_url_statement(url, fields)
+        advs = await executor.execute_dicts_statement(session, statement)
+        return next(iter(advs), None)
 
 
 adv_handlers = AdvHandlers()
@@ -1,6 +1,17 @@
 """Advertisement apps models."""
 
-from sqlalchemy import Column, Date, Integer, String, func
+from sqlalchemy import (
+    Column,
+    Computed,
+    Date,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 
 from apps.common.common_utilities import AwareDateTime
 from apps.common.db import Base
@@ -10,9 +21,31 @@ class Advertisement(Base):
     """Advertisement model."""
 
     __tablename__ = 'advertisement'
+    __table_args__ = {'postgresql_partition_by': 'RANGE (created_at)'}
 
-    id = Column(Integer, primary_key=True, nullable=False)
+    id = Column(Integer, primary_key=True, autoincrement=True, nullable=False)
     url = Column(String(255), nullable=False)
+    url_slug = Column(
+        String(255),
+        Computed("substring(rtrim(url, '/') from '[^/]*$')", persisted=True),
+        nullable=False,
+    )
+    url_key = Column(
+        String(255),
+        Computed('advertisement_url_key(url)', persisted=True),
+        nullable=False,
+    )
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "to_tsvector('simple', name || ' ' || model || ' ' || region"
+                " || ' ' || coalesce(color, '') || ' ' || seller)",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
     name = Column(String(100), nullable=False)
     price = Column(Integer, nullable=False)
     model = Column(String(100), nullable=False)
@@ -22,7 +55,13 @@ class Advertisement(Base):
     salon = Column(String(50))
     seller = Column(String(255), nullable=False)
     adv_date = Column(Date, default=func.now(), nullable=True)
-    created_at = Column(AwareDateTime, default=func.now(), nullable=False)
+    created_at = Column(
+        AwareDateTime,
+        default=func.now(),
+        primary_key=True,
+        nullable=False,
+    )
+    last_seen_at = Column(AwareDateTime, default=func.now(), nullable=False)
 
     def __repr__(self) -> str:
         """Represent class instance."""
@@ -48,3 +87,77 @@ class Advertisement(Base):
                 ),
             ),
         )
+
+
+Index(
+    'advertisement_lower_name_lower_model_idx',
+    func.lower(Advertisement.name),
+    func.lower(Advertisement.model),
+)
+Index(
+    'advertisement_adv_date_id_idx',
+    Advertisement.adv_date.asc().nulls_first(),
+    Advertisement.id,
+)
+Index('advertisement_lower_model_idx', func.lower(Advertisement.model))
+Index(
+    'advertisement_created_at_brin_idx',
+    Advertisement.created_at,
+    postgresql_using='brin',
+)
+Index('advertisement_url_slug_idx', Advertisement.url_slug)
+Index('advertisement_last_seen_at_idx', Advertisement.last_seen_at)
+Index(
+    'advertisement_search_vector_idx',
+    Advertisement.search_vector,
+    postgresql_using='gin',
+)
+Index(
+    'advertisement_url_key_key',
+    Advertisement.url_key,
+    Advertisement.created_at,
+    unique=True,
+)
+
+
+class AdvertisementStat(Base):
+    """Advertisement daily statistics rollup per lowered car name and model."""
+
+    __tablename__ = 'advertisement_stat'
+    __table_args__ = (
+        UniqueConstraint(
+            'name',
+            'model',
+            'adv_date',
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    name = Column(String(100), nullable=False)
+    model = Column(String(100), nullable=False)
+    adv_date = Column(Date, nullable=True)
+    adv_count = Column(Integer, nullable=False)
+    min_price = Column(Integer, nullable=False)
+    max_price = Column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        """Represent class instance."""
+        return ''.join(
+            (
+                '{cname}(id={id}, name={name}, model={model}, '.format(
+                    cname=self.__class__.__name__,
+                    id=self.id,
+                    name=self.name,
+                    model=self.model,
+                ),
+                'adv_date={adv_date}, adv_count={adv_count}, '.format(
+                    adv_date=self.adv_date,
+                    adv_count=self.adv_count,
+                ),
+                'min_price={min_price}, max_price={max_price})'.format(
+                    min_price=self.min_price,
+                    max_price=self.max_price,
+                ),
+            ),
+        )
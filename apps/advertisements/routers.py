@@ -1,31 +1,90 @@
 """Advertisement apps routers."""
 
-from typing import Annotated
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from apps.advertisements.adv_utilities import adv_conditional_get, adv_stat_cache
 from apps.advertisements.handlers import adv_handlers
 from apps.advertisements.models import Advertisement
 from apps.advertisements.schemas import (
+    ADV_FACETS,
+    ADV_OUT_FIELDS,
+    AdvDeleteOldOutSchema,
+    AdvDeleteOldQuerySchema,
+    AdvExportQuerySchema,
+    AdvFacetQuerySchema,
+    AdvFacetValueOutSchema,
+    AdvFieldsOut,
     AdvInList,
     AdvNameModelQuerySchema,
     AdvOut,
     AdvPeriodQuerySchema,
+    AdvPriceDistributionOutSchema,
+    AdvSearchQuerySchema,
     AdvStatOutSchema,
+    AdvTrendOutSchema,
+    AdvTrendQuerySchema,
     CreateAdvIn,
     UrlSchema,
 )
 from apps.common.base_routers import BaseRouterInitializer
-from apps.common.dependencies import get_async_session
-from apps.common.enum import JSENDStatus
-from apps.common.schemas import JSENDFailOutSchema, JSENDOutSchema
+from apps.common.common_utilities import get_sparse_fields
+from apps.common.dependencies import get_async_session, get_session
+from apps.common.enum import AdvFacet, ExportFormat, JSENDStatus
+from apps.common.responses import JSENDResponse, ResponseValidators, get_jsend_response
+from apps.common.schemas import (
+    FieldsQuerySchema,
+    JSENDFailOutSchema,
+    JSENDOutSchema,
+    JSENDPageOutSchema,
+    PageQuerySchema,
+)
 from apps.common.user_dependencies import get_current_admin_user, get_current_user
 from apps.user.models import User
+from settings import Settings
 
 adv_router = APIRouter()
 
-admin_adv_router_initializer = BaseRouterInitializer(  # type: ignore
+
+class AdvRouterInitializer(BaseRouterInitializer):
+    """Admin advertisement router initializer, keeping statistics rollup in sync."""
+
+    async def before_write(
+        self,
+        session: AsyncSession,
+        instance_id: int | None,
+    ) -> Any:
+        """Get name/model pairs of advertisement before its update or deletion."""
+        if instance_id is None:
+            return None
+        return await adv_handlers.get_stat_pairs(session, [instance_id])
+
+    async def after_write(
+        self,
+        session: AsyncSession,
+        previous: Any,
+        instance: Any,
+    ) -> None:
+        """Add created advertisement to rollup or recompute changed pairs."""
+        if previous is None:
+            await adv_handlers.add_stat(session, [instance.id])
+            return
+        pairs = list(previous)
+        if instance is not None:
+            pairs.extend(await adv_handlers.get_stat_pairs(session, [instance.id]))
+        await adv_handlers.refresh_stat(session, pairs)
+
+    async def after_commit(self) -> None:
+        """Invalidate advertisement statistics cache."""
+        await adv_stat_cache.invalidate()
+
+
+admin_adv_router_initializer = AdvRouterInitializer(  # type: ignore
     router=adv_router,
     in_schemas=(CreateAdvIn, CreateAdvIn, CreateAdvIn),
     out_schema=AdvOut,
@@ -38,8 +97,8 @@ admin_adv_router_initializer.initialize_routers()
 @adv_router.get(
     '/list/advertisement/period/',
     name='adv_period',
-    response_model=JSENDOutSchema[AdvOut],
-    summary='Get advertisement list by given period.',
+    response_model=JSENDPageOutSchema[AdvFieldsOut],
+    summary='Get advertisement list page by given period.',
     responses={
         200: {'description': 'Successfully get advertisement list by period'},
         422: {'model': JSENDFailOutSchema, 'description': 'ValidationError'},
@@ -51,19 +110,115 @@ async def get_advertisement_by_period(
     user: Annotated[User, Depends(get_current_user)],
     session: Annotated[AsyncSession, Depends(get_async_session)],
     period: Annotated[AdvPeriodQuerySchema, Depends()],
-) -> dict:
-    """Get advertisement list by period."""
-    return {
-        'data': await adv_handlers.get_adv_period_list(request, session, period),
-        'message': ''.join(
-            (
-                'Get advertisements list with begin - {begin}'.format(
-                    begin=period.begin,
+    page: Annotated[PageQuerySchema, Depends()],
+    fieldset: Annotated[FieldsQuerySchema, Depends()],
+    validators: Annotated[ResponseValidators, Depends(adv_conditional_get)],
+) -> Response:
+    """Get advertisement list page by period, ordered by adv_date and id.
+
+    Pass next_cursor of response as cursor to get the next page, comma
+    separated fields to get only them.
+    """
+    if validators.not_modified:
+        return validators.get_not_modified_response()
+    advs, next_cursor = await adv_handlers.get_adv_period_page(
+        request,
+        session,
+        period,
+        page,
+        get_sparse_fields(fieldset.fields, AdvOut.model_fields) or ADV_OUT_FIELDS,
+    )
+    return validators.set_headers(
+        get_jsend_response(
+            advs,
+            ''.join(
+                (
+                    'Get advertisements list with begin - {begin}'.format(
+                        begin=period.begin,
+                    ),
+                    ' and end - {end} period'.format(end=period.end),
                 ),
-                ' and end - {end} period'.format(end=period.end),
             ),
+            next_cursor=next_cursor,
         ),
-    }
+    )
+
+
+@adv_router.get(
+    '/list/advertisement/search/',
+    name='adv_search',
+    response_model=JSENDPageOutSchema[AdvFieldsOut],
+    summary='Search advertisements by words in name, model, region, color, seller.',
+    responses={
+        200: {'description': 'Successfully searched advertisements'},
+        422: {'model': JSENDFailOutSchema, 'description': 'ValidationError'},
+    },
+    tags=['Advertisements application'],
+)
+async def search_advertisement(
+    request: Request,
+    user: Annotated[User, Depends(get_current_user)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    search: Annotated[AdvSearchQuerySchema, Depends()],
+    page: Annotated[PageQuerySchema, Depends()],
+    fieldset: Annotated[FieldsQuerySchema, Depends()],
+    validators: Annotated[ResponseValidators, Depends(adv_conditional_get)],
+) -> Response:
+    """Search advertisements page, ordered by search rank and id.
+
+    Each search word matches as word beginning. Pass next_cursor of response
+    as cursor to get the next page, comma separated fields to get only them.
+    """
+    if validators.not_modified:
+        return validators.get_not_modified_response()
+    advs, next_cursor = await adv_handlers.search_adv(
+        request,
+        session,
+        search,
+        page,
+        get_sparse_fields(fieldset.fields, AdvOut.model_fields) or ADV_OUT_FIELDS,
+    )
+    return validators.set_headers(
+        get_jsend_response(
+            advs,
+            'Search advertisements with words: {q}'.format(q=search.q),
+            next_cursor=next_cursor,
+        ),
+    )
+
+
+@adv_router.get(
+    '/list/advertisement/period/export/',
+    name='adv_period_export',
+    response_class=StreamingResponse,
+    summary='Export advertisement list by given period as ndjson or csv.',
+    responses={
+        200: {
+            'description': 'Successfully streamed advertisement list by period',
+            'content': {'application/x-ndjson': {}, 'text/csv': {}},
+        },
+        422: {'model': JSENDFailOutSchema, 'description': 'ValidationError'},
+    },
+    tags=['Advertisements application'],
+)
+async def export_advertisement_by_period(
+    request: Request,
+    user: Annotated[User, Depends(get_current_user)],
+    period: Annotated[AdvExportQuerySchema, Depends()],
+) -> StreamingResponse:
+    """Stream advertisement list by period, ordered by adv_date and id, in batches."""
+    if period.file_format == ExportFormat.CSV:
+        return StreamingResponse(
+            adv_handlers.stream_adv_period(request, period),
+            media_type='text/csv',
+            headers={
+                'Content-Disposition': 'attachment; filename="advertisements.csv"',
+            },
+        )
+    return StreamingResponse(
+        adv_handlers.stream_adv_period(request, period),
+        media_type='application/x-ndjson',
+    )
 
 
 @adv_router.get(
@@ -80,10 +235,15 @@ async def get_advertisement_by_period(
 async def get_advertisement_stat(
     request: Request,
     user: Annotated[User, Depends(get_current_user)],
+    response: Response,
+    validators: Annotated[ResponseValidators, Depends(adv_conditional_get)],
     session: Annotated[AsyncSession, Depends(get_async_session)],
     car_info: Annotated[AdvNameModelQuerySchema, Depends()],
-) -> dict:
+) -> Response | dict:
     """Get advertisements stat info concerning max/min price and number/period."""
+    if validators.not_modified:
+        return validators.get_not_modified_response()
+    validators.set_headers(response)
     return {
         'data': await adv_handlers.get_name_model_stat(request, session, car_info),
         'message': ''.join(
@@ -98,6 +258,120 @@ async def get_advertisement_stat(
     }
 
 
+@adv_router.get(
+    '/list/advertisement/stat/price/',
+    name='adv_price_stat',
+    response_model=JSENDOutSchema[AdvPriceDistributionOutSchema],
+    summary='Get price percentiles and histogram of given model.',
+    responses={
+        200: {'description': 'Successfully get advertisement price distribution'},
+        422: {'model': JSENDFailOutSchema, 'description': 'ValidationError'},
+    },
+    tags=['Advertisements application'],
+)
+async def get_advertisement_price_stat(
+    request: Request,
+    user: Annotated[User, Depends(get_current_user)],
+    response: Response,
+    validators: Annotated[ResponseValidators, Depends(adv_conditional_get)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    car_info: Annotated[AdvNameModelQuerySchema, Depends()],
+) -> Response | dict:
+    """Get advertisements price percentiles and fixed-bucket price histogram."""
+    if validators.not_modified:
+        return validators.get_not_modified_response()
+    validators.set_headers(response)
+    return {
+        'data': await adv_handlers.get_price_distribution(request, session, car_info),
+        'message': ''.join(
+            (
+                'Get price distribution for advertisement with car ',
+                'name: {name} and model: {model}'.format(
+                    name=car_info.name,
+                    model=car_info.model,
+                ),
+            ),
+        ),
+    }
+
+
+@adv_router.get(
+    '/list/advertisement/stat/trend/',
+    name='adv_trend_stat',
+    response_model=JSENDOutSchema[AdvTrendOutSchema],
+    summary='Get price time series of given model by day, week or month.',
+    responses={
+        200: {'description': 'Successfully get advertisement price trend'},
+        422: {'model': JSENDFailOutSchema, 'description': 'ValidationError'},
+    },
+    tags=['Advertisements application'],
+)
+async def get_advertisement_trend_stat(
+    request: Request,
+    user: Annotated[User, Depends(get_current_user)],
+    response: Response,
+    validators: Annotated[ResponseValidators, Depends(adv_conditional_get)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    trend_info: Annotated[AdvTrendQuerySchema, Depends()],
+) -> Response | dict:
+    """Get advertisements count and avg/median/min/max price per time bucket."""
+    if validators.not_modified:
+        return validators.get_not_modified_response()
+    validators.set_headers(response)
+    return {
+        'data': await adv_handlers.get_price_trend(request, session, trend_info),
+        'message': ''.join(
+            (
+                'Get {interval} price trend for advertisement with car '.format(
+                    interval=trend_info.interval,
+                ),
+                'name: {name} and model: {model}'.format(
+                    name=trend_info.name,
+                    model=trend_info.model,
+                ),
+            ),
+        ),
+    }
+
+
+@adv_router.get(
+    '/list/advertisement/stat/facets/',
+    name='adv_facet_stat',
+    response_model=JSENDOutSchema[dict[str, list[AdvFacetValueOutSchema]]],
+    summary='Get top values counts of region, color, salon and model facets.',
+    responses={
+        200: {'description': 'Successfully get advertisement facet counts'},
+        422: {'model': JSENDFailOutSchema, 'description': 'ValidationError'},
+    },
+    tags=['Advertisements application'],
+)
+async def get_advertisement_facet_stat(
+    request: Request,
+    user: Annotated[User, Depends(get_current_user)],
+    response: Response,
+    validators: Annotated[ResponseValidators, Depends(adv_conditional_get)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    facet_info: Annotated[AdvFacetQuerySchema, Depends()],
+    facets: Annotated[list[AdvFacet], Query()] = ADV_FACETS,
+) -> Response | dict:
+    """Get advertisements number per top values of each requested facet."""
+    if validators.not_modified:
+        return validators.get_not_modified_response()
+    validators.set_headers(response)
+    return {
+        'data': await adv_handlers.get_facets(request, session, facet_info, facets),
+        'message': ''.join(
+            (
+                'Get facet counts for advertisement with car ',
+                'name: {name} and model: {model}'.format(
+                    name=facet_info.name,
+                    model=facet_info.model,
+                ),
+            ),
+        ),
+    }
+
+
 @adv_router.post(
     '/admin/list/advertisement/',
     name='bulk_create',
@@ -123,10 +397,48 @@ async def bulk_create_adv(
     }
 
 
+@adv_router.delete(
+    '/admin/list/advertisement/old/',
+    name='delete_old_adv',
+    response_model=JSENDOutSchema[AdvDeleteOldOutSchema],
+    summary='Delete old advertisements in chunks.',
+    responses={
+        200: {'description': 'Successfully deleted old advertisements.'},
+        422: {'model': JSENDFailOutSchema, 'description': 'ValidationError'},
+    },
+    tags=['Admin advertisements application'],
+)
+def delete_old_adv(
+    request: Request,
+    user: Annotated[User, Depends(get_current_admin_user)],
+    session: Annotated[Session, Depends(get_session)],
+    delete_info: Annotated[AdvDeleteOldQuerySchema, Depends()],
+) -> dict:
+    """Delete advertisements, last seen before given number of days ago.
+
+    Runs in threadpool, since chunks are deleted with pauses between them.
+    Request deletes at most ADV_DELETE_REQUEST_MAX_CHUNKS chunks, so it
+    doesn't hold threadpool worker for whole deletion, the rest is deleted
+    by next requests or clean_db task.
+    """
+    return {
+        'data': adv_handlers.delete_old_adv(
+            session,
+            datetime.now(timezone.utc) - timedelta(days=delete_info.days),
+            chunk_size=delete_info.chunk_size,
+            chunk_sleep=delete_info.chunk_sleep,
+            max_chunks=Settings.ADV_DELETE_REQUEST_MAX_CHUNKS,
+        ),
+        'message': (
+            'Successfully deleted advertisements, older than {days} days.'
+        ).format(days=delete_info.days),
+    }
+
+
 @adv_router.get(
     '/advertisement/{url}/',
     name='get_adv_by_url',
-    response_model=JSENDOutSchema[AdvOut],
+    response_model=JSENDOutSchema[AdvFieldsOut],
     summary='Get advertisement by url.',
     responses={
         200: {'description': 'Successfully created many advertisement.'},
@@ -139,16 +451,20 @@ async def get_adv_by_url(
     url: Annotated[UrlSchema, Depends()],
     user: Annotated[User, Depends(get_current_user)],
     session: Annotated[AsyncSession, Depends(get_async_session)],
-) -> dict:
-    """Get advertisement by its url."""
-    advertisement = await adv_handlers.get_adv_by_url(request, session, url)
+    fieldset: Annotated[FieldsQuerySchema, Depends()],
+) -> JSENDResponse | dict:
+    """Get advertisement by its url, only comma separated fields if given."""
+    advertisement = await adv_handlers.get_adv_by_url(
+        request,
+        session,
+        url,
+        get_sparse_fields(fieldset.fields, AdvOut.model_fields) or ADV_OUT_FIELDS,
+    )
     if advertisement:
-        return {
-            'data': advertisement,
-            'message': 'Successfully get advertisement by url path: {url}'.format(
-                url=url,
-            ),
-        }
+        return get_jsend_response(
+            advertisement,
+            'Successfully get advertisement by url path: {url}'.format(url=url),
+        )
     return {
         'data': advertisement,
         'message': 'Nothing was found with url path: {url}'.format(url=url),
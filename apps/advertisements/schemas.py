@@ -1,11 +1,14 @@
 """Advertisement apps schemas."""
 
+import re
 from datetime import date, datetime
 
 from pydantic import Field, field_validator
 from typing_extensions import Annotated
 
-from apps.common.schemas import BaseInSchema, BaseOutSchema
+from apps.common.enum import AdvFacet, ExportFormat, TrendInterval
+from apps.common.schemas import BaseInSchema, BaseOutSchema, get_fields_out_schema
+from settings import Settings
 
 
 class CreateAdvIn(BaseInSchema):
@@ -126,6 +129,11 @@ class AdvOut(BaseOutSchema):
     created_at: Annotated[datetime, Field(description='Field creation datetime')]
 
 
+AdvFieldsOut = get_fields_out_schema(AdvOut)
+ADV_OUT_FIELDS = tuple(AdvOut.model_fields)
+ADV_FACETS = list(AdvFacet)
+
+
 class AdvPeriodQuerySchema(BaseInSchema):
     """Schema for period query string."""
 
@@ -147,6 +155,15 @@ class AdvPeriodQuerySchema(BaseInSchema):
         return datetime.strptime(date_value, '%Y-%m-%d').date()
 
 
+class AdvExportQuerySchema(AdvPeriodQuerySchema):
+    """Schema for period export query string."""
+
+    file_format: Annotated[
+        ExportFormat,
+        Field(examples=['ndjson'], description='Export file format.'),
+    ] = ExportFormat.NDJSON
+
+
 class AdvNameModelQuerySchema(BaseInSchema):
     """Schema for name and/or model statistic."""
 
@@ -160,6 +177,42 @@ class AdvNameModelQuerySchema(BaseInSchema):
     ]
 
 
+class AdvTrendQuerySchema(AdvNameModelQuerySchema, AdvPeriodQuerySchema):
+    """Schema for name and/or model price trend in given period."""
+
+    interval: Annotated[
+        TrendInterval,
+        Field(examples=['week'], description='Time series bucket interval.'),
+    ] = TrendInterval.DAY
+
+
+class AdvFacetQuerySchema(AdvNameModelQuerySchema, AdvPeriodQuerySchema):
+    """Schema for name and/or model facet counts in given period."""
+
+    top_k: Annotated[
+        int,
+        Field(ge=1, le=100, examples=[10], description='Values number per facet.'),
+    ] = Settings.FACET_TOP_K
+
+
+class AdvFacetValueOutSchema(BaseOutSchema):
+    """Schema for facet value advertisements number."""
+
+    value: str | None  # noqa: WPS110
+    adv_count: int
+
+
+class AdvTrendOutSchema(BaseOutSchema):
+    """Schema for price statistics of one time series bucket."""
+
+    bucket: Annotated[date, Field(description='Bucket start date')]
+    adv_count: int
+    avg_price: float
+    median_price: float
+    min_price: int
+    max_price: int
+
+
 class AdvStatOutSchema(BaseOutSchema):
     """Schema for statistical info concerning min/max price and number/period."""
 
@@ -170,6 +223,76 @@ class AdvStatOutSchema(BaseOutSchema):
     num_month: int
 
 
+class AdvPriceBucketOutSchema(BaseOutSchema):
+    """Schema for price histogram bucket, including lower and excluding upper."""
+
+    lower_price: float
+    upper_price: float
+    adv_count: int
+
+
+class AdvPriceDistributionOutSchema(BaseOutSchema):
+    """Schema for price percentiles and histogram, null/empty without data."""
+
+    p10: float | None
+    p25: float | None
+    median: float | None
+    p75: float | None
+    p90: float | None
+    histogram: list[AdvPriceBucketOutSchema]
+
+
+class AdvSearchQuerySchema(BaseInSchema):
+    """Schema for advertisement search query string."""
+
+    q: Annotated[  # noqa: WPS111
+        str,
+        Field(
+            min_length=1,
+            max_length=100,
+            examples=['mazda dnipro'],
+            description='Words, searched in name, model, region, color and seller.',
+        ),
+    ]
+
+    @field_validator('q')
+    @classmethod
+    def validate_q(cls, q_value: str) -> str:
+        """Check search string contains words."""
+        if not re.search(r'\w', q_value):
+            raise ValueError('Search string should contain words.')
+        return q_value
+
+
+class AdvDeleteOldQuerySchema(BaseInSchema):
+    """Schema for old advertisements deletion query string."""
+
+    days: Annotated[
+        int,
+        Field(ge=1, examples=[1], description='Delete last seen before days ago.'),
+    ] = 1
+    chunk_size: Annotated[
+        int | None,
+        Field(ge=1, examples=[10000], description='Rows deleted per transaction.'),
+    ] = Settings.ADV_DELETE_CHUNK_SIZE
+    chunk_sleep: Annotated[
+        float,
+        Field(ge=0, le=1, examples=[0.1], description='Pause between chunks.'),
+    ] = Settings.ADV_DELETE_CHUNK_SLEEP
+
+
+class AdvDeleteOldOutSchema(BaseOutSchema):
+    """Schema for old advertisements deletion report."""
+
+    deleted_count: int
+    duration: Annotated[float, Field(description='Deletion duration in seconds')]
+    rows_per_second: float
+    completed: Annotated[
+        bool,
+        Field(description='All old advertisements are deleted, repeat otherwise'),
+    ]
+
+
 class UrlSchema(BaseInSchema):
     """Schema url validation and changing."""
 
@@ -1,28 +1,220 @@
 """Advertisement apps statements."""
 
-from datetime import datetime
+from datetime import date, datetime
 
-from sqlalchemy import Executable, delete, func, select
+from sqlalchemy import (
+    ARRAY,
+    Column,
+    Date,
+    DateTime,
+    Executable,
+    Float,
+    Integer,
+    MetaData,
+    Select,
+    StatementLambdaElement,
+    String,
+    Table,
+    and_,
+    any_,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    lambda_stmt,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import REGCLASS, Insert, insert
+from sqlalchemy.schema import DropTable
+from typing_extensions import Any, Optional, Sequence
 
-from apps.advertisements.models import Advertisement
+from apps.advertisements.adv_utilities import (
+    EMPTY_STAT_MAX_PRICE,
+    EMPTY_STAT_MIN_PRICE,
+    PRICE_PERCENTILES,
+    adv_auxiliary_func,
+)
+from apps.advertisements.models import Advertisement, AdvertisementStat
 from apps.advertisements.schemas import (
+    AdvFacetQuerySchema,
     AdvNameModelQuerySchema,
+    AdvOut,
     AdvPeriodQuerySchema,
+    AdvSearchQuerySchema,
+    AdvTrendQuerySchema,
+    CreateAdvIn,
     UrlSchema,
 )
 from apps.common.base_statements import BaseCRUDStatements
+from apps.common.common_types import NameModelPairs
+from apps.common.enum import AdvFacet
+from settings import Settings
 
 
 class AdvStatements(BaseCRUDStatements):
     """Statements for Advertisement model."""
 
+    upsert_columns = tuple(CreateAdvIn.model_fields)
+    staging_table = Table(
+        'advertisement_staging',
+        MetaData(),
+        *(
+            Column(column.name, column.type)
+            for column in Advertisement.__table__.columns
+            if column.name in CreateAdvIn.model_fields
+        ),
+        prefixes=['TEMPORARY'],
+        postgresql_on_commit='DROP',
+    )
+
     def period_list_statement(
         self,
         *,
         period: AdvPeriodQuerySchema,
+        after: Optional[tuple[date | None, int]] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Executable:
+        """Get period advertisement list.
+
+        With limit given, list is a keyset page ordered by adv_date and id,
+        starting after given adv_date and id. With fields given, only them
+        and keyset columns are selected. Statement is cached by its filters
+        shape, period, keyset and limit values are bound.
+        """
+        model = self.model
+        key_fields = self._with_key_fields(fields, 'adv_date', 'id')
+        entities = self.select_entities(key_fields)
+        statement = lambda_stmt(
+            lambda: select(*entities).execution_options(populate_existing=True),
+            track_on=[model.__table__, self.get_fields_key(key_fields)],
+        )
+        statement = self._lambda_period_filter(statement, period)
+        if limit is not None:
+            statement = self._keyset_page(statement, after, limit)
+        return statement
+
+    def _lambda_period_filter(
+        self,
+        statement: StatementLambdaElement,
+        period: AdvPeriodQuerySchema,
+    ) -> StatementLambdaElement:
+        """Filter lambda statement by adv_date period bounds, given in period."""
+        model = self.model
+        begin, end = period.begin, period.end
+        if begin and end:
+            statement += lambda select_statement: select_statement.filter(
+                model.adv_date >= begin,
+                model.adv_date <= end,
+            )
+        elif begin:
+            statement += lambda select_statement: select_statement.filter(
+                model.adv_date >= begin,
+            )
+        elif end:
+            statement += lambda select_statement: select_statement.filter(
+                model.adv_date <= end,
+            )
+        return statement
+
+    def search_statement(
+        self,
+        *,
+        search: AdvSearchQuerySchema,
+        after: Optional[tuple[float, int]] = None,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Executable:
+        """Get advertisements page, matching search words, with their rank.
+
+        Search words match lexeme prefixes of search_vector, with trigram search
+        enabled name and model, similar to search string, match too. Space
+        between them is inlined to match trigram index expression. Page is
+        ordered by rank descending and id, starting after given rank and id.
+        With fields given, only them and id are selected.
+        """
+        ts_query = func.to_tsquery(
+            literal_column("'simple'"),
+            adv_auxiliary_func.get_search_ts_query(search.q),
+        )
+        rank = func.ts_rank(self.model.search_vector, ts_query)
+        search_filter = self.model.search_vector.bool_op('@@')(ts_query)
+        if Settings.SEARCH_TRIGRAM_ENABLED:
+            search_filter = or_(
+                search_filter,
+                func.lower(search.q).bool_op('<%')(
+                    func.lower(
+                        self.model.name + literal_column("' '") + self.model.model,
+                    ),
+                ),
+            )
+        select_statement = (
+            self.select_fields(self._with_key_fields(fields, 'id'))
+            .add_columns(rank.label('rank'))
+            .where(search_filter)
+        )
+        return self._search_page(select_statement, rank, after, limit)
+
+    def _search_page(
+        self,
+        select_statement: Select,
+        rank: Any,
+        after: Optional[tuple[float, int]],
+        limit: int,
+    ) -> Select:
+        """Limit search statement to page by rank descending and id."""
+        if after is not None:
+            after_rank, after_id = after
+            rank_value = literal(after_rank, Float)
+            select_statement = select_statement.where(
+                or_(
+                    rank < rank_value,
+                    and_(rank == rank_value, self.model.id > after_id),
+                ),
+            )
+        select_statement = select_statement.order_by(rank.desc(), self.model.id.asc())
+        return select_statement.limit(limit)
+
+    def _with_key_fields(
+        self,
+        fields: Optional[Sequence[str]],
+        *key_fields: str,
+    ) -> Optional[tuple[str, ...]]:
+        """Add keyset pagination fields to sparse fieldset, if it is given."""
+        if fields is None:
+            return None
+        return tuple(dict.fromkeys((*fields, *key_fields)))
+
+    def period_export_statement(
+        self,
+        *,
+        period: AdvPeriodQuerySchema,
     ) -> Executable:
-        """Get period advertisement list."""
-        select_statement = select(self.model)
+        """Get period advertisement rows, ordered by adv_date and id, for export."""
+        select_statement = self._period_filter(
+            select(*(self.model.__table__.c[field] for field in AdvOut.model_fields)),
+            period,
+        )
+        return select_statement.order_by(
+            self.model.adv_date.asc().nulls_first(),
+            self.model.id.asc(),
+        )
+
+    def _period_filter(
+        self,
+        select_statement: Select,
+        period: AdvPeriodQuerySchema,
+    ) -> Select:
+        """Filter statement by advertisement period."""
         if period.begin:
             select_statement = select_statement.filter(
                 self.model.adv_date >= period.begin,
@@ -31,41 +223,646 @@ class AdvStatements(BaseCRUDStatements):
             select_statement = select_statement.filter(
                 self.model.adv_date <= period.end,
             )
-        return select_statement.execution_options(populate_existing=True)
+        return select_statement
 
-    def name_model_stat_statement(
+    def _keyset_page(
+        self,
+        statement: StatementLambdaElement,
+        after: Optional[tuple[date | None, int]],
+        limit: int,
+    ) -> StatementLambdaElement:
+        """Limit statement to keyset page by adv_date (nulls first) and id.
+
+        Every lambda adds keyset criteria, order and limit at once, since
+        each linked lambda extracts bound parameters of all previous ones.
+        """
+        model = self.model
+        if after is None:
+            return statement + (
+                lambda select_statement: select_statement.order_by(
+                    model.adv_date.asc().nulls_first(),
+                    model.id.asc(),
+                ).limit(limit)
+            )
+        after_date, after_id = after
+        if after_date is None:
+            return statement + (
+                lambda select_statement: select_statement.where(
+                    or_(
+                        and_(model.adv_date.is_(None), model.id > after_id),
+                        model.adv_date.is_not(None),
+                    ),
+                )
+                .order_by(model.adv_date.asc().nulls_first(), model.id.asc())
+                .limit(limit)
+            )
+        return statement + (
+            lambda select_statement: select_statement.where(
+                tuple_(model.adv_date, model.id) > tuple_(after_date, after_id),
+            )
+            .order_by(model.adv_date.asc().nulls_first(), model.id.asc())
+            .limit(limit)
+        )
+
+    def price_distribution_statement(
         self,
         *,
         car_info: AdvNameModelQuerySchema,
+        buckets: int,
     ) -> Executable:
-        """Get name/model stat statement with car_info schema filters."""
-        statement = select(self.model).with_only_columns(
-            self.model.price,
-            self.model.adv_date,
+        """Get price percentiles and histogram statement with car_info filters.
+
+        Filtered prices are scanned once. Statement returns a row per non-empty
+        width_bucket, repeating price bounds and percentiles, or a single row
+        without bucket, if nothing is found.
+        """
+        prices = self._name_model_filter(select(self.model.price), car_info).cte(
+            'filtered_price',
+        )
+        bounds = select(
+            func.min(prices.c.price).label('min_price'),
+            func.max(prices.c.price).label('max_price'),
+            func.percentile_cont(
+                literal(
+                    [percentile for _, percentile in PRICE_PERCENTILES],
+                    ARRAY(Float),
+                ),
+            )
+            .within_group(prices.c.price)
+            .label('percentiles'),
+        ).cte('price_bounds')
+        histogram = (
+            select(
+                func.width_bucket(
+                    prices.c.price,
+                    bounds.c.min_price,
+                    bounds.c.max_price + 1,
+                    buckets,
+                ).label('bucket'),
+                func.count().label('adv_count'),
+            )
+            .select_from(prices.join(bounds, true()))
+            .group_by('bucket')
+            .cte('price_histogram')
+        )
+        return (
+            select(bounds, histogram.c.bucket, histogram.c.adv_count)
+            .select_from(bounds.outerjoin(histogram, true()))
+            .order_by(histogram.c.bucket)
+        )
+
+    def price_trend_statement(self, *, trend_info: AdvTrendQuerySchema) -> Executable:
+        """Get price statistics per adv_date truncated to trend interval."""
+        bucket = cast(
+            func.date_trunc(trend_info.interval, cast(self.model.adv_date, DateTime)),
+            Date,
+        )
+        statement = select(
+            bucket.label('bucket'),
+            func.count().label('adv_count'),
+            func.avg(self.model.price).label('avg_price'),
+            func.percentile_cont(0.5)
+            .within_group(self.model.price)
+            .label(
+                'median_price',
+            ),
+            func.min(self.model.price).label('min_price'),
+            func.max(self.model.price).label('max_price'),
+        ).where(self.model.adv_date.is_not(None))
+        statement = self._name_model_filter(statement, trend_info)
+        return (
+            self._period_filter(statement, trend_info)
+            .group_by('bucket')
+            .order_by('bucket')
+        )
+
+    def facet_statement(
+        self,
+        *,
+        facet_info: AdvFacetQuerySchema,
+        facets: Sequence[AdvFacet],
+    ) -> Executable:
+        """Get top facet values counts statement with facet_info filters.
+
+        All facets are counted by one GROUPING SETS scan. Statement returns
+        facet, value and advertisements number rows, top_k rows per facet.
+        """
+        columns = self._facet_columns(facets)
+        facet_name, facet_value = self._facet_cases(facets, columns)
+        statement = select(
+            facet_name.label('facet'),
+            facet_value.label('value'),
+            func.count().label('adv_count'),
+            func.row_number()
+            .over(
+                partition_by=facet_name,
+                order_by=(func.count().desc(), facet_value),
+            )
+            .label('position'),
+        )
+        statement = self._name_model_filter(statement, facet_info)
+        return self._top_facet_values(
+            self._period_filter(statement, facet_info),
+            columns,
+            facet_info.top_k,
+        )
+
+    def _facet_columns(self, facets: Sequence[AdvFacet]) -> list:
+        """Get counted column expressions of given facets."""
+        facet_columns = {
+            AdvFacet.REGION: self.model.region,
+            AdvFacet.COLOR: self.model.color,
+            AdvFacet.SALON: self.model.salon,
+            AdvFacet.MODEL: func.lower(self.model.model),
+        }
+        return [facet_columns[facet] for facet in facets]
+
+    def _facet_cases(self, facets: Sequence[AdvFacet], columns: list) -> tuple:
+        """Get facet name and value expressions of grouping set rows."""
+        facet_name = case(
+            *(
+                (func.grouping(column) == 0, literal(facet.value))
+                for facet, column in zip(facets, columns)
+            ),
+        )
+        facet_value = case(
+            *(
+                (func.grouping(column) == 0, column)
+                for column in columns  # noqa: WPS441
+            ),
+        )
+        return facet_name, facet_value
+
+    def _top_facet_values(
+        self,
+        statement: Select,
+        columns: list,
+        top_k: int,
+    ) -> Select:
+        """Count statement by grouping sets of columns, keep top_k values of each."""
+        column_sets = [tuple_(column) for column in columns]
+        grouping_sets = func.grouping_sets(*column_sets)
+        grouped = statement.group_by(grouping_sets).subquery('facet_count').c
+        return (
+            select(grouped.facet, grouped.value, grouped.adv_count)
+            .where(grouped.position <= top_k)
+            .order_by(grouped.facet, grouped.position)
         )
+
+    def _name_model_filter(
+        self,
+        select_statement: Select,
+        car_info: AdvNameModelQuerySchema,
+    ) -> Select:
+        """Filter statement by lowered car name and model."""
         if car_info.name:
-            statement = statement.where(
+            select_statement = select_statement.where(
                 func.lower(self.model.name) == car_info.name.lower(),
             )
         if car_info.model:
-            statement = statement.where(
+            select_statement = select_statement.where(
                 func.lower(self.model.model) == car_info.model.lower(),
             )
-        return statement.execution_options(populate_existing=True)
+        return select_statement
 
     def delete_old_statement(
         self,
         old_date: datetime,
+        after_id: Optional[int] = None,
+        chunk_size: Optional[int] = None,
     ) -> Executable:
-        """Create statement for deleting old advertisements."""
-        return delete(self.model).where(self.model.created_at <= old_date)
+        """Create statement for deleting advertisements, last seen before old_date.
+
+        With chunk_size given, only chunk of rows with the lowest ids, greater
+        than after_id, is deleted. Statement returns lowered name/model pairs
+        of deleted rows with their number and max id. Rows are seen not before
+        their creation, so partitions from old_date are pruned.
+        """
+        where_expr = [
+            self.model.last_seen_at < old_date,
+            self.model.created_at < old_date,
+        ]
+        if after_id is not None:
+            where_expr.append(self.model.id > after_id)
+        if chunk_size is not None:
+            chunk_ids = (
+                select(self.model.id)
+                .where(*where_expr)
+                .order_by(self.model.id)
+                .limit(chunk_size)
+            )
+            where_expr.append(self.model.id.in_(chunk_ids.scalar_subquery()))
+        deleted_cte = (
+            delete(self.model)
+            .where(*where_expr)
+            .returning(
+                self.model.id,
+                func.lower(self.model.name).label('name'),
+                func.lower(self.model.model).label('model'),
+            )
+            .cte('deleted_advertisement')
+        )
+        return select(
+            deleted_cte.c.name,
+            deleted_cte.c.model,
+            func.count().label('adv_count'),
+            func.max(deleted_cte.c.id).label('max_id'),
+        ).group_by(deleted_cte.c.name, deleted_cte.c.model)
+
+    def create_partitions_statement(
+        self,
+        from_day: date,
+        to_day: date,
+    ) -> Executable:
+        """Create statement creating missing daily partitions for days range."""
+        return select(func.advertisement_create_partitions(from_day, to_day))
+
+    def old_partitions_statement(self, before_day: date) -> Executable:
+        """Create statement getting names of daily partitions before given day."""
+        partition_name = cast(cast(column('inhrelid'), REGCLASS), String)
+        return (
+            select(partition_name.label('partition_name'))
+            .select_from(table('pg_inherits'))
+            .where(
+                column('inhparent')
+                == cast(literal(self.model.__tablename__), REGCLASS),
+                partition_name.regexp_match(
+                    '^{table_name}_p[0-9]{{8}}$'.format(
+                        table_name=self.model.__tablename__,
+                    ),
+                ),
+                func.to_date(func.right(partition_name, 8), 'YYYYMMDD') < before_day,
+            )
+            .order_by(partition_name)
+        )
+
+    def lock_partition_statement(self, partition_name: str) -> Executable:
+        """Create statement locking partition with given name until transaction end.
+
+        Partition name is one got by old_partitions_statement.
+        """
+        return text(
+            'LOCK TABLE {partition_name} IN ACCESS EXCLUSIVE MODE'.format(
+                partition_name=partition_name,
+            ),
+        )
+
+    def partition_seen_statement(
+        self,
+        partition_name: str,
+        old_date: datetime,
+    ) -> Executable:
+        """Create statement getting id of any partition row seen since old_date."""
+        return (
+            select(column('id'))
+            .select_from(table(partition_name))
+            .where(column('last_seen_at') >= old_date)
+            .limit(1)
+        )
+
+    def partition_stat_pairs_statement(self, partition_name: str) -> Executable:
+        """Create statement for getting lowered name/model pairs of partition.
+
+        Statement returns pairs with their number of rows.
+        """
+        name = func.lower(column('name'))
+        model = func.lower(column('model'))
+        return (
+            select(
+                name.label('name'),
+                model.label('model'),
+                func.count().label('adv_count'),
+            )
+            .select_from(table(partition_name))
+            .group_by(name, model)
+        )
+
+    def drop_partition_statement(self, partition_name: str) -> Executable:
+        """Create statement dropping partition with given name."""
+        return DropTable(Table(partition_name, MetaData()))
+
+    def lock_timeout_statement(self, lock_timeout: int) -> Executable:
+        """Create statement setting lock timeout in ms for current transaction."""
+        return select(func.set_config('lock_timeout', str(lock_timeout), True))
+
+    def stat_pairs_statement(
+        self,
+        adv_ids: Sequence[int],
+    ) -> Executable:
+        """Create statement for getting lowered name/model pairs of given ids."""
+        name = func.lower(self.model.name)
+        car_model = func.lower(self.model.model)
+        ids_array = literal(list(adv_ids), ARRAY(Integer))
+        ids_filter = self.model.id == any_(ids_array)
+        return select(name, car_model).where(ids_filter).distinct()
+
+    def upsert_lock_statement(self) -> Executable:
+        """Create statement taking advertisement upsert transaction lock.
+
+        Since url key is unique only within created_at partition, concurrent
+        upserts are serialized to not insert the same url twice.
+        """
+        return select(
+            func.pg_advisory_xact_lock(func.hashtext(self.model.__tablename__)),
+        )
+
+    def upsert_statement(self, advs: Sequence[CreateAdvIn]) -> Executable:
+        """Create statement inserting advertisements or updating changed ones.
+
+        Existing advertisement is found by normalized url key. Statement returns
+        lowered name/model pairs of inserted or actually changed rows. Unchanged
+        rows are marked as seen by touch_statement.
+        """
+        return self._upsert_statement(
+            insert(self.model).values(
+                [
+                    {
+                        **adv.model_dump(),
+                        'created_at': self._existing_created_at(adv.url),
+                    }
+                    for adv in advs
+                ],
+            ),
+        )
+
+    def upsert_staging_statement(self) -> Executable:
+        """Create statement upserting advertisements copied to staging table.
+
+        Of staging rows with the same url key, the last copied one is used.
+        """
+        url_key = func.advertisement_url_key(self.staging_table.c.url)
+        staging_select = (
+            select(
+                *(self.staging_table.c[column] for column in self.upsert_columns),
+                self._existing_created_at(self.staging_table.c.url),
+            )
+            .distinct(url_key)
+            .order_by(url_key, literal_column('ctid').desc())
+        )
+        return self._upsert_statement(
+            insert(self.model).from_select(
+                (*self.upsert_columns, 'created_at'),
+                staging_select,
+            ),
+        )
+
+    def _existing_created_at(self, url: Any) -> Any:
+        """Get created_at of advertisement with url key of given url or now.
+
+        Upserted row keeps its created_at, so conflicts with existing row
+        in its partition.
+        """
+        existing = self.model.__table__.alias('existing_advertisement')
+        return func.coalesce(
+            select(existing.c.created_at)
+            .where(existing.c.url_key == func.advertisement_url_key(url))
+            .order_by(existing.c.created_at.desc())
+            .limit(1)
+            .scalar_subquery(),
+            func.now(),
+        )
+
+    def _upsert_statement(self, insert_statement: Insert) -> Executable:
+        """Add update of changed columns on url key conflict to insert statement."""
+        excluded = insert_statement.excluded
+        return insert_statement.on_conflict_do_update(
+            index_elements=(self.model.url_key, self.model.created_at),
+            set_={
+                **{column: excluded[column] for column in self.upsert_columns},
+                'last_seen_at': func.now(),
+            },
+            where=tuple_(
+                *(self.model.__table__.c[column] for column in self.upsert_columns),
+            ).is_distinct_from(
+                tuple_(*(excluded[column] for column in self.upsert_columns)),
+            ),
+        ).returning(func.lower(self.model.name), func.lower(self.model.model))
+
+    def touch_statement(self, urls: Sequence[str]) -> Executable:
+        """Create statement marking advertisements with given urls as seen now."""
+        return self._url_key_touch_statement(self._url_keys_select(urls))
+
+    def touch_staging_statement(self) -> Executable:
+        """Create statement marking advertisements with staging urls as seen now."""
+        return self._url_key_touch_statement(
+            select(func.advertisement_url_key(self.staging_table.c.url)),
+        )
+
+    def _url_key_touch_statement(self, url_keys: Select) -> Executable:
+        """Create statement marking advertisements with url keys as seen now.
+
+        Rows, already seen in current transaction, are not updated again.
+        """
+        return (
+            update(self.model)
+            .where(
+                self.model.url_key.in_(url_keys),
+                self.model.last_seen_at < func.now(),
+            )
+            .values(last_seen_at=func.now())
+        )
+
+    def _url_keys_select(self, urls: Sequence[str]) -> Select:
+        """Get select of normalized url keys of given urls."""
+        return select(
+            func.advertisement_url_key(
+                func.unnest(literal(list(urls), ARRAY(String))),
+            ),
+        )
+
+    def url_stat_pairs_statement(self, urls: Sequence[str]) -> Executable:
+        """Create statement for getting lowered name/model pairs of given urls."""
+        return self._url_key_stat_pairs_statement(self._url_keys_select(urls))
+
+    def staging_stat_pairs_statement(self) -> Executable:
+        """Create statement for getting lowered name/model pairs of staging urls."""
+        return self._url_key_stat_pairs_statement(
+            select(func.advertisement_url_key(self.staging_table.c.url)),
+        )
+
+    def _url_key_stat_pairs_statement(self, url_keys: Select) -> Executable:
+        """Create statement for getting lowered name/model pairs of url keys."""
+        name = func.lower(self.model.name)
+        car_model = func.lower(self.model.model)
+        url_keys_filter = self.model.url_key.in_(url_keys)
+        return select(name, car_model).where(url_keys_filter).distinct()
 
     def get_adv_by_url_statement(
         self,
         url: UrlSchema,
+        fields: Optional[Sequence[str]] = None,
     ) -> Executable:
-        """Create statement for getting advertisement by url."""
-        return select(self.model).filter(self.model.url.endswith(url.url))
+        """Create statement for getting advertisement by url last path segment.
+
+        Statement is cached by fields, url is bound.
+        """
+        return self.lambda_select_equal('url_slug', url.url, fields)
+
+
+class AdvStatStatements(BaseCRUDStatements):
+    """Statements for AdvertisementStat rollup model."""
+
+    stat_columns = ('name', 'model', 'adv_date', 'adv_count', 'min_price', 'max_price')
+
+    def _aggregate_statement(self, *where_expr: Any) -> Select:
+        """Get advertisement rows aggregated to rollup columns."""
+        name = func.lower(Advertisement.name)
+        model = func.lower(Advertisement.model)
+        return (
+            select(
+                name,
+                model,
+                Advertisement.adv_date,
+                func.count(),
+                func.min(Advertisement.price),
+                func.max(Advertisement.price),
+            )
+            .where(*where_expr)
+            .group_by(name, model, Advertisement.adv_date)
+        )
+
+    def _pairs_statement(self, pairs: NameModelPairs) -> Select:
+        """Get statement selecting given name/model pairs from arrays."""
+        return select(
+            func.unnest(literal([pair[0] for pair in pairs], ARRAY(String))),
+            func.unnest(literal([pair[1] for pair in pairs], ARRAY(String))),
+        )
+
+    def add_stat_statement(
+        self,
+        adv_ids: Sequence[int],
+    ) -> Executable:
+        """Create statement adding advertisements with given ids to rollup."""
+        return self._add_stat_statement(
+            self._aggregate_statement(
+                Advertisement.id == any_(literal(list(adv_ids), ARRAY(Integer))),
+            ),
+        )
+
+    def _add_stat_statement(self, aggregate_statement: Select) -> Executable:
+        """Create statement adding aggregated advertisements to rollup."""
+        insert_statement = insert(self.model).from_select(
+            self.stat_columns,
+            aggregate_statement,
+        )
+        return insert_statement.on_conflict_do_update(
+            index_elements=('name', 'model', 'adv_date'),
+            set_={
+                'adv_count': self.model.adv_count + insert_statement.excluded.adv_count,
+                'min_price': func.least(
+                    self.model.min_price,
+                    insert_statement.excluded.min_price,
+                ),
+                'max_price': func.greatest(
+                    self.model.max_price,
+                    insert_statement.excluded.max_price,
+                ),
+            },
+        )
+
+    def clear_stat_statement(
+        self,
+        pairs: Optional[NameModelPairs] = None,
+    ) -> Executable:
+        """Create statement deleting rollup rows of given name/model pairs or all."""
+        statement = delete(self.model)
+        if pairs is not None:
+            statement = statement.where(
+                tuple_(self.model.name, self.model.model).in_(
+                    self._pairs_statement(pairs),
+                ),
+            )
+        return statement
+
+    def fill_stat_statement(
+        self,
+        pairs: Optional[NameModelPairs] = None,
+    ) -> Executable:
+        """Create statement filling rollup for given name/model pairs or all.
+
+        Rows, inserted by concurrent refresh of the same pairs after clearing,
+        are overwritten with recomputed values instead of unique violation.
+        """
+        where_expr = []
+        if pairs is not None:
+            where_expr.append(
+                tuple_(
+                    func.lower(Advertisement.name),
+                    func.lower(Advertisement.model),
+                ).in_(self._pairs_statement(pairs)),
+            )
+        insert_statement = insert(self.model).from_select(
+            self.stat_columns,
+            self._aggregate_statement(*where_expr),
+        )
+        return insert_statement.on_conflict_do_update(
+            index_elements=('name', 'model', 'adv_date'),
+            set_={
+                column: insert_statement.excluded[column]
+                for column in ('adv_count', 'min_price', 'max_price')
+            },
+        )
+
+    def name_model_stat_statement(
+        self,
+        *,
+        car_info: AdvNameModelQuerySchema,
+        stat_dates: tuple[date, date, date],
+    ) -> Executable:
+        """Get name/model stat statement from rollup with car_info schema filters.
+
+        Statement is cached by filters shape, stat dates and names are bound.
+        """
+        model = self.model
+        day_ago, week_ago, month_ago = stat_dates
+        statement = lambda_stmt(
+            lambda: select(
+                func.coalesce(func.min(model.min_price), EMPTY_STAT_MIN_PRICE).label(
+                    'min_price',
+                ),
+                func.coalesce(func.max(model.max_price), EMPTY_STAT_MAX_PRICE).label(
+                    'max_price',
+                ),
+                func.coalesce(
+                    func.sum(model.adv_count).filter(model.adv_date >= day_ago),
+                    0,
+                ).label('num_day'),
+                func.coalesce(
+                    func.sum(model.adv_count).filter(model.adv_date >= week_ago),
+                    0,
+                ).label('num_week'),
+                func.coalesce(
+                    func.sum(model.adv_count).filter(model.adv_date >= month_ago),
+                    0,
+                ).label('num_month'),
+            ),
+        )
+        return self._stat_name_model_filter(statement, car_info)
+
+    def _stat_name_model_filter(
+        self,
+        statement: StatementLambdaElement,
+        car_info: AdvNameModelQuerySchema,
+    ) -> StatementLambdaElement:
+        """Add rollup lowered name/model filters of car_info schema to statement."""
+        model = self.model
+        name = car_info.name.lower() if car_info.name else None
+        car_model = car_info.model.lower() if car_info.model else None
+        if name and car_model:
+            statement += lambda select_statement: select_statement.where(
+                model.name == name,
+                model.model == car_model,
+            )
+        elif name:
+            statement += lambda select_statement: select_statement.where(
+                model.name == name,
+            )
+        elif car_model:
+            statement += lambda select_statement: select_statement.where(
+                model.model == car_model,
+            )
+        return statement
 
 
 adv_statements = AdvStatements(model=Advertisement)
+adv_stat_statements = AdvStatStatements(model=AdvertisementStat)
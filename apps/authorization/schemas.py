@@ -2,14 +2,19 @@
 
 from datetime import datetime
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 from typing_extensions import Annotated
 
 from apps.common.schemas import BaseInSchema, BaseOutSchema
 
 
 class TokenPayload(BaseInSchema):
-    """Token payload schema."""
+    """Token payload schema.
+
+    Frozen, since verified payloads are shared by token cache.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     exp: Annotated[int, Field(description='Expired at')]
     sub: Annotated[str, Field(description='Subject')]
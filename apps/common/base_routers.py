@@ -7,10 +7,16 @@ from typing_extensions import TYPE_CHECKING, Annotated, Any, Sequence, TypeAlias
 
 from apps.common.base_statements import BaseCRUDStatements
 from apps.common.common_types import ModelType, SchemaType
-from apps.common.common_utilities import change_docstring, checkers
+from apps.common.common_utilities import change_docstring, checkers, get_sparse_fields
 from apps.common.dependencies import get_async_session
 from apps.common.orm_services import statement_executor as executor
-from apps.common.schemas import JSENDErrorOutSchema, JSENDFailOutSchema, JSENDOutSchema
+from apps.common.schemas import (
+    FieldsQuerySchema,
+    JSENDErrorOutSchema,
+    JSENDFailOutSchema,
+    JSENDOutSchema,
+    get_fields_out_schema,
+)
 from apps.common.user_dependencies import get_current_admin_user
 from apps.user.models import User
 
@@ -52,10 +58,15 @@ class BaseRouterKwargs:
         )
         if TYPE_CHECKING:
             self.response_model = JSENDOutSchema
-            self.response_model_many = JSENDOutSchema
+            self.response_model_fields = JSENDOutSchema
+            self.response_model_many_fields = JSENDOutSchema
         else:
+            fields_out_schema = get_fields_out_schema(out_schema)
             self.response_model = JSENDOutSchema[out_schema]
-            self.response_model_many = JSENDOutSchema[Sequence[out_schema]]
+            self.response_model_fields = JSENDOutSchema[fields_out_schema]
+            self.response_model_many_fields = JSENDOutSchema[
+                Sequence[fields_out_schema]
+            ]
 
     def get_post_router_kwargs(self) -> dict:
         """Get post router kwargs."""
@@ -128,7 +139,7 @@ class BaseRouterKwargs:
         return {
             'path': self.instance_path,
             'name': 'read_{name}'.format(name=self.name),
-            'response_model': self.response_model,
+            'response_model': self.response_model_fields,
             'summary': 'Get {name} with id by admin'.format(name=self.name),
             'responses': responses,
             'tags': self.tags,
@@ -167,7 +178,7 @@ class BaseRouterKwargs:
         return {
             'path': '/admin/list/{name}/'.format(name=self.name),
             'name': 'read_{name}_list'.format(name=self.name),
-            'response_model': self.response_model_many,
+            'response_model': self.response_model_many_fields,
             'summary': 'Get {name} list by admin'.format(name=self.name),
             'responses': responses,
             'tags': self.tags,
@@ -192,6 +203,11 @@ class BaseInitializer:
         self.out_schema = out_schema
         self.statements = BaseCRUDStatements(model=model)
         self.model = model
+        self.sparse_fields = tuple(
+            field
+            for field in out_schema.model_fields
+            if field in model.__table__.columns
+        )
         self._kwargs_generator = BaseRouterKwargs(model.__name__.lower(), out_schema)
 
     def get_schema_fields_doc_description(
@@ -260,6 +276,30 @@ class BaseInitializer:
             )
         return '\n'.join([title, path_section, input_section, return_section])
 
+    async def before_write(
+        self,
+        session: AsyncSession,
+        instance_id: int | None,
+    ) -> Any:
+        """Collect data needed for syncing dependent data before instance write.
+
+        Instance id is None for creation. Returned value is passed to after_write.
+        """
+
+    async def after_write(
+        self,
+        session: AsyncSession,
+        previous: Any,
+        instance: Any,
+    ) -> None:
+        """Sync dependent data after instance write, before commit.
+
+        Instance is None for deletion.
+        """
+
+    async def after_commit(self) -> None:
+        """Run actions, depending on committed instance write, e.g. invalidation."""
+
 
 class BaseRouterInitializer(BaseInitializer):
     """Base router initializer for admin interface."""
@@ -284,18 +324,18 @@ class BaseRouterInitializer(BaseInitializer):
             session: Annotated[AsyncSession, Depends(get_async_session)],
         ) -> dict:
             """Create post router."""
+            previous = await self.before_write(session, None)
             statement = self.statements.create_statement(schema=schema)
             created_instance: (
                 LocalModelType | Sequence[LocalModelType | None] | None
-            ) = await executor.execute_return_statement(
-                session,
-                statement,
-                commit=True,
-            )
+            ) = await executor.execute_return_statement(session, statement)
             checked_instance = checkers.check_created_instance(
                 created_instance,
                 self.model.__name__,
             )
+            await self.after_write(session, previous, checked_instance)
+            await session.commit()
+            await self.after_commit()
             output_instance: schema_type = self.out_schema.model_validate(
                 checked_instance,
             )
@@ -322,9 +362,27 @@ class BaseRouterInitializer(BaseInitializer):
             instance_id: int,
             user: Annotated[User, Depends(get_current_admin_user)],
             session: Annotated[AsyncSession, Depends(get_async_session)],
+            fieldset: Annotated[FieldsQuerySchema, Depends()],
         ) -> dict:
             """Create post router."""
-            statement = self.statements.read_statement(obj_data={'id': instance_id})
+            fields = get_sparse_fields(fieldset.fields, self.sparse_fields)
+            statement = self.statements.read_statement(
+                obj_data={'id': instance_id},
+                fields=fields,
+            )
+            message = 'Read {name} with id {id}'.format(
+                name=self.model.__name__.lower(),
+                id=instance_id,
+            )
+            if fields is not None:
+                rows = await executor.execute_dicts_statement(session, statement)
+                return {
+                    'data': checkers.check_created_instance(
+                        next(iter(rows), None),
+                        self.model.__name__,
+                    ),
+                    'message': message,
+                }
             read_instance: LocalModelType | Sequence[LocalModelType | None] | None = (
                 await executor.execute_return_statement(session, statement)
             )
@@ -335,13 +393,7 @@ class BaseRouterInitializer(BaseInitializer):
             output_instance: schema_type = self.out_schema.model_validate(
                 checked_instance,
             )
-            return {
-                'data': output_instance,
-                'message': 'Read {name} with id {id}'.format(
-                    name=self.model.__name__.lower(),
-                    id=output_instance.id,
-                ),
-            }
+            return {'data': output_instance, 'message': message}
 
     def get_update_router(self) -> None:
         """Get create router."""
@@ -363,21 +415,21 @@ class BaseRouterInitializer(BaseInitializer):
             session: Annotated[AsyncSession, Depends(get_async_session)],
         ) -> dict:
             """Create post router."""
+            previous = await self.before_write(session, instance_id)
             statement = self.statements.update_statement(
                 schema=schema,
                 where_data={'id': instance_id},
             )
             updated_instance: (
                 LocalModelType | Sequence[LocalModelType | None] | None
-            ) = await executor.execute_return_statement(
-                session,
-                statement,
-                commit=True,
-            )
+            ) = await executor.execute_return_statement(session, statement)
             checked_instance = checkers.check_created_instance(
                 updated_instance,
                 self.model.__name__,
             )
+            await self.after_write(session, previous, checked_instance)
+            await session.commit()
+            await self.after_commit()
             output_instance: schema_type = self.out_schema.model_validate(
                 checked_instance,
             )
@@ -409,21 +461,21 @@ class BaseRouterInitializer(BaseInitializer):
             session: Annotated[AsyncSession, Depends(get_async_session)],
         ) -> dict:
             """Create post router."""
+            previous = await self.before_write(session, instance_id)
             statement = self.statements.update_statement(
                 schema=schema,
                 where_data={'id': instance_id},
             )
             updated_instance: (
                 LocalModelType | Sequence[LocalModelType | None] | None
-            ) = await executor.execute_return_statement(
-                session,
-                statement,
-                commit=True,
-            )
+            ) = await executor.execute_return_statement(session, statement)
             checked_instance = checkers.check_created_instance(
                 updated_instance,
                 self.model.__name__,
             )
+            await self.after_write(session, previous, checked_instance)
+            await session.commit()
+            await self.after_commit()
             output_instance: schema_type = self.out_schema.model_validate(
                 checked_instance,
             )
@@ -448,8 +500,12 @@ class BaseRouterInitializer(BaseInitializer):
             session: Annotated[AsyncSession, Depends(get_async_session)],
         ) -> dict:
             """Create post router."""
+            previous = await self.before_write(session, instance_id)
             statement = self.statements.delete_statement(obj_data={'id': instance_id})
-            await executor.execute_delete_statement(session, statement)
+            await executor.execute_statement(session, statement)
+            await self.after_write(session, previous, None)
+            await session.commit()
+            await self.after_commit()
             return {
                 'data': None,
                 'message': 'Deleted {name} with id {id}'.format(
@@ -472,18 +528,17 @@ class BaseRouterInitializer(BaseInitializer):
             request: Request,
             user: Annotated[User, Depends(get_current_admin_user)],
             session: Annotated[AsyncSession, Depends(get_async_session)],
+            fieldset: Annotated[FieldsQuerySchema, Depends()],
         ) -> dict:
             """Get instance list."""
-            statement: Executable = self.statements.list_statement()
-            instance_list: (
-                Sequence[Any | None] | Sequence[Sequence[Any | None]] | None
-            ) = await executor.execute_return_statement(
-                session,
-                statement,
-                many=True,
+            statement: Executable = self.statements.list_statement(
+                fields=(
+                    get_sparse_fields(fieldset.fields, self.sparse_fields)
+                    or self.sparse_fields
+                ),
             )
             return {
-                'data': instance_list,
+                'data': await executor.execute_dicts_statement(session, statement),
                 'message': 'Got {name} instances list'.format(name=self.model.__name__),
             }
 
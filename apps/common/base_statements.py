@@ -1,8 +1,17 @@
 """Project Base SQLAlchemy statements."""
 
-from sqlalchemy import Executable, and_, delete, select, update
+from sqlalchemy import (
+    Executable,
+    Select,
+    StatementLambdaElement,
+    and_,
+    delete,
+    lambda_stmt,
+    select,
+    update,
+)
 from sqlalchemy.dialects.postgresql import insert
-from typing_extensions import Optional, Type, Union
+from typing_extensions import Any, Optional, Sequence, Type, Union
 
 from apps.common.common_types import ModelType, SchemaType
 
@@ -14,6 +23,53 @@ class BaseCRUDStatements:
         """Initialize class instance."""
         self.model = model
 
+    def select_entities(self, fields: Optional[Sequence[str]] = None) -> tuple:
+        """Get model or, with fields given, its columns to select."""
+        if fields is None:
+            return (self.model,)
+        return tuple(self.model.__table__.c[field] for field in fields)
+
+    def select_fields(self, fields: Optional[Sequence[str]] = None) -> Select:
+        """Get select of model or, with fields given, of its columns only."""
+        return select(*self.select_entities(fields))
+
+    def get_fields_key(self, fields: Optional[Sequence[str]]) -> Optional[str]:
+        """Get lambda statement cache key of fields.
+
+        Tracked tuples must hold SQL elements only, so fields are joined.
+        """
+        return None if fields is None else ','.join(fields)
+
+    def lambda_select_equal(
+        self,
+        key: str,
+        value_data: Any,
+        fields: Optional[Sequence[str]] = None,
+    ) -> StatementLambdaElement:
+        """Get cacheable lambda select of model or its fields by key column value.
+
+        Lambda statement is constructed and compiled once per model, key and
+        fields, later calls only extract bound value from lambda closure.
+        """
+        entities = self.select_entities(fields)
+        column = getattr(self.model, key)
+        return lambda_stmt(
+            lambda: select(*entities).where(column == value_data),
+            track_on=[self.model.__table__, key, self.get_fields_key(fields)],
+        )
+
+    def lambda_where_equal(
+        self,
+        statement: StatementLambdaElement,
+        key: str,
+        value_data: Any,
+    ) -> StatementLambdaElement:
+        """Add key column equal to bound value criteria to lambda statement."""
+        column = getattr(self.model, key)
+        return statement + (
+            lambda select_statement: select_statement.where(column == value_data)
+        )
+
     def create_statement(
         self,
         *,
@@ -58,14 +114,22 @@ class BaseCRUDStatements:
         *,
         schema: Optional[SchemaType] = None,
         obj_data: Optional[dict] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> Executable:
-        """Create statement for model reading."""
+        """Create statement for model reading, with fields given only them.
+
+        Filtered statement is cached by filter keys and fields, filter values
+        are bound.
+        """
         obj_data = obj_data if obj_data else {}
         obj_in_data = schema.model_dump(exclude_unset=True) if schema else {}
-        statement = select(self.model)
+        statement: Optional[StatementLambdaElement] = None
         for key, value_data in {**obj_data, **obj_in_data}.items():
-            statement = statement.where(getattr(self.model, key) == value_data)
-        return statement
+            if statement is None:
+                statement = self.lambda_select_equal(key, value_data, fields)
+            else:
+                statement = self.lambda_where_equal(statement, key, value_data)
+        return self.select_fields(fields) if statement is None else statement
 
     def update_statement(
         self,
@@ -115,9 +179,10 @@ class BaseCRUDStatements:
         self,
         *,
         filters: Optional[dict] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> Executable:
-        """Create statement for read models list."""
-        select_statement = select(self.model)
+        """Create statement for read models list, with fields given only them."""
+        select_statement = self.select_fields(fields)
         if filters:
             select_statement = select_statement.filter_by(**filters)
         return select_statement.execution_options(populate_existing=True)
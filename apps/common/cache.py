@@ -0,0 +1,242 @@
+"""Project cache functionality."""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+import redis
+from redis import asyncio as async_redis
+from typing_extensions import Any, Optional
+
+from settings import Settings
+
+logger = logging.getLogger(__name__)
+
+
+class LocalTTLCache:
+    """In-process LRU cache with limited size and entries time to live."""
+
+    def __init__(self, max_size: int, ttl: int) -> None:
+        """Initialize class instance."""
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        """Get not expired value by key or None, marking key as recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, cached_value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return cached_value
+
+    def set(self, key: str, cached_value: Any, ttl: Optional[int] = None) -> None:
+        """Set value by key, evicting least recently used entries over size."""
+        if ttl is None:
+            ttl = self.ttl
+        expires_at = time.monotonic() + ttl
+        self._entries[key] = (expires_at, cached_value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Delete value by key."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Delete all values."""
+        self._entries.clear()
+
+
+class VersionedCache:
+    """Two-tier cache: in-process LRU and optional shared redis.
+
+    Keys are prefixed with namespace version, stored in redis, so bumping
+    the version invalidates both tiers in all processes at once.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_size: int,
+        ttl: int,
+        redis_enabled: bool = True,
+    ) -> None:
+        """Initialize class instance."""
+        self.namespace = namespace
+        self.ttl = ttl
+        self.redis_enabled = redis_enabled
+        self.local_cache = LocalTTLCache(max_size=max_size, ttl=ttl)
+        self._local_version = 0
+        self._local_modified = time.time()
+        self._redis: Optional[async_redis.Redis] = None
+        self._sync_redis: Optional[redis.Redis] = None
+
+    @property
+    def version_key(self) -> str:
+        """Get redis key of namespace version."""
+        return '{namespace}:version'.format(namespace=self.namespace)
+
+    @property
+    def modified_key(self) -> str:
+        """Get redis key of namespace version modification timestamp."""
+        return '{namespace}:modified'.format(namespace=self.namespace)
+
+    def _get_redis(self) -> async_redis.Redis:
+        """Get lazily created async redis client."""
+        if self._redis is None:
+            self._redis = async_redis.Redis(
+                host=Settings.REDIS_HOST,
+                port=int(Settings.REDIS_PORT),
+                socket_connect_timeout=Settings.CACHE_REDIS_TIMEOUT,
+                socket_timeout=Settings.CACHE_REDIS_TIMEOUT,
+            )
+        return self._redis
+
+    def _get_sync_redis(self) -> redis.Redis:
+        """Get lazily created sync redis client."""
+        if self._sync_redis is None:
+            self._sync_redis = redis.Redis(
+                host=Settings.REDIS_HOST,
+                port=int(Settings.REDIS_PORT),
+                socket_connect_timeout=Settings.CACHE_REDIS_TIMEOUT,
+                socket_timeout=Settings.CACHE_REDIS_TIMEOUT,
+            )
+        return self._sync_redis
+
+    def _versioned_key(self, version: str, key: str) -> str:
+        """Get key prefixed with namespace and version."""
+        return '{namespace}:{version}:{key}'.format(
+            namespace=self.namespace,
+            version=version,
+            key=key,
+        )
+
+    async def _get_version(self) -> tuple[str, bool]:
+        """Get namespace version and whether shared redis tier is available."""
+        local_version = 'local{num}'.format(num=self._local_version)
+        if not self.redis_enabled:
+            return local_version, False
+        try:
+            version = await self._get_redis().get(self.version_key)
+        except redis.RedisError as error:
+            logger.warning('Cache redis tier is not available: %s', error)
+            return local_version, False
+        return (version.decode() if version else '0'), True
+
+    async def _get_shared(self, versioned_key: str) -> Any:
+        """Get value from shared redis tier or None."""
+        try:
+            redis_value = await self._get_redis().get(versioned_key)
+        except redis.RedisError as error:
+            logger.warning('Cache redis tier is not available: %s', error)
+            return None
+        if redis_value is None:
+            return None
+        return json.loads(redis_value)
+
+    async def _set_shared(self, versioned_key: str, cached_value: Any) -> None:
+        """Set value to shared redis tier."""
+        try:
+            await self._get_redis().set(
+                versioned_key,
+                json.dumps(cached_value),
+                ex=self.ttl,
+            )
+        except redis.RedisError as error:
+            logger.warning('Cache redis tier is not available: %s', error)
+
+    async def get_or_create(
+        self,
+        key: str,
+        create: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Get cached value by key or create it with given coroutine and cache.
+
+        Version is read once, so value created while cache is invalidated is
+        stored under outdated version and never served.
+        """
+        version, shared = await self._get_version()
+        versioned_key = self._versioned_key(version, key)
+        cached_value = self.local_cache.get(versioned_key)
+        if cached_value is not None:
+            return cached_value
+        if shared:
+            cached_value = await self._get_shared(versioned_key)
+            if cached_value is not None:
+                self.local_cache.set(versioned_key, cached_value)
+                return cached_value
+        cached_value = await create()
+        self.local_cache.set(versioned_key, cached_value)
+        if shared:
+            await self._set_shared(versioned_key, cached_value)
+        return cached_value
+
+    async def get_watermark(self) -> Optional[tuple[str, float]]:
+        """Get namespace version and timestamp of its last modification.
+
+        Without shared redis tier, watermark is local to process and also
+        changes every ttl, like cached values expire. Return None, if redis
+        is not available.
+        """
+        if not self.redis_enabled:
+            ttl_start = time.time() // self.ttl * self.ttl
+            return (
+                'local{num}-{ttl_start:.0f}'.format(
+                    num=self._local_version,
+                    ttl_start=ttl_start,
+                ),
+                max(self._local_modified, ttl_start),
+            )
+        try:
+            version, modified = await self._get_redis().mget(
+                self.version_key,
+                self.modified_key,
+            )
+        except redis.RedisError as error:
+            logger.warning('Cache redis tier is not available: %s', error)
+            return None
+        return (version.decode() if version else '0'), float(modified or 0)
+
+    async def invalidate(self) -> None:
+        """Invalidate all cached values in all processes."""
+        self._local_version += 1
+        self._local_modified = time.time()
+        self.local_cache.clear()
+        if not self.redis_enabled:
+            return
+        try:
+            await (
+                self._get_redis()
+                .pipeline()
+                .incr(self.version_key)
+                .set(self.modified_key, self._local_modified)
+                .execute()
+            )
+        except redis.RedisError as error:
+            logger.warning('Cache redis tier is not available: %s', error)
+
+    def sync_invalidate(self) -> None:
+        """Invalidate all cached values in all processes from sync code."""
+        self._local_version += 1
+        self._local_modified = time.time()
+        self.local_cache.clear()
+        if not self.redis_enabled:
+            return
+        try:
+            (
+                self._get_sync_redis()
+                .pipeline()
+                .incr(self.version_key)
+                .set(self.modified_key, self._local_modified)
+                .execute()
+            )
+        except redis.RedisError as error:
+            logger.warning('Cache redis tier is not available: %s', error)
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from pydantic import BaseModel
-from typing_extensions import TypeVar
+from sqlalchemy import RowMapping
+from typing_extensions import AsyncIterator, Sequence, TypeVar
 
 from apps.common.db import Base
 
 ModelType = TypeVar('ModelType', bound=Base)
 SchemaType = TypeVar('SchemaType', bound=BaseModel, covariant=True)
+NameModelPairs = Sequence[Sequence[str]]
+RowBatches = AsyncIterator[Sequence[RowMapping]]
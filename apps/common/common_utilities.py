@@ -1,22 +1,33 @@
 """Common project utilities."""
 
+import base64
+import binascii
+import hashlib
+import json
+import time
 from datetime import datetime
-from typing import Callable
+from typing import Callable, Iterable
 
 from fastapi import HTTPException, status
 from jose import jwt
 from pydantic import ValidationError
 from pytz import utc
 from sqlalchemy import DATETIME, Dialect, TypeDecorator
-from typing_extensions import Any, Sequence, Type
+from typing_extensions import Any, Optional, Sequence, Type
 
 from apps.authorization.auth_utilities import create_access_token
 from apps.authorization.schemas import TokenPayload
+from apps.common.cache import LocalTTLCache
 from apps.common.exceptions import BackendError
 from settings import Settings
 
 TIME = Type[datetime]
 
+token_cache = LocalTTLCache(
+    max_size=Settings.TOKEN_CACHE_MAX_SIZE,
+    ttl=Settings.JWT_ACCESS_TOKEN_EXPIRE_SECONDS,
+)
+
 
 class AwareDateTime(TypeDecorator):
     """Results returned as aware datetimes, not naive ones."""
@@ -59,15 +70,79 @@ def change_docstring(doc: str) -> Callable:
     return decorated_func
 
 
-def get_token_data(token: str, access: bool = True) -> TokenPayload:
-    """Get token data, using token."""
-    key = Settings.JWT_SECRET_KEY if access else Settings.JWT_REFRESH_SECRET_KEY
-    payload = jwt.decode(
-        token,
-        key,
-        algorithms=[Settings.JWT_ALGORITHM],
+def encode_cursor(cursor_values: list) -> str:
+    """Encode keyset pagination values into opaque cursor."""
+    return base64.urlsafe_b64encode(
+        json.dumps(cursor_values, separators=(',', ':')).encode(),
+    ).decode()
+
+
+def decode_cursor(cursor: str) -> list:
+    """Decode opaque cursor into keyset pagination values."""
+    try:
+        cursor_values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError):
+        raise BackendError(message='Invalid cursor.')
+    if not isinstance(cursor_values, list):
+        raise BackendError(message='Invalid cursor.')
+    return cursor_values
+
+
+def get_sparse_fields(
+    fields: str | None,
+    allowed_fields: Iterable[str],
+) -> tuple[str, ...] | None:
+    """Parse comma separated sparse fieldset, None for all fields."""
+    if fields is None:
+        return None
+    stripped_fields = (field.strip() for field in fields.split(','))
+    field_names = tuple(dict.fromkeys(field for field in stripped_fields if field))
+    unknown_fields = set(field_names).difference(allowed_fields)
+    if not field_names or unknown_fields:
+        raise BackendError(
+            message='Invalid fields: {fields}.'.format(
+                fields=', '.join(sorted(unknown_fields)) or fields,
+            ),
+        )
+    return field_names
+
+
+def get_sparse_rows(rows: list[dict], fields: Sequence[str]) -> list[dict]:
+    """Drop keys, other than sparse fieldset ones, from row dicts in place."""
+    extra_keys = set(rows[0]).difference(fields) if rows else set()
+    for row in rows:
+        for key in extra_keys:
+            del row[key]  # noqa: WPS420
+    return rows
+
+
+def get_token_cache_key(token: str, access: bool) -> str:
+    """Get verified token cache key, holding token digest, not token itself."""
+    return '{kind}:{digest}'.format(
+        kind='access' if access else 'refresh',
+        digest=hashlib.sha256(token.encode()).hexdigest(),
     )
-    token_data = TokenPayload(**payload)
+
+
+def get_token_data(token: str, access: bool = True) -> TokenPayload:
+    """Get token data, using token.
+
+    Verified token data is cached by token digest until token expiration,
+    so repeated requests with the same token skip signature verification.
+    """
+    cache_key = get_token_cache_key(token, access)
+    token_data: Optional[TokenPayload] = token_cache.get(cache_key)
+    if token_data is None:
+        key = Settings.JWT_SECRET_KEY if access else Settings.JWT_REFRESH_SECRET_KEY
+        payload = jwt.decode(
+            token,
+            key,
+            algorithms=[Settings.JWT_ALGORITHM],
+        )
+        token_data = TokenPayload(**payload)
+        ttl = token_data.exp - int(time.time())
+        if ttl > 0:
+            token_cache.set(cache_key, token_data, ttl=ttl)
     if datetime.fromtimestamp(token_data.exp) < datetime.now():
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1,11 +1,33 @@
 """Project db settings."""
 
-from sqlalchemy import MetaData, create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import functools
+import itertools
+import logging
+import time
+from typing import Awaitable, Callable
+
+from sqlalchemy import ClauseElement, Engine, MetaData, create_engine
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.schema import ExecutableDDLElement
+from typing_extensions import Any, Optional, Sequence
 
+from apps.common.pools import get_engine_kwargs, get_pool_stat
 from settings import Settings
 
+logger = logging.getLogger(__name__)
+
+# Session info keys of replica routing.
+REPLICA_READS = 'replica_reads'
+REPLICA_ENGINE = 'replica_engine'
+STICKY_PRIMARY = 'sticky_primary'
+
 postgres_indexes_naming_convention = {
     'ix': '%(column_0_label)s_idx',
     'uq': '%(table_name)s_%(column_0_name)s_key',
@@ -20,13 +42,180 @@ Base = declarative_base(
 
 async_engine = create_async_engine(
     url=Settings.POSTGRES_DSN_ASYNC,
-    echo=Settings.POSTGRES_ECHO,
+    **get_engine_kwargs(async_dsn=True),
+)
+engine = create_engine(url=Settings.POSTGRES_DSN, **get_engine_kwargs(async_dsn=False))
+
+
+class ReplicaSet:
+    """Read replicas async engines, skipping unhealthy ones for retry interval."""
+
+    def __init__(self, engines: Sequence[AsyncEngine], retry_interval: float) -> None:
+        """Initialize class instance."""
+        self.engines = list(engines)
+        self.retry_interval = retry_interval
+        self._unhealthy_until: dict[int, float] = {}
+        self._counter = itertools.count()
+
+    def get_engine(self) -> Optional[AsyncEngine]:
+        """Get next healthy replica engine round-robin, None if there is no one."""
+        now = time.monotonic()
+        healthy_engines = [
+            replica_engine
+            for replica_engine in self.engines
+            if self._unhealthy_until.get(id(replica_engine), 0) <= now
+        ]
+        if not healthy_engines:
+            return None
+        return healthy_engines[next(self._counter) % len(healthy_engines)]
+
+    def mark_unhealthy(self, replica_engine: AsyncEngine) -> None:
+        """Skip replica engine for retry interval."""
+        self._unhealthy_until[id(replica_engine)] = (
+            time.monotonic() + self.retry_interval
+        )
+
+
+def get_statement(clause: Optional[ClauseElement]) -> Optional[ClauseElement]:
+    """Get clause, resolving lambda statement to statement it builds."""
+    return getattr(clause, '_resolved', clause)
+
+
+def is_connection_error(error: Exception) -> bool:
+    """Check whether error is caused by unavailable database, not by statement."""
+    if isinstance(error, (OSError, OperationalError, InterfaceError)):
+        return True
+    return isinstance(error, DBAPIError) and error.connection_invalidated
+
+
+def is_write_statement(statement: Optional[ClauseElement]) -> bool:
+    """Check whether statement is DML or DDL one, or flush without statement."""
+    return (
+        statement is None
+        or statement.is_dml
+        or isinstance(statement, ExecutableDDLElement)
+    )
+
+
+class RoutingSession(Session):
+    """Session, routing SELECT statements of replica reads to healthy replicas.
+
+    Replica reads are enabled with REPLICA_READS session info key. All other
+    statements, flushes and connections go to primary. After commit or any
+    primary write session sticks to primary, so it reads its own writes.
+    Lambda statements are routed by statements they build. Text statements
+    go to primary, not sticking to it. REPLICA_ENGINE session info key holds
+    replica engine only while the last statement is bound to it.
+    """
+
+    def get_bind(
+        self,
+        mapper: Any = None,
+        *,
+        clause: Optional[ClauseElement] = None,
+        **kwargs: Any,
+    ) -> Engine:
+        """Get replica engine for replica reads, primary one otherwise."""
+        statement = get_statement(clause)
+        if self._is_replica_read(statement):
+            replica_engine = replica_set.get_engine()
+            if replica_engine is not None:
+                self.info[REPLICA_ENGINE] = replica_engine
+                return replica_engine.sync_engine
+        elif is_write_statement(statement):
+            self.info[STICKY_PRIMARY] = True
+        self.info.pop(REPLICA_ENGINE, None)
+        return super().get_bind(mapper, clause=clause, **kwargs)  # type: ignore
+
+    def commit(self) -> None:
+        """Commit transaction, sticking to primary."""
+        super().commit()
+        self.info[STICKY_PRIMARY] = True
+
+    def _is_replica_read(self, statement: Optional[ClauseElement]) -> bool:
+        """Check whether statement is plain SELECT of replica reads."""
+        if self._flushing or self.info.get(STICKY_PRIMARY):
+            return False
+        if statement is None or not self.info.get(REPLICA_READS):
+            return False
+        return (
+            statement.is_select and getattr(statement, '_for_update_arg', None) is None
+        )
+
+
+replica_set = ReplicaSet(
+    [
+        create_async_engine(url=replica_dsn, **get_engine_kwargs(async_dsn=True))
+        for replica_dsn in Settings.POSTGRES_REPLICA_DSNS_ASYNC
+    ],
+    retry_interval=Settings.POSTGRES_REPLICA_RETRY_INTERVAL,
 )
-engine = create_engine(url=Settings.POSTGRES_DSN, echo=Settings.POSTGRES_ECHO)
 
 async_session_factory = async_sessionmaker(
     bind=async_engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
     expire_on_commit=False,
 )
 session_factory = sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+
+
+def get_pool_stats() -> list[dict]:
+    """Get connection pools statistics of primary and replica engines."""
+    return [
+        get_pool_stat('primary', async_engine.sync_engine),
+        get_pool_stat('primary sync', engine),
+        *(
+            get_pool_stat(
+                'replica {num}'.format(num=num),
+                replica_engine.sync_engine,
+            )
+            for num, replica_engine in enumerate(replica_set.engines, start=1)
+        ),
+    ]
+
+
+def replica_reads(
+    read_handler: Callable[..., Awaitable[Any]],
+) -> Callable[..., Awaitable[Any]]:
+    """Decorate SELECT-only async handler, routing its reads to replicas.
+
+    Handler gets AsyncSession among its arguments. If replica fails, it is
+    skipped for retry interval and handler is rerun on primary.
+    """
+
+    @functools.wraps(read_handler)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: WPS430
+        """Call handler with replica reads, falling back to primary."""
+        session: AsyncSession = next(
+            arg for arg in (*args, *kwargs.values()) if isinstance(arg, AsyncSession)
+        )
+        session.info.pop(REPLICA_ENGINE, None)
+        session.info[REPLICA_READS] = True
+        try:
+            return await read_handler(*args, **kwargs)
+        except (DBAPIError, OSError) as error:
+            await use_primary_after_replica_error(session, error)
+            return await read_handler(*args, **kwargs)
+        finally:
+            session.info[REPLICA_READS] = False
+
+    return wrapper
+
+
+async def use_primary_after_replica_error(
+    session: AsyncSession,
+    error: Exception,
+) -> None:
+    """Switch replica reads session to primary after replica error.
+
+    Failed replica is skipped for retry interval. Error is reraised, if it
+    isn't connection error of statement, bound to replica.
+    """
+    replica_engine = session.info.pop(REPLICA_ENGINE, None)
+    if replica_engine is None or not is_connection_error(error):
+        raise error
+    logger.warning('Replica is not available, using primary: %s', error)
+    replica_set.mark_unhealthy(replica_engine)
+    await session.rollback()
+    session.info[REPLICA_READS] = False
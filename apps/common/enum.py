@@ -9,3 +9,27 @@ class JSENDStatus(str, Enum):
     SUCCESS = 'success'
     FAIL = 'fail'
     ERROR = 'error'
+
+
+class TrendInterval(str, Enum):
+    """Enum based class to set type of time series bucket intervals."""
+
+    DAY = 'day'
+    WEEK = 'week'
+    MONTH = 'month'
+
+
+class ExportFormat(str, Enum):
+    """Enum based class to set type of data export formats."""
+
+    NDJSON = 'ndjson'
+    CSV = 'csv'
+
+
+class AdvFacet(str, Enum):
+    """Enum based class to set type of advertisement facets."""
+
+    REGION = 'region'
+    COLOR = 'color'
+    SALON = 'salon'
+    MODEL = 'model'
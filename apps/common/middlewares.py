@@ -0,0 +1,197 @@
+"""Project middlewares."""
+
+import zlib
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing_extensions import Optional, Protocol
+
+# zlib window bits, writing gzip header and trailer.
+GZIP_WBITS = 31
+# Supported content encodings in order of preference.
+SUPPORTED_ENCODINGS = ('br', 'gzip')
+
+
+class Encoder(Protocol):
+    """Response body encoder."""
+
+    def compress(self, chunk: bytes, finish: bool) -> bytes:
+        """Compress body chunk, flushing all data compressed so far."""
+
+
+class GzipEncoder:
+    """Gzip response body encoder."""
+
+    def __init__(self, level: int) -> None:
+        """Initialize class instance."""
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+
+    def compress(self, chunk: bytes, finish: bool) -> bytes:
+        """Compress body chunk, flushing all data compressed so far."""
+        flush_mode = zlib.Z_FINISH if finish else zlib.Z_SYNC_FLUSH
+        return self._compressor.compress(chunk) + self._compressor.flush(flush_mode)
+
+
+class BrotliEncoder:
+    """Brotli response body encoder."""
+
+    def __init__(self, quality: int) -> None:
+        """Initialize class instance."""
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, chunk: bytes, finish: bool) -> bytes:
+        """Compress body chunk, flushing all data compressed so far."""
+        compressed = self._compressor.process(chunk)
+        if finish:
+            return compressed + self._compressor.finish()
+        return compressed + self._compressor.flush()
+
+
+def get_coding_quality(coding_params: str) -> float:
+    """Get quality of Accept-Encoding coding from its parameters, 1 by default."""
+    param_name, _, param_value = coding_params.partition('=')
+    if param_name.strip().lower() != 'q':
+        return 1
+    try:
+        return float(param_value)
+    except ValueError:
+        return 0
+
+
+def get_coding_qualities(accept_encoding: str) -> dict[str, float]:
+    """Get qualities of Accept-Encoding codings by lowered coding names."""
+    qualities = {}
+    for coding in accept_encoding.split(','):
+        name, _, coding_params = coding.partition(';')
+        qualities[name.strip().lower()] = get_coding_quality(coding_params)
+    return qualities
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Get supported content encoding, most preferred by Accept-Encoding, or None."""
+    qualities = get_coding_qualities(accept_encoding)
+    quality, encoding = max(
+        (
+            (qualities.get(encoding, qualities.get('*', 0)), encoding)
+            for encoding in SUPPORTED_ENCODINGS
+        ),
+        key=lambda quality_encoding: quality_encoding[0],
+    )
+    return encoding if quality > 0 else None
+
+
+class CompressionMiddleware:
+    """Compress responses with negotiated brotli or gzip content encoding.
+
+    Responses smaller than minimum_size and already encoded ones are sent
+    as is. Streaming responses are compressed chunk by chunk, each compressed
+    chunk is flushed, so clients get data as soon as it is produced.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1000,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        """Initialize class instance."""
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle ASGI request, compressing http response."""
+        if scope['type'] == 'http':
+            encoding = negotiate_encoding(
+                Headers(scope=scope).get('accept-encoding', ''),
+            )
+            if encoding is not None:
+                responder = CompressionResponder(
+                    self.app,
+                    encoding,
+                    self.get_encoder(encoding),
+                    self.minimum_size,
+                )
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+    def get_encoder(self, encoding: str) -> Encoder:
+        """Get response body encoder of given content encoding."""
+        if encoding == 'br':
+            return BrotliEncoder(self.brotli_quality)
+        return GzipEncoder(self.gzip_level)
+
+
+class CompressionResponder:
+    """Compressing sender of single response."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encoding: str,
+        encoder: Encoder,
+        minimum_size: int,
+    ) -> None:
+        """Initialize class instance."""
+        self.app = app
+        self.encoding = encoding
+        self.encoder = encoder
+        self.minimum_size = minimum_size
+        self._initial_message: Message = {}
+        self._started = False
+        self._compressing = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Call app, compressing its response."""
+        self._send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        """Send response message, compressing response body."""
+        if message['type'] == 'http.response.start':
+            self._initial_message = message
+            return
+        if message['type'] != 'http.response.body':
+            await self._send(message)
+            return
+        body = message.get('body', b'')
+        more_body = message.get('more_body', False)
+        if not self._started:
+            self._started = True
+            self._compressing = self._should_compress(body, more_body)
+            if self._compressing:
+                self._set_encoding_headers(more_body)
+        if self._compressing:
+            message['body'] = self.encoder.compress(body, finish=not more_body)
+            if not more_body:
+                self._set_content_length(message['body'])
+        if self._initial_message:
+            await self._send(self._initial_message)
+            self._initial_message = {}
+        await self._send(message)
+
+    def _should_compress(self, body: bytes, more_body: bool) -> bool:
+        """Check whether response is not encoded and big or streaming."""
+        headers = Headers(raw=self._initial_message['headers'])
+        if 'content-encoding' in headers:
+            return False
+        return more_body or len(body) >= self.minimum_size
+
+    def _set_encoding_headers(self, more_body: bool) -> None:
+        """Set content encoding headers, no content length for streaming."""
+        headers = MutableHeaders(raw=self._initial_message['headers'])
+        headers['Content-Encoding'] = self.encoding
+        headers.add_vary_header('Accept-Encoding')
+        if more_body:
+            del headers['Content-Length']  # noqa: WPS420
+
+    def _set_content_length(self, body: bytes) -> None:
+        """Set content length of not streaming compressed response."""
+        if not self._initial_message:
+            return
+        headers = MutableHeaders(raw=self._initial_message['headers'])
+        headers['Content-Length'] = str(len(body))
@@ -1,8 +1,8 @@
 """Project SQLAlchemy orm services."""
 
-from typing import Any
+from typing import Any, AsyncIterator, Iterable
 
-from sqlalchemy import Executable, Row
+from sqlalchemy import Executable, Row, RowMapping
 from sqlalchemy.engine import Result
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
@@ -62,14 +62,103 @@ class StatementExecutor:
         session.execute(statement)
         session.commit()
 
-    async def execute_fetchmany_statement(
+    async def execute_statement(
         self,
         session: AsyncSession,
         statement: Executable,
+        commit: bool = False,
+    ) -> None:
+        """Execute statement without returning data."""
+        await session.execute(statement)
+        if commit:
+            await session.commit()
+
+    def sync_execute_statement(
+        self,
+        session: Session,
+        statement: Executable,
+        commit: bool = False,
+    ) -> None:
+        """Execute statement without returning data."""
+        session.execute(statement)
+        if commit:
+            session.commit()
+
+    async def execute_fetchall_statement(
+        self,
+        session: AsyncSession,
+        statement: Executable,
+    ) -> Sequence[Row[Any]]:
+        """Execute statement returning all rows."""
+        alchemy_result: Result[Any] = await session.execute(statement)
+        return alchemy_result.all()
+
+    def sync_execute_fetchall_statement(
+        self,
+        session: Session,
+        statement: Executable,
     ) -> Sequence[Row[Any]]:
-        """Execute fetchmany statement."""
+        """Execute statement returning all rows."""
+        alchemy_result: Result[Any] = session.execute(statement)
+        return alchemy_result.all()
+
+    async def execute_dicts_statement(
+        self,
+        session: AsyncSession,
+        statement: Executable,
+    ) -> list[dict]:
+        """Execute Core select returning all rows as plain dicts.
+
+        Rows skip ORM instances, identity map and row mappings construction,
+        dicts keys are selected columns labels.
+        """
+        alchemy_result: Result[Any] = await session.execute(statement)
+        keys = tuple(alchemy_result.keys())
+        return [dict(zip(keys, row)) for row in alchemy_result]
+
+    async def execute_mapping_statement(
+        self,
+        session: AsyncSession,
+        statement: Executable,
+    ) -> RowMapping:
+        """Execute statement returning exactly one row as mapping."""
         alchemy_result: Result[Any] = await session.execute(statement)
-        return alchemy_result.fetchmany()
+        return alchemy_result.mappings().one()
+
+    async def execute_copy_records(
+        self,
+        session: AsyncSession,
+        table_name: str,
+        columns: Sequence[str],
+        records: Iterable[Sequence[Any]],
+    ) -> None:
+        """Copy records to table with asyncpg COPY, without returning data.
+
+        Records are copied in session transaction and committed with it.
+        """
+        connection = await session.connection()
+        # asyncpg transaction is begun lazily by the first statement, so COPY
+        # would be autocommitted outside of session transaction otherwise.
+        await connection.exec_driver_sql('SELECT 1')
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(  # type: ignore
+            table_name,
+            columns=list(columns),
+            records=records,
+        )
+
+    async def stream_mapping_statement(
+        self,
+        session: AsyncSession,
+        statement: Executable,
+        batch_size: int,
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """Execute statement with server side cursor, yielding batches of rows."""
+        alchemy_result = await session.stream(
+            statement.execution_options(yield_per=batch_size),
+        )
+        async for partition in alchemy_result.mappings().partitions():
+            yield partition
 
 
 statement_executor = StatementExecutor()
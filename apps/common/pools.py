@@ -0,0 +1,124 @@
+"""Project db connection pools."""
+
+import time
+from uuid import uuid4
+
+from sqlalchemy import AsyncAdaptedQueuePool, Engine, Pool, QueuePool
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import ConnectionPoolEntry
+from typing_extensions import Any
+
+from settings import Settings
+
+
+class PoolWaitStats:
+    """Connection checkout wait statistics of pool."""
+
+    def __init__(self) -> None:
+        """Initialize class instance."""
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait: float = 0
+        self.max_wait: float = 0
+
+    def add(self, wait: float) -> None:
+        """Add checkout wait seconds."""
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+
+class MeasuredPoolMixin:
+    """Pool mixin, measuring connection checkout wait time.
+
+    Wait time includes creation of new connection, if pool has no idle one.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize class instance."""
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        """Get connection from pool, measuring wait time."""
+        start_time = time.perf_counter()
+        try:
+            return super()._do_get()  # type: ignore
+        except PoolTimeoutError:
+            self.wait_stats.timeouts += 1
+            raise
+        finally:
+            self.wait_stats.add(time.perf_counter() - start_time)
+
+
+class MeasuredQueuePool(MeasuredPoolMixin, QueuePool):
+    """Queue pool, measuring connection checkout wait time."""
+
+
+class MeasuredAsyncAdaptedQueuePool(MeasuredPoolMixin, AsyncAdaptedQueuePool):
+    """Async adapted queue pool, measuring connection checkout wait time."""
+
+
+def get_prepared_statement_name() -> str:
+    """Get unique prepared statement name, not clashing on shared connections."""
+    return '__asyncpg_{uuid}__'.format(uuid=uuid4())
+
+
+def get_engine_kwargs(async_dsn: bool) -> dict:
+    """Get engine pool and statement caches keyword arguments from settings.
+
+    Compiled statements are cached per engine by query_cache_size, asyncpg
+    prepared statements are cached per connection. In PgBouncer mode asyncpg
+    prepared statements caches are disabled and prepared statements are named
+    uniquely, since server connection of transaction pool may change between
+    transactions.
+    """
+    engine_kwargs: dict[str, Any] = {
+        'echo': Settings.POSTGRES_ECHO,
+        'query_cache_size': Settings.POSTGRES_QUERY_CACHE_SIZE,
+        'poolclass': MeasuredAsyncAdaptedQueuePool if async_dsn else MeasuredQueuePool,
+        'pool_size': Settings.POSTGRES_POOL_SIZE,
+        'max_overflow': Settings.POSTGRES_MAX_OVERFLOW,
+        'pool_timeout': Settings.POSTGRES_POOL_TIMEOUT,
+        'pool_recycle': Settings.POSTGRES_POOL_RECYCLE,
+        'pool_pre_ping': Settings.POSTGRES_POOL_PRE_PING,
+    }
+    if async_dsn and Settings.POSTGRES_PGBOUNCER:
+        engine_kwargs['connect_args'] = {
+            'statement_cache_size': 0,
+            'prepared_statement_cache_size': 0,
+            'prepared_statement_name_func': get_prepared_statement_name,
+        }
+    elif async_dsn:
+        engine_kwargs['connect_args'] = {
+            'prepared_statement_cache_size': (
+                Settings.POSTGRES_PREPARED_STATEMENT_CACHE_SIZE
+            ),
+        }
+    return engine_kwargs
+
+
+def get_pool_stat(name: str, engine: Engine) -> dict:
+    """Get engine pool usage and checkout wait statistics."""
+    pool: Pool = engine.pool
+    pool_stat: dict[str, Any] = {'name': name}
+    if isinstance(pool, QueuePool):
+        pool_stat.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+        )
+    wait_stats = getattr(pool, 'wait_stats', None)
+    if isinstance(wait_stats, PoolWaitStats):
+        pool_stat.update(
+            checkouts=wait_stats.checkouts,
+            timeouts=wait_stats.timeouts,
+            avg_wait_ms=(
+                wait_stats.total_wait * 1000 / wait_stats.checkouts
+                if wait_stats.checkouts
+                else 0
+            ),
+            max_wait_ms=wait_stats.max_wait * 1000,
+        )
+    return pool_stat
@@ -0,0 +1,159 @@
+"""Project responses."""
+
+import hashlib
+import time
+from datetime import date, datetime
+from email.utils import formatdate, parsedate_to_datetime
+
+import orjson
+from fastapi import Request, Response
+from fastapi import status as http_status
+from fastapi.responses import ORJSONResponse
+from typing_extensions import Any, Optional
+
+from apps.common.cache import VersionedCache
+from apps.common.db import replica_set
+from apps.common.enum import JSENDStatus
+from settings import Settings
+
+
+class JSENDResponse(ORJSONResponse):
+    """JSEND response, serialized with orjson without schema validation.
+
+    Content is trusted database data of plain types, datetimes are rendered
+    with Z suffix like in pydantic output.
+    """
+
+    def render(self, content: Any) -> bytes:  # noqa: WPS110
+        """Render content to json bytes."""
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+
+def get_jsend_response(
+    data: Any,  # noqa: WPS110
+    message: str,
+    code: int = http_status.HTTP_200_OK,
+    status: JSENDStatus = JSENDStatus.SUCCESS,
+    **extra_fields: Any,
+) -> JSENDResponse:
+    """Get JSEND response, bypassing route response model validation.
+
+    Route response model is kept for documentation only, so data should be
+    plain dicts, lists and scalars, conforming to it.
+    """
+    return JSENDResponse(
+        content={
+            'status': status,
+            'data': data,
+            'message': message,
+            'code': code,
+            **extra_fields,
+        },
+        status_code=code,
+    )
+
+
+class ResponseValidators:
+    """ETag and Last-Modified validators of response to request."""
+
+    def __init__(
+        self,
+        request: Request,
+        etag: Optional[str] = None,
+        last_modified: Optional[float] = None,
+    ) -> None:
+        """Initialize class instance."""
+        self.request = request
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Get validators response headers, empty without validators."""
+        if self.etag is None or self.last_modified is None:
+            return {}
+        return {
+            'ETag': self.etag,
+            'Last-Modified': formatdate(self.last_modified, usegmt=True),
+            'Cache-Control': 'private, no-cache',
+        }
+
+    @property
+    def not_modified(self) -> bool:
+        """Check whether request If-None-Match or If-Modified-Since match response.
+
+        If-Modified-Since is considered only without If-None-Match.
+        """
+        if not self.headers:
+            return False
+        if_none_match = self.request.headers.get('if-none-match')
+        if if_none_match is not None:
+            return if_none_match.strip() == '*' or self._get_opaque_tag(
+                self.etag,  # type: ignore
+            ) in {self._get_opaque_tag(etag) for etag in if_none_match.split(',')}
+        if_modified_since = self.request.headers.get('if-modified-since')
+        if if_modified_since is None:
+            return False
+        try:
+            modified_since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return int(self.last_modified) <= modified_since.timestamp()  # type: ignore
+
+    def get_not_modified_response(self) -> Response:
+        """Get empty response with 304 status and validators headers."""
+        return Response(
+            status_code=http_status.HTTP_304_NOT_MODIFIED,
+            headers=self.headers,
+        )
+
+    def set_headers(self, response: Response) -> Response:
+        """Set validators headers to response."""
+        response.headers.update(self.headers)
+        return response
+
+    def _get_opaque_tag(self, etag: str) -> str:
+        """Get entity tag without weakness prefix for weak comparison."""
+        return etag.strip().removeprefix('W/')
+
+
+class ConditionalGet:
+    """Dependency, getting response validators from data version watermark.
+
+    Watermark is version of given cache, bumped by every data write path.
+    Responses may depend on current date, so it is also a part of ETag.
+    Recently changed data may be read from lagging replica, so it is not
+    validated for replica max lag seconds.
+    """
+
+    def __init__(self, cache: VersionedCache) -> None:
+        """Initialize class instance."""
+        self.cache = cache
+
+    async def __call__(self, request: Request) -> ResponseValidators:
+        """Get validators of response to request, none if watermark is unknown."""
+        watermark = await self.cache.get_watermark()
+        if watermark is None:
+            return ResponseValidators(request)
+        version, modified = watermark
+        if replica_set.engines and (
+            time.time() - modified < Settings.POSTGRES_REPLICA_MAX_LAG
+        ):
+            return ResponseValidators(request)
+        today = date.today()
+        etag_hash = hashlib.sha256(
+            '{version}:{today}:{path}?{query}'.format(
+                version=version,
+                today=today,
+                path=request.url.path,
+                query=request.url.query,
+            ).encode(),
+        ).hexdigest()
+        return ResponseValidators(
+            request,
+            etag='W/"{etag_hash}"'.format(etag_hash=etag_hash[:32]),
+            last_modified=max(
+                modified,
+                datetime.combine(today, datetime.min.time()).timestamp(),
+            ),
+        )
@@ -0,0 +1,33 @@
+"""Common apps routers."""
+
+from fastapi import APIRouter, Depends, Request
+from typing_extensions import Annotated
+
+from apps.common.db import get_pool_stats
+from apps.common.schemas import JSENDFailOutSchema, JSENDOutSchema, PoolStatOutSchema
+from apps.common.user_dependencies import get_current_admin_user
+from apps.user.models import User
+
+common_router = APIRouter()
+
+
+@common_router.get(
+    '/admin/db/pool/',
+    name='db_pool_stat',
+    response_model=JSENDOutSchema[list[PoolStatOutSchema]],
+    summary='Get database connection pools statistics.',
+    responses={
+        200: {'description': 'Successfully get connection pools statistics'},
+        422: {'model': JSENDFailOutSchema, 'description': 'ValidationError'},
+    },
+    tags=['Admin database application'],
+)
+async def get_db_pool_stat(
+    request: Request,
+    user: Annotated[User, Depends(get_current_admin_user)],
+) -> dict:
+    """Get checked out, overflow connections and checkout wait time per engine."""
+    return {
+        'data': get_pool_stats(),
+        'message': 'Get database connection pools statistics',
+    }
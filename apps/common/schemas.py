@@ -1,8 +1,16 @@
 """Common app schemas."""
 
 from fastapi import status as http_status
-from pydantic import BaseModel, ConfigDict, Field
-from typing_extensions import Annotated, Generic, Optional, Sequence, TypeVar, Union
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+from typing_extensions import (
+    Annotated,
+    Generic,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from apps.common.enum import JSENDStatus
 
@@ -25,6 +33,32 @@ class BaseOutSchema(BaseInSchema):
     """Base schema for output."""
 
 
+class SparseOutSchema(BaseOutSchema):
+    """Base schema for output, containing only requested fields."""
+
+    model_config = ConfigDict(extra='allow')
+
+
+def get_fields_out_schema(out_schema: Type[BaseModel]) -> Type[RootModel]:
+    """Get schema for output of out_schema or its sparse fieldset."""
+    return type(  # type: ignore
+        '{name}Fields'.format(name=out_schema.__name__),
+        (
+            RootModel[  # type: ignore
+                Annotated[
+                    Union[out_schema, SparseOutSchema],
+                    Field(union_mode='left_to_right'),
+                ]
+            ],
+        ),
+        {
+            '__doc__': '{name} with all or requested fields.'.format(
+                name=out_schema.__name__,
+            ),
+        },
+    )
+
+
 class JSENDOutSchema(BaseModel, Generic[SchemaVar]):
     """Output JSEND schema with success status."""
 
@@ -34,6 +68,40 @@ class JSENDOutSchema(BaseModel, Generic[SchemaVar]):
     code: int = Field(default=http_status.HTTP_200_OK)
 
 
+class JSENDPageOutSchema(JSENDOutSchema[SchemaVar], Generic[SchemaVar]):
+    """Output JSEND schema with success status and next page cursor."""
+
+    next_cursor: Annotated[
+        Optional[str],
+        Field(description='Cursor of the next page, null for the last page.'),
+    ] = None
+
+
+class PageQuerySchema(BaseInSchema):
+    """Schema for keyset pagination query string."""
+
+    limit: Annotated[
+        int,
+        Field(ge=1, le=1000, examples=[100], description='Page size.'),
+    ] = 100
+    cursor: Annotated[
+        Optional[str],
+        Field(description='Opaque cursor from previous page next_cursor.'),
+    ] = None
+
+
+class FieldsQuerySchema(BaseInSchema):
+    """Schema for sparse fieldset query string."""
+
+    fields: Annotated[
+        Optional[str],
+        Field(
+            examples=['id,price,adv_date'],
+            description='Comma separated response fields, all by default.',
+        ),
+    ] = None
+
+
 class JSENDFailOutSchema(JSENDOutSchema):
     """Output JSEND schema with fail status."""
 
@@ -48,3 +116,20 @@ class JSENDErrorOutSchema(JSENDOutSchema):
     status: JSENDStatus = Field(default=JSENDStatus.ERROR)
     data: Optional[str]  # noqa: WPS110
     code: int = Field(default=http_status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class PoolStatOutSchema(BaseOutSchema):
+    """Schema of database connection pool statistics."""
+
+    name: Annotated[str, Field(examples=['primary'], description='Engine name')]
+    size: Annotated[int, Field(description='Pool size')] = 0
+    checked_in: Annotated[int, Field(description='Idle connections')] = 0
+    checked_out: Annotated[int, Field(description='Connections in use')] = 0
+    overflow: Annotated[int, Field(description='Connections over pool size')] = 0
+    checkouts: Annotated[int, Field(description='Checkouts since start')] = 0
+    timeouts: Annotated[int, Field(description='Checkouts timed out')] = 0
+    avg_wait_ms: Annotated[
+        float,
+        Field(description='Average checkout wait, including connecting'),
+    ] = 0
+    max_wait_ms: Annotated[float, Field(description='Maximal checkout wait')] = 0
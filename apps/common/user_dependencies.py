@@ -5,16 +5,26 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing_extensions import Annotated, Sequence
+from typing_extensions import Annotated, Optional
 
+from apps.common.cache import VersionedCache
 from apps.common.common_utilities import checkers, get_token_data
 from apps.common.dependencies import get_async_session
 from apps.common.exceptions import BackendError
 from apps.common.orm_services import statement_executor
 from apps.user.models import User
 from apps.user.statements import user_crud_statements
+from settings import Settings
+
+USER_PRINCIPAL_FIELDS = ('id', 'username', 'email', 'is_active', 'is_admin')
 
 reusable_oauth = OAuth2PasswordBearer(tokenUrl='/login/', scheme_name='JWT')
+user_cache = VersionedCache(
+    namespace='user',
+    max_size=Settings.USER_CACHE_MAX_SIZE,
+    ttl=Settings.USER_CACHE_TTL,
+    redis_enabled=Settings.CACHE_REDIS_ENABLED,
+)
 
 
 async def get_user(
@@ -22,7 +32,11 @@ async def get_user(
     session: AsyncSession,
     is_admin: bool = False,
 ) -> User:
-    """Get current average or admin user with given token and is_admin flag."""
+    """Get current average or admin user with given token and is_admin flag.
+
+    User principal is cached by token subject, so returned user is not
+    attached to session and has principal fields only.
+    """
     try:
         token_data = get_token_data(token)
     except (jwt.JWTError, ValidationError):
@@ -31,16 +45,24 @@ async def get_user(
             detail='Credential verification failed',
             headers={'WWW-Authenticate': 'Bearer'},
         )
-    read_user_stmt = user_crud_statements.read_statement(
-        obj_data={'email': token_data.sub},
-    )
-    user: User | Sequence[User | None] | None = (
-        await statement_executor.execute_return_statement(
+
+    async def get_user_principal() -> Optional[dict]:  # noqa: WPS430
+        """Get principal fields of user with token subject email."""
+        read_user_stmt = user_crud_statements.read_statement(
+            obj_data={'email': token_data.sub},
+            fields=USER_PRINCIPAL_FIELDS,
+        )
+        user_rows = await statement_executor.execute_dicts_statement(
             session,
             read_user_stmt,
         )
+        return next(iter(user_rows), None)
+
+    principal = await user_cache.get_or_create(token_data.sub, get_user_principal)
+    checked_user: User = checkers.check_created_instance(
+        User(**principal) if principal else None,
+        'User',
     )
-    checked_user: User = checkers.check_created_instance(user, 'User')
     if is_admin and not checked_user.is_admin:
         raise BackendError(
             message='User is not admin user',
@@ -14,12 +14,21 @@ from apps.common.exceptions_handlers import (
     http_exception_handler,
     validation_exception_handler,
 )
+from apps.common.middlewares import CompressionMiddleware
+from apps.common.routers import common_router
 from apps.user.routers import users_router
 from settings import Settings
 from tags_metadata import metadata
 
 app = FastAPI(openapi_tags=metadata)
 
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=Settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=Settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=Settings.COMPRESSION_BROTLI_QUALITY,
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=Settings.CORS_ALLOW_ORIGINS,
@@ -45,3 +54,4 @@ app.add_exception_handler(
 app.include_router(users_router)
 app.include_router(adv_router)
 app.include_router(authorization_router)
+app.include_router(common_router)
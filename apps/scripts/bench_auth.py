@@ -0,0 +1,120 @@
+"""Per request authentication overhead benchmark.
+
+Run python3 -m apps.scripts.bench_auth 10000 100
+Given requests number is spread over given users number tokens, like
+clients, repeating requests with the same token. Token verification and
+whole get_user dependency are measured with caches cleared before every
+request and with warm caches. Benchmark users are created and rolled back,
+database data is left unchanged.
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from functools import partial
+from typing import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.authorization.auth_utilities import create_access_token
+from apps.common.common_utilities import get_token_data, token_cache
+from apps.common.db import async_session_factory
+from apps.common.user_dependencies import get_user, user_cache
+from apps.user.models import User
+
+logger = logging.getLogger(__name__)
+
+REPEATS = 5
+
+
+def create_tokens(session: AsyncSession, users_number: int) -> list[str]:
+    """Add benchmark users to session and get their access tokens."""
+    emails = ['bench_auth{num}@test.com'.format(num=num) for num in range(users_number)]
+    session.add_all(
+        User(
+            username='bench_auth{num}'.format(num=num),
+            password='password',
+            email=email,
+            is_active=True,
+        )
+        for num, email in enumerate(emails)
+    )
+    return [create_access_token(subject=email) for email in emails]
+
+
+def clear_caches() -> None:
+    """Clear verified tokens and user principals caches."""
+    token_cache.clear()
+    user_cache.local_cache.clear()
+
+
+async def measure(
+    authenticate: Callable[[str], Awaitable[object]],
+    tokens: list[str],
+    requests_number: int,
+    cached: bool,
+) -> float:
+    """Measure best of repeated authentication seconds per request."""
+    timings = []
+    for _ in range(REPEATS):
+        clear_caches()
+        start_time = time.perf_counter()
+        for num in range(requests_number):
+            if not cached:
+                clear_caches()
+            await authenticate(tokens[num % len(tokens)])
+        timings.append((time.perf_counter() - start_time) / requests_number)
+    return min(timings)
+
+
+async def verify_token(token: str) -> object:
+    """Verify token, like get_user does before reading user."""
+    return get_token_data(token)
+
+
+async def bench_authentication(
+    auth_name: str,
+    authenticate: Callable[[str], Awaitable[object]],
+    tokens: list[str],
+    requests_number: int,
+) -> None:
+    """Benchmark authentication with caches cleared before every request and warm."""
+    for cache_name, cached in (('cold', False), ('cached', True)):
+        request_time = await measure(authenticate, tokens, requests_number, cached)
+        logger.info(
+            '%s, %s: %.1f us per request, %.0f requests per second',
+            auth_name,
+            cache_name,
+            request_time * 1000000,
+            1 / request_time,
+        )
+
+
+async def bench_auth(requests_number: int, users_number: int) -> None:
+    """Benchmark authentication of given requests number by given users number."""
+    async with async_session_factory() as session:
+        tokens = create_tokens(session, users_number)
+        await session.flush()
+        for auth_name, authenticate in (
+            ('token verification', verify_token),
+            ('get_user', partial(get_user, session=session)),
+        ):
+            await bench_authentication(
+                auth_name,
+                authenticate,
+                tokens,
+                requests_number,
+            )
+        await session.rollback()
+        clear_caches()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    asyncio.run(
+        bench_auth(
+            requests_number=int(next(iter(sys.argv[1:2]), 10000)),
+            users_number=int(next(iter(sys.argv[2:3]), 100)),
+        ),
+    )
@@ -0,0 +1,111 @@
+"""Advertisement bulk creation paths benchmark.
+
+Run python3 -m apps.scripts.bench_bulk_create 10000 100000
+Every measured insertion is rolled back, database data is left unchanged.
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from datetime import date
+from typing import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.advertisements.handlers import adv_handlers
+from apps.advertisements.schemas import CreateAdvIn
+from apps.advertisements.statements import adv_stat_statements, adv_statements
+from apps.common.db import async_session_factory
+from apps.common.orm_services import statement_executor as executor
+
+logger = logging.getLogger(__name__)
+
+# Returning statement chunk size, asyncpg accepts at most 32767 arguments.
+RETURNING_CHUNK_SIZE = 3000
+
+
+class AdvList:
+    """AdvInList alike container, accepted by create_many_statement."""
+
+    def __init__(self, item_list: list[CreateAdvIn]) -> None:
+        """Initialize class instance."""
+        self.item_list = item_list
+
+
+def build_advs(rows_number: int) -> list[CreateAdvIn]:
+    """Build advertisements input schemas."""
+    return [
+        CreateAdvIn(
+            url='https://auto.ria.com/uk/auto_bench_{num}.html'.format(num=num),
+            name='Bench{name}'.format(name=num % 50),
+            price=1000 + num % 30000,
+            model='Model{model}'.format(model=num % 7),
+            region='Dnipro',
+            run=num,
+            color='red',
+            salon='hatchback',
+            seller='Seller {num}'.format(num=num),
+            adv_date=date.today().strftime('%Y-%m-%d'),
+        )
+        for num in range(rows_number)
+    ]
+
+
+async def create_returning(session: AsyncSession, advs: list[CreateAdvIn]) -> None:
+    """Create advertisements with INSERT ... RETURNING path in chunks."""
+    for start in range(0, len(advs), RETURNING_CHUNK_SIZE):
+        chunk = AdvList(advs[start : start + RETURNING_CHUNK_SIZE])  # noqa: E203
+        created_advs = await executor.execute_return_statement(
+            session,
+            adv_statements.create_many_statement(chunk),
+            many=True,
+        )
+        await executor.execute_statement(
+            session,
+            adv_stat_statements.add_stat_statement(
+                [adv.id for adv in created_advs],  # type: ignore
+            ),
+        )
+
+
+async def create_copy(session: AsyncSession, advs: list[CreateAdvIn]) -> None:
+    """Create advertisements with COPY upsert path."""
+    await adv_handlers.upsert_advs(session, advs)
+
+
+async def measure(
+    create: Callable[[AsyncSession, list[CreateAdvIn]], Awaitable[None]],
+    advs: list[CreateAdvIn],
+) -> float:
+    """Measure creation seconds, rolling created advertisements back."""
+    async with async_session_factory() as session:
+        start_time = time.perf_counter()
+        await create(session, advs)
+        elapsed = time.perf_counter() - start_time
+        await session.rollback()
+    return elapsed
+
+
+async def bench_bulk_create(rows_numbers: list[int]) -> None:
+    """Benchmark bulk creation paths with given rows numbers."""
+    for rows_number in rows_numbers:
+        advs = build_advs(rows_number)
+        for path_name, create in (
+            ('insert returning', create_returning),
+            ('copy', create_copy),
+        ):
+            elapsed = await measure(create, advs)
+            logger.info(
+                '%s rows, %s: %.2f s, %.0f rows/s',
+                rows_number,
+                path_name,
+                elapsed,
+                rows_number / elapsed,
+            )
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    rows_numbers = [int(arg) for arg in sys.argv[1:]]
+    asyncio.run(bench_bulk_create(rows_numbers or [10000]))
@@ -0,0 +1,117 @@
+"""Response compression CPU cost against bytes saved benchmark.
+
+Run python3 -m apps.scripts.bench_compression 1000 10000
+Bodies are built in memory, like period list page and ndjson export, so
+database is not used.
+"""
+
+import logging
+import sys
+import time
+from datetime import datetime, timezone
+from functools import partial
+from typing import Callable
+
+import orjson
+
+from apps.common.middlewares import BrotliEncoder, Encoder, GzipEncoder
+from apps.common.responses import get_jsend_response
+from apps.scripts.bench_bulk_create import build_advs
+from settings import Settings
+
+logger = logging.getLogger(__name__)
+
+REPEATS = 5
+GZIP_LEVELS = (1, 6, 9)
+BROTLI_QUALITIES = (1, 4, 11)
+ORJSON_LINE_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE
+
+EncoderFactory = Callable[[], Encoder]
+
+
+def build_chunks(rows_number: int, streaming: bool) -> list[bytes]:
+    """Build period page body or ndjson export chunks of given rows number."""
+    created_at = datetime.now(timezone.utc)
+    rows = [
+        {'id': num, **adv.model_dump(warnings=False), 'created_at': created_at}
+        for num, adv in enumerate(build_advs(rows_number))
+    ]
+    if not streaming:
+        return [get_jsend_response(rows, '', next_cursor=None).body]
+    return [
+        b''.join(
+            orjson.dumps(row, option=ORJSON_LINE_OPTIONS)
+            for row in rows[start : start + Settings.EXPORT_BATCH_SIZE]  # noqa: E203
+        )
+        for start in range(0, rows_number, Settings.EXPORT_BATCH_SIZE)
+    ]
+
+
+def get_encoders() -> list[tuple[str, EncoderFactory]]:
+    """Get names and factories of measured encoders."""
+    encoders: list[tuple[str, EncoderFactory]] = [
+        ('gzip {level}'.format(level=level), partial(GzipEncoder, level))
+        for level in GZIP_LEVELS
+    ]
+    encoders.extend(
+        ('br {quality}'.format(quality=quality), partial(BrotliEncoder, quality))
+        for quality in BROTLI_QUALITIES
+    )
+    return encoders
+
+
+def compress_chunks(encoder: Encoder, chunks: list[bytes]) -> int:
+    """Compress body chunks like streaming response, get compressed size."""
+    return sum(
+        len(encoder.compress(chunk, finish=num == len(chunks) - 1))
+        for num, chunk in enumerate(chunks)
+    )
+
+
+def measure(
+    create_encoder: EncoderFactory,
+    chunks: list[bytes],
+) -> tuple[float, int]:
+    """Measure best of repeated compression seconds and compressed size."""
+    timings = []
+    for _ in range(REPEATS):
+        encoder = create_encoder()
+        start_time = time.process_time()
+        compressed_size = compress_chunks(encoder, chunks)
+        timings.append(time.process_time() - start_time)
+    return min(timings), compressed_size
+
+
+def bench_body(body_label: str, chunks: list[bytes]) -> None:
+    """Benchmark compression of body chunks by every encoder."""
+    body_size = sum(len(chunk) for chunk in chunks)
+    for encoder_name, create_encoder in get_encoders():
+        elapsed, compressed_size = measure(create_encoder, chunks)
+        logger.info(
+            '%s, %s: %.1f ms CPU, %s -> %s bytes, %.1f%% saved',
+            body_label,
+            encoder_name,
+            elapsed * 1000,
+            body_size,
+            compressed_size,
+            100 - compressed_size * 100 / body_size,
+        )
+
+
+def bench_compression(rows_numbers: list[int]) -> None:
+    """Benchmark compression of bodies with given rows numbers."""
+    for rows_number in rows_numbers:
+        for body_name, streaming in (('page', False), ('ndjson stream', True)):
+            bench_body(
+                '{rows_number} rows {body_name}'.format(
+                    rows_number=rows_number,
+                    body_name=body_name,
+                ),
+                build_chunks(rows_number, streaming),
+            )
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    rows_numbers = [int(arg) for arg in sys.argv[1:]]
+    bench_compression(rows_numbers or [1000])
@@ -0,0 +1,127 @@
+"""Advertisement JSEND response serialization paths benchmark.
+
+Run python3 -m apps.scripts.bench_jsend_response 1000 10000
+Benchmark advertisements are created and rolled back, database data is left
+unchanged.
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from datetime import date
+from typing import Awaitable, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.advertisements.handlers import adv_handlers
+from apps.advertisements.schemas import ADV_OUT_FIELDS, AdvPeriodQuerySchema
+from apps.advertisements.statements import adv_statements
+from apps.common.db import async_session_factory
+from apps.common.orm_services import statement_executor as executor
+from apps.common.responses import get_jsend_response
+from apps.main import app
+from apps.scripts.bench_bulk_create import build_advs
+
+logger = logging.getLogger(__name__)
+
+REPEATS = 5
+
+
+def get_period_route() -> APIRoute:
+    """Get advertisement period list route, having JSEND response model."""
+    return next(
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.name == 'adv_period'
+    )
+
+
+async def render_validated(
+    session: AsyncSession,
+    period: AdvPeriodQuerySchema,
+    rows_number: int,
+) -> bytes:
+    """Render ORM objects page, validated against route response model."""
+    advs = await executor.execute_return_statement(
+        session,
+        adv_statements.period_list_statement(period=period, limit=rows_number),
+        many=True,
+    )
+    response_content = await serialize_response(
+        field=get_period_route().response_field,
+        response_content={'data': advs, 'next_cursor': None, 'message': ''},
+    )
+    return JSONResponse(response_content).body
+
+
+async def render_fast(
+    session: AsyncSession,
+    period: AdvPeriodQuerySchema,
+    rows_number: int,
+) -> bytes:
+    """Render result rows dicts page with orjson, skipping validation."""
+    rows = await executor.execute_dicts_statement(
+        session,
+        adv_statements.period_list_statement(
+            period=period,
+            limit=rows_number,
+            fields=ADV_OUT_FIELDS,
+        ),
+    )
+    return get_jsend_response(rows, '', next_cursor=None).body
+
+
+async def measure(
+    render: Callable[[AsyncSession, AdvPeriodQuerySchema, int], Awaitable[bytes]],
+    session: AsyncSession,
+    period: AdvPeriodQuerySchema,
+    rows_number: int,
+) -> float:
+    """Measure best of repeated fetching and rendering seconds."""
+    timings = []
+    for _ in range(REPEATS):
+        session.expunge_all()
+        start_time = time.perf_counter()
+        await render(session, period, rows_number)
+        timings.append(time.perf_counter() - start_time)
+    return min(timings)
+
+
+async def bench_rows_number(
+    session: AsyncSession,
+    period: AdvPeriodQuerySchema,
+    rows_number: int,
+) -> None:
+    """Benchmark JSEND response paths with given rows number."""
+    for path_name, render in (
+        ('validated', render_validated),
+        ('orjson', render_fast),
+    ):
+        elapsed = await measure(render, session, period, rows_number)
+        logger.info(
+            '%s rows, %s: %.1f ms, %.0f rows/s',
+            rows_number,
+            path_name,
+            elapsed * 1000,
+            rows_number / elapsed,
+        )
+
+
+async def bench_jsend_response(rows_numbers: list[int]) -> None:
+    """Benchmark JSEND response paths with given rows numbers."""
+    today = date.today().strftime('%Y-%m-%d')
+    period = AdvPeriodQuerySchema(begin=today, end=today)
+    async with async_session_factory() as session:
+        await adv_handlers.upsert_advs(session, build_advs(max(rows_numbers)))
+        for rows_number in rows_numbers:
+            await bench_rows_number(session, period, rows_number)
+        await session.rollback()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    rows_numbers = [int(arg) for arg in sys.argv[1:]]
+    asyncio.run(bench_jsend_response(rows_numbers or [1000]))
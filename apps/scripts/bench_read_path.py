@@ -0,0 +1,127 @@
+"""Advertisement ORM and Core dicts read paths benchmark.
+
+Run python3 -m apps.scripts.bench_read_path 10000
+Measures fetching latency and memory of period page rows, and request
+latency of fetching and rendering them. Benchmark advertisements are created
+and rolled back, database data is left unchanged.
+"""
+
+import asyncio
+import logging
+import sys
+import time
+import tracemalloc
+from datetime import date
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.advertisements.handlers import adv_handlers
+from apps.advertisements.schemas import ADV_OUT_FIELDS, AdvPeriodQuerySchema
+from apps.advertisements.statements import adv_statements
+from apps.common.db import async_session_factory
+from apps.common.orm_services import statement_executor as executor
+from apps.scripts.bench_bulk_create import build_advs
+from apps.scripts.bench_jsend_response import render_fast, render_validated
+
+logger = logging.getLogger(__name__)
+
+REPEATS = 5
+
+
+async def fetch_orm(
+    session: AsyncSession,
+    period: AdvPeriodQuerySchema,
+    rows_number: int,
+) -> Any:
+    """Fetch period page as identity mapped Advertisement instances."""
+    return await executor.execute_return_statement(
+        session,
+        adv_statements.period_list_statement(period=period, limit=rows_number),
+        many=True,
+    )
+
+
+async def fetch_dicts(
+    session: AsyncSession,
+    period: AdvPeriodQuerySchema,
+    rows_number: int,
+) -> Any:
+    """Fetch period page as plain dicts of output fields."""
+    return await executor.execute_dicts_statement(
+        session,
+        adv_statements.period_list_statement(
+            period=period,
+            limit=rows_number,
+            fields=ADV_OUT_FIELDS,
+        ),
+    )
+
+
+async def measure(
+    read: Callable[[AsyncSession, AdvPeriodQuerySchema, int], Awaitable[Any]],
+    session: AsyncSession,
+    period: AdvPeriodQuerySchema,
+    rows_number: int,
+) -> float:
+    """Measure best of repeated read seconds."""
+    timings = []
+    for _ in range(REPEATS):
+        session.expunge_all()
+        start_time = time.perf_counter()
+        await read(session, period, rows_number)
+        timings.append(time.perf_counter() - start_time)
+    return min(timings)
+
+
+async def measure_memory(
+    fetch: Callable[[AsyncSession, AdvPeriodQuerySchema, int], Awaitable[Any]],
+    session: AsyncSession,
+    period: AdvPeriodQuerySchema,
+    rows_number: int,
+) -> int:
+    """Measure bytes, held by fetched rows and session identity map."""
+    session.expunge_all()
+    tracemalloc.start()
+    rows = await fetch(session, period, rows_number)
+    held_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del rows  # noqa: WPS420
+    return held_size
+
+
+async def bench_rows_number(
+    session: AsyncSession,
+    period: AdvPeriodQuerySchema,
+    rows_number: int,
+) -> None:
+    """Benchmark read paths with given rows number."""
+    for path_name, fetch, render in (
+        ('orm', fetch_orm, render_validated),
+        ('dicts', fetch_dicts, render_fast),
+    ):
+        logger.info(
+            '%s rows, %s: fetch %.1f ms, request %.1f ms, %.0f KiB held',
+            rows_number,
+            path_name,
+            await measure(fetch, session, period, rows_number) * 1000,
+            await measure(render, session, period, rows_number) * 1000,
+            await measure_memory(fetch, session, period, rows_number) / 1024,
+        )
+
+
+async def bench_read_path(rows_numbers: list[int]) -> None:
+    """Benchmark read paths with given rows numbers."""
+    today = date.today().strftime('%Y-%m-%d')
+    period = AdvPeriodQuerySchema(begin=today, end=today)
+    async with async_session_factory() as session:
+        await adv_handlers.upsert_advs(session, build_advs(max(rows_numbers)))
+        for rows_number in rows_numbers:
+            await bench_rows_number(session, period, rows_number)
+        await session.rollback()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    rows_numbers = [int(arg) for arg in sys.argv[1:]]
+    asyncio.run(bench_read_path(rows_numbers or [10000]))
@@ -0,0 +1,219 @@
+"""Hot statements construction and execution per call overhead benchmark.
+
+Run python3 -m apps.scripts.bench_statements 1000
+Plain select statements, built from scratch on every call, as statements did
+before lambda caching, are compared with cached lambda statements. Only
+selects are executed, database data is left unchanged.
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from datetime import date, timedelta
+from typing import Callable
+
+from sqlalchemy import Executable, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.advertisements.adv_utilities import (
+    EMPTY_STAT_MAX_PRICE,
+    EMPTY_STAT_MIN_PRICE,
+    adv_auxiliary_func,
+)
+from apps.advertisements.models import Advertisement, AdvertisementStat
+from apps.advertisements.schemas import (
+    AdvNameModelQuerySchema,
+    AdvPeriodQuerySchema,
+    UrlSchema,
+)
+from apps.advertisements.statements import adv_stat_statements, adv_statements
+from apps.common.db import async_session_factory
+from apps.user.models import User
+from apps.user.statements import user_crud_statements
+
+logger = logging.getLogger(__name__)
+
+REPEATS = 5
+
+StatementBuild = Callable[[int], Executable]
+
+
+def get_period(begin: date) -> AdvPeriodQuerySchema:
+    """Get period query from given begin date to today."""
+    return AdvPeriodQuerySchema(
+        begin=begin.isoformat(),
+        end=date.today().isoformat(),
+    )
+
+
+def get_car_info(num: int) -> AdvNameModelQuerySchema:
+    """Get name/model query of given advertisement number."""
+    return AdvNameModelQuerySchema(
+        name='bench{name}'.format(name=num % 50),
+        model='model{model}'.format(model=num % 7),
+    )
+
+
+def plain_user_statement(num: int) -> Executable:
+    """Build user lookup select from scratch."""
+    statement = select(User)
+    for key, value_data in {'email': 'bench{num}@test.com'.format(num=num)}.items():
+        statement = statement.where(getattr(User, key) == value_data)
+    return statement
+
+
+def plain_url_statement(num: int) -> Executable:
+    """Build advertisement by url select from scratch."""
+    url = UrlSchema(url='auto_bench_{num}'.format(num=num))
+    return select(Advertisement).filter(Advertisement.url_slug == url.url)
+
+
+def plain_stat_statement(num: int) -> Executable:
+    """Build rollup stat select from scratch."""
+    car_info = get_car_info(num)
+    day_ago, week_ago, month_ago = adv_auxiliary_func.get_stat_dates()
+    return select(
+        func.coalesce(func.min(AdvertisementStat.min_price), EMPTY_STAT_MIN_PRICE),
+        func.coalesce(func.max(AdvertisementStat.max_price), EMPTY_STAT_MAX_PRICE),
+        func.sum(AdvertisementStat.adv_count).filter(
+            AdvertisementStat.adv_date >= day_ago,
+        ),
+        func.sum(AdvertisementStat.adv_count).filter(
+            AdvertisementStat.adv_date >= week_ago,
+        ),
+        func.sum(AdvertisementStat.adv_count).filter(
+            AdvertisementStat.adv_date >= month_ago,
+        ),
+    ).where(
+        AdvertisementStat.name == car_info.name.lower(),  # type: ignore
+        AdvertisementStat.model == car_info.model.lower(),  # type: ignore
+    )
+
+
+def plain_period_statement(num: int) -> Executable:
+    """Build period list keyset page select from scratch."""
+    begin = date.today() - timedelta(days=num % 30)
+    period = get_period(begin)
+    keyset = tuple_(Advertisement.adv_date, Advertisement.id)
+    select_statement = (
+        select(Advertisement)
+        .filter(Advertisement.adv_date >= period.begin)
+        .filter(Advertisement.adv_date <= period.end)
+        .where(keyset > tuple_(begin, num))
+    )
+    return (
+        select_statement.order_by(
+            Advertisement.adv_date.asc().nulls_first(),
+            Advertisement.id.asc(),
+        )
+        .limit(20)
+        .execution_options(populate_existing=True)
+    )
+
+
+def cached_user_statement(num: int) -> Executable:
+    """Get cached user lookup statement."""
+    return user_crud_statements.read_statement(
+        obj_data={'email': 'bench{num}@test.com'.format(num=num)},
+    )
+
+
+def cached_url_statement(num: int) -> Executable:
+    """Get cached advertisement by url statement."""
+    return adv_statements.get_adv_by_url_statement(
+        UrlSchema(url='auto_bench_{num}'.format(num=num)),
+    )
+
+
+def cached_stat_statement(num: int) -> Executable:
+    """Get cached rollup stat statement."""
+    return adv_stat_statements.name_model_stat_statement(
+        car_info=get_car_info(num),
+        stat_dates=adv_auxiliary_func.get_stat_dates(),
+    )
+
+
+def cached_period_statement(num: int) -> Executable:
+    """Get cached period list keyset page statement."""
+    begin = date.today() - timedelta(days=num % 30)
+    return adv_statements.period_list_statement(
+        period=get_period(begin),
+        after=(begin, num),
+        limit=20,
+    )
+
+
+STATEMENTS = (
+    ('user lookup', plain_user_statement, cached_user_statement),
+    ('url lookup', plain_url_statement, cached_url_statement),
+    ('stat', plain_stat_statement, cached_stat_statement),
+    ('period list', plain_period_statement, cached_period_statement),
+)
+
+
+def measure_build(build: StatementBuild, calls: int) -> float:
+    """Measure best of repeated statement building and cache key seconds per call.
+
+    Cache key is generated by every execution to find compiled statement.
+    """
+    timings = []
+    for _ in range(REPEATS):
+        start_time = time.perf_counter()
+        for num in range(calls):
+            build(num)._generate_cache_key()  # noqa: WPS437
+        timings.append((time.perf_counter() - start_time) / calls)
+    return min(timings)
+
+
+async def measure_execute(
+    session: AsyncSession,
+    build: StatementBuild,
+    calls: int,
+) -> float:
+    """Measure best of repeated statement execution seconds per call."""
+    timings = []
+    for _ in range(REPEATS):
+        start_time = time.perf_counter()
+        for num in range(calls):
+            (await session.execute(build(num))).all()
+        timings.append((time.perf_counter() - start_time) / calls)
+    return min(timings)
+
+
+async def bench_statement(
+    session: AsyncSession,
+    statement_name: str,
+    builds: tuple[StatementBuild, StatementBuild],
+    calls: int,
+) -> None:
+    """Benchmark plain and lambda builds of statement with given calls number."""
+    for build_name, build in zip(('plain', 'lambda'), builds):
+        build_time = measure_build(build, calls)
+        execute_time = await measure_execute(session, build, calls)
+        logger.info(
+            '%s, %s: build %.1f us, execute %.1f us per call',
+            statement_name,
+            build_name,
+            build_time * 1000000,
+            execute_time * 1000000,
+        )
+
+
+async def bench_statements(calls: int) -> None:
+    """Benchmark hot statements with given calls number."""
+    async with async_session_factory() as session:
+        for statement_name, plain_build, cached_build in STATEMENTS:
+            await bench_statement(
+                session,
+                statement_name,
+                (plain_build, cached_build),
+                calls,
+            )
+        await session.rollback()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    calls = int(next(iter(sys.argv[1:]), 1000))
+    asyncio.run(bench_statements(calls))
@@ -0,0 +1,27 @@
+"""Advertisement statistics rollup rebuilding."""
+
+import logging
+
+from apps.advertisements.handlers import adv_handlers
+from apps.common.dependencies import get_session
+
+logger = logging.getLogger(__name__)
+
+
+def rebuild_adv_stat_logic() -> None:
+    """Recompute advertisement statistics rollup from scratch."""
+    session = next(get_session())
+    adv_handlers.sync_refresh_stat(session, commit=True)
+    logger.info('Advertisement statistics rollup successfully rebuilt.')
+
+
+def rebuild_adv_stat() -> None:
+    """Rebuild advertisement statistics rollup with catching errors."""
+    try:
+        rebuild_adv_stat_logic()
+    except Exception as ex:
+        logger.info(str(ex))
+
+
+if __name__ == '__main__':
+    rebuild_adv_stat()
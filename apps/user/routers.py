@@ -7,6 +7,7 @@ from typing_extensions import Annotated
 from apps.common.base_routers import BaseRouterInitializer
 from apps.common.dependencies import get_async_session
 from apps.common.schemas import JSENDFailOutSchema, JSENDOutSchema
+from apps.common.user_dependencies import user_cache
 from apps.user.handlers import user_handlers
 from apps.user.models import User
 from apps.user.schemas import (
@@ -20,7 +21,16 @@ from apps.user.schemas import (
 
 users_router = APIRouter()
 
-admin_user_router_initializer = BaseRouterInitializer(  # type: ignore
+
+class UserRouterInitializer(BaseRouterInitializer):
+    """Admin user router initializer, keeping cached user principals in sync."""
+
+    async def after_commit(self) -> None:
+        """Invalidate cached user principals."""
+        await user_cache.invalidate()
+
+
+admin_user_router_initializer = UserRouterInitializer(  # type: ignore
     router=users_router,
     in_schemas=(CreateAdminUserIn, AdminUserIn, AdminPartiallyUserIn),
     out_schema=AdminUserOut,
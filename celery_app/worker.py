@@ -4,7 +4,10 @@ from celery import Celery
 from celery.schedules import crontab
 
 from settings import Settings
-from spider.project_utilities.save_utilities import remove_old_adv
+from spider.project_utilities.save_utilities import (
+    create_adv_partitions,
+    remove_old_adv,
+)
 from spider.scripts import run_crawler
 
 celery = Celery(__name__)
@@ -20,6 +23,13 @@ celery.conf.beat_schedule = {
             minute=Settings.CLEAN_TIME_MINUTE,
         ),
     },
+    'create_partitions': {
+        'task': 'create_partitions',
+        'schedule': crontab(
+            hour=Settings.PARTITION_TIME_HOUR,
+            minute=Settings.PARTITION_TIME_MINUTE,
+        ),
+    },
     'scrap': {
         'task': 'scrap',
         'schedule': crontab(
@@ -40,3 +50,9 @@ def scrap() -> None:
 def clean_db() -> None:
     """Clean db from old advertisements task."""
     remove_old_adv()
+
+
+@celery.task(name='create_partitions')
+def create_partitions() -> None:
+    """Create advertisement partitions for days ahead task."""
+    create_adv_partitions()
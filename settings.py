@@ -49,6 +49,17 @@ class MainSettings(BaseSettings):
     POSTGRES_PORT: int = Field(default=5432)
     POSTGRES_DSN: URL | str = Field(default='')
     POSTGRES_DSN_ASYNC: URL | str = Field(default='')
+    POSTGRES_POOL_SIZE: int = Field(default=5)
+    POSTGRES_MAX_OVERFLOW: int = Field(default=10)
+    POSTGRES_POOL_TIMEOUT: float = Field(default=30)
+    POSTGRES_POOL_RECYCLE: int = Field(default=-1)
+    POSTGRES_POOL_PRE_PING: bool = Field(default=False)
+    POSTGRES_PGBOUNCER: bool = Field(default=False)
+    POSTGRES_QUERY_CACHE_SIZE: int = Field(default=500)
+    POSTGRES_PREPARED_STATEMENT_CACHE_SIZE: int = Field(default=500)
+    POSTGRES_REPLICA_DSNS_ASYNC: list[str] = Field(default=[])
+    POSTGRES_REPLICA_RETRY_INTERVAL: float = Field(default=30)
+    POSTGRES_REPLICA_MAX_LAG: float = Field(default=5)
 
     # BACK-END SETTINGS
     DEBUG: bool = Field(default=False)
@@ -86,12 +97,47 @@ class MainSettings(BaseSettings):
     CELERY_BROKER_REDIS_URL: str = Field(default='')
     CELERY_RESULT_BACKEND: str = Field(default='')
 
+    # CACHE SETTINGS
+    CACHE_REDIS_ENABLED: bool = Field(default=True)
+    CACHE_REDIS_TIMEOUT: float = Field(default=0.5)
+    STAT_CACHE_TTL: int = Field(default=3600)
+    STAT_CACHE_MAX_SIZE: int = Field(default=1024)
+    USER_CACHE_TTL: int = Field(default=60)
+    USER_CACHE_MAX_SIZE: int = Field(default=4096)
+    TOKEN_CACHE_MAX_SIZE: int = Field(default=10000)
+
+    # COMPRESSION SETTINGS
+    COMPRESSION_MINIMUM_SIZE: int = Field(default=1000)
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6)
+    COMPRESSION_BROTLI_QUALITY: int = Field(default=4)
+
+    # STATISTICS SETTINGS
+    PRICE_HISTOGRAM_BUCKETS: int = Field(default=10)
+    FACET_TOP_K: int = Field(default=10)
+
+    # EXPORT SETTINGS
+    EXPORT_BATCH_SIZE: int = Field(default=1000)
+
+    # SEARCH SETTINGS
+    SEARCH_TRIGRAM_ENABLED: bool = Field(default=False)
+
+    # PARTITION SETTINGS
+    ADV_PARTITION_PREMAKE_DAYS: int = Field(default=7)
+    ADV_PARTITION_LOCK_TIMEOUT: int = Field(default=5000)
+
+    # CLEANING SETTINGS
+    ADV_DELETE_CHUNK_SIZE: int = Field(default=10000)
+    ADV_DELETE_CHUNK_SLEEP: float = Field(default=0.1)
+    ADV_DELETE_REQUEST_MAX_CHUNKS: int = Field(default=10)
+
     # SCRAP TIMEOUT
     SCRAP_TIMEOUT: int = Field(default=1)
     CLEAN_TIME_HOUR: str = Field(default='6')
     CLEAN_TIME_MINUTE: str = Field(default='0')
     SCRAP_TIME_HOUR: str = Field(default='7')
     SCRAP_TIME_MINUTE: str = Field(default='0')
+    PARTITION_TIME_HOUR: str = Field(default='5')
+    PARTITION_TIME_MINUTE: str = Field(default='0')
 
     # LOGGING SETTINGS
     LOG_LEVEL: int = Field(default=logging.WARNING)
@@ -17,7 +17,7 @@ def save_adv_data_to_db(adv_data: dict) -> None:
     """Save data to db."""
     session = next(get_session())
     schema = CreateAdvIn(**adv_data)
-    adv_handlers.create_adv(session, schema)
+    adv_handlers.upsert_adv(session, schema)
 
 
 def save_adv_data(adv_data: dict) -> str:
@@ -30,18 +30,47 @@ def save_adv_data(adv_data: dict) -> str:
     return message
 
 
-def remove_old_adv_from_db() -> None:
-    """Remove data older than yesterday."""
+def remove_old_adv_from_db() -> dict:
+    """Remove data older than yesterday in chunks."""
     day_ago = datetime.now(timezone.utc) + relativedelta(days=-1)
     session = next(get_session())
-    adv_handlers.delete_old_adv(session, day_ago)
+    return adv_handlers.delete_old_adv(
+        session,
+        day_ago,
+        chunk_size=Settings.ADV_DELETE_CHUNK_SIZE,
+        chunk_sleep=Settings.ADV_DELETE_CHUNK_SLEEP,
+    )
 
 
 def remove_old_adv() -> str:
     """Remove old advertisements with catching errors."""
-    message = 'Successfully removed advertisements, created earlier than 24 hours ago'
     try:
-        remove_old_adv_from_db()
+        delete_report = remove_old_adv_from_db()
+    except Exception as ex:
+        return str(ex)
+    return ''.join(
+        (
+            'Successfully removed {deleted_count} advertisements, '.format(
+                deleted_count=delete_report['deleted_count'],
+            ),
+            'last seen before yesterday, {rows_per_second} rows per second'.format(
+                rows_per_second=delete_report['rows_per_second'],
+            ),
+        ),
+    )
+
+
+def create_adv_partitions_in_db() -> None:
+    """Create advertisement partitions for days ahead."""
+    session = next(get_session())
+    adv_handlers.create_partitions(session, Settings.ADV_PARTITION_PREMAKE_DAYS)
+
+
+def create_adv_partitions() -> str:
+    """Create advertisement partitions with catching errors."""
+    message = 'Successfully created advertisement partitions for days ahead'
+    try:
+        create_adv_partitions_in_db()
     except Exception as ex:
         message = str(ex)
     return message
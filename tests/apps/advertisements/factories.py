@@ -1,5 +1,7 @@
 """Advertisement model factories."""
 
+from uuid import uuid4
+
 import factory
 from pytz import utc
 
@@ -11,7 +13,9 @@ class AdvertisementFactory(BaseModelFactory):
     """Advertisement model factory."""
 
     id = factory.Sequence(lambda idx: idx + 3000)
-    url = factory.Faker('uri')
+    url = factory.LazyFunction(
+        lambda: 'https://auto.ria.com/uk/auto_{uuid}.html'.format(uuid=uuid4().hex),
+    )
     name = factory.Faker('city')
     price = factory.Faker('pyint')
     model = factory.Faker('country')
@@ -22,6 +26,7 @@ class AdvertisementFactory(BaseModelFactory):
     seller = factory.Faker('first_name')
     adv_date = factory.Faker('date')
     created_at = factory.Faker('date_time', tzinfo=utc)
+    last_seen_at = factory.SelfAttribute('created_at')
 
     @classmethod
     def _setup_next_sequence(cls) -> int:
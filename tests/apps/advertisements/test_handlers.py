@@ -1,32 +1,104 @@
 """Module for testing advertisement apps handlers."""
 
-from typing import Sequence, Sized
+import json
+from datetime import date, datetime, time, timedelta
+from typing import Any, Sequence
 
 import factory
+import pytest
 from faker import Faker
 from fastapi import Request
-from sqlalchemy.ext.asyncio import AsyncSession
+from pytz import utc
+from sqlalchemy import NullPool, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
 
+from apps.advertisements.adv_utilities import (
+    EMPTY_STAT_MAX_PRICE,
+    EMPTY_STAT_MIN_PRICE,
+    adv_stat_cache,
+)
 from apps.advertisements.handlers import adv_handlers
 from apps.advertisements.models import Advertisement
 from apps.advertisements.schemas import (
+    AdvExportQuerySchema,
+    AdvFacetQuerySchema,
     AdvInList,
     AdvNameModelQuerySchema,
     AdvPeriodQuerySchema,
+    AdvSearchQuerySchema,
+    AdvTrendQuerySchema,
     CreateAdvIn,
+    UrlSchema,
 )
+from apps.advertisements.statements import adv_stat_statements, adv_statements
+from apps.common.db import replica_set
+from apps.common.enum import AdvFacet
+from apps.common.schemas import PageQuerySchema
+from settings import Settings
 from tests.apps.advertisements.factories import AdvertisementFactory
 
 
-class TestAdvHandlersGetAdvPeriodList:
-    """Test get_adv_period_list of AdvHandlers class."""
+async def get_period_advs(
+    session: AsyncSession,
+    period: AdvPeriodQuerySchema,
+    limit: int = 1000,
+) -> list[dict]:
+    """Get all period advertisements, paging through get_adv_period_page."""
+    advs: list[dict] = []
+    cursor = None
+    while True:  # noqa: WPS457
+        page, cursor = await adv_handlers.get_adv_period_page(
+            Request({'type': 'http'}),
+            session,
+            period,
+            PageQuerySchema(limit=limit, cursor=cursor),
+        )
+        advs.extend(page)
+        if cursor is None:
+            return advs
+
+
+class TestAdvHandlersGetAdvPeriodPage:
+    """Test get_adv_period_page of AdvHandlers class."""
+
+    async def test_get_adv_period_page(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+    ) -> None:
+        """Test get_adv_period_page method continues from cursor."""
+        adv_date = faker.date_between(start_date='-300d', end_date='-200d')
+        period = AdvPeriodQuerySchema(
+            begin=adv_date.strftime('%Y-%m-%d'),
+            end=adv_date.strftime('%Y-%m-%d'),
+        )
+        AdvertisementFactory.create_batch(3, adv_date=adv_date)
+        expected_ids = sorted(
+            adv['id'] for adv in await get_period_advs(db_session, period)
+        )
+        first_page, cursor = await adv_handlers.get_adv_period_page(
+            Request({'type': 'http'}),
+            db_session,
+            period,
+            PageQuerySchema(limit=len(expected_ids) - 1),
+        )
+        assert cursor is not None
+        last_page, last_cursor = await adv_handlers.get_adv_period_page(
+            Request({'type': 'http'}),
+            db_session,
+            period,
+            PageQuerySchema(limit=len(expected_ids) - 1, cursor=cursor),
+        )
+        assert last_cursor is None
+        assert [adv['id'] for adv in (*first_page, *last_page)] == expected_ids
 
-    async def test_get_adv_period_list(
+    async def test_get_adv_period_page_filters_period(
         self,
         faker: Faker,
         db_session: AsyncSession,
     ) -> None:
-        """Test get_adv_period_list method."""
+        """Test get_adv_period_page pages only advertisements of given period."""
         number = faker.random_int(min=3, max=5)
         start_date = faker.date_between(start_date='-50d', end_date='-30d')
         end_date = faker.date_between(start_date='-20d', end_date='-10d')
@@ -34,11 +106,7 @@ class TestAdvHandlersGetAdvPeriodList:
             begin=start_date.strftime('%Y-%m-%d'),
             end=end_date.strftime('%Y-%m-%d'),
         )
-        already_in_db = await adv_handlers.get_adv_period_list(
-            Request({'type': 'http'}),
-            db_session,
-            period,
-        )
+        already_in_db = await get_period_advs(db_session, period)
         expected_result: list[Advertisement] = []
         for _ in range(1, number + 1):
             expected_result.append(
@@ -50,17 +118,77 @@ class TestAdvHandlersGetAdvPeriodList:
                 adv_date=faker.date_between(start_date='-60d', end_date='-51d'),
             )
             AdvertisementFactory(adv_date=faker.date_between(start_date='-9d'))
-        actual_result = await adv_handlers.get_adv_period_list(
-            Request({'type': 'http'}),
-            db_session,
-            period,
+        actual_result = await get_period_advs(db_session, period, limit=2)
+        assert {adv['id'] for adv in actual_result} - {
+            adv['id'] for adv in already_in_db
+        } == {elem.id for elem in expected_result}
+
+
+class TestStreamAdvPeriod:
+    """Test stream_adv_period of AdvHandlers class."""
+
+    async def test_stream_adv_period_replica_fallback(
+        self,
+        faker: Faker,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test export is streamed from primary, if replica fails at start."""
+        replica_engine = create_async_engine(
+            url=Settings.POSTGRES_DSN_ASYNC.set(port=1),  # type: ignore
+            poolclass=NullPool,
         )
-        assert isinstance(actual_result, Sequence)
-        assert isinstance(already_in_db, Sized)
-        for index, elem in enumerate(expected_result):
-            assert (
-                elem.id == actual_result[index + len(already_in_db)].id  # type: ignore
+        monkeypatch.setattr(replica_set, 'engines', [replica_engine])
+        monkeypatch.setattr(replica_set, '_unhealthy_until', {})
+        monkeypatch.setattr(Settings, 'EXPORT_BATCH_SIZE', 2)
+        adv_date = faker.date_between(start_date='+300d', end_date='+400d')
+        expected_ids = [
+            adv.id for adv in AdvertisementFactory.create_batch(3, adv_date=adv_date)
+        ]
+        chunks = [
+            chunk
+            async for chunk in adv_handlers.stream_adv_period(
+                Request({'type': 'http'}),
+                AdvExportQuerySchema(
+                    begin=adv_date.strftime('%Y-%m-%d'),
+                    end=adv_date.strftime('%Y-%m-%d'),
+                ),
+            )
+        ]
+        lines = ''.join(chunks).splitlines()
+        actual_ids = [json.loads(line)['id'] for line in lines]
+        assert set(expected_ids) <= set(actual_ids)
+        assert replica_set.get_engine() is None
+        await replica_engine.dispose()
+
+
+class TestSearchAdv:
+    """Test search_adv of AdvHandlers class."""
+
+    async def test_search_adv(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+    ) -> None:
+        """Test search_adv pages through prefix matches, ordered by rank."""
+        word = faker.pystr(min_chars=12, max_chars=12).lower()
+        expected_result = [
+            AdvertisementFactory(name=word, model=word, region=word),
+            AdvertisementFactory(name=word, model=word),
+            AdvertisementFactory(name=word),
+        ]
+        AdvertisementFactory(name=word[:6])
+        advs, cursor = [], None
+        while True:  # noqa: WPS457
+            page, cursor = await adv_handlers.search_adv(
+                Request({'type': 'http'}),
+                db_session,
+                AdvSearchQuerySchema(q=word[:8].upper()),
+                PageQuerySchema(limit=2, cursor=cursor),
             )
+            advs.extend(page)
+            if cursor is None:
+                break
+        assert [adv['id'] for adv in advs] == [adv.id for adv in expected_result]
 
 
 class TestGetNameModelStat:
@@ -70,6 +198,7 @@ class TestGetNameModelStat:
         self,
         faker: Faker,
         db_session: AsyncSession,
+        sync_db_session: Session,
     ) -> None:
         """Test get_name_model_stat method."""
         name = faker.pystr(min_chars=10)
@@ -95,6 +224,11 @@ class TestGetNameModelStat:
                 adv_date=faker.date_between(start_date='-30d', end_date='-7d'),
             )
             AdvertisementFactory.create_batch(3)
+        adv_handlers.sync_refresh_stat(
+            sync_db_session,
+            [(name.lower(), model.lower())],
+            commit=True,
+        )
         actual_result = await adv_handlers.get_name_model_stat(
             Request({'type': 'http'}),
             db_session,
@@ -106,6 +240,260 @@ class TestGetNameModelStat:
         assert actual_result['num_week'] == 2 * number
         assert actual_result['num_month'] == 3 * number
 
+    async def test_get_name_model_stat_cached(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+        sync_db_session: Session,
+    ) -> None:
+        """Test get_name_model_stat result is cached until rollup changes."""
+        car_info = AdvNameModelQuerySchema(
+            name=faker.pystr(min_chars=12),
+            model=faker.pystr(min_chars=12),
+        )
+        pairs = [(car_info.name.lower(), car_info.model.lower())]  # type: ignore
+        AdvertisementFactory(
+            name=car_info.name,
+            model=car_info.model,
+            price=10,
+            adv_date=date.today(),
+        )
+        adv_handlers.sync_refresh_stat(sync_db_session, pairs, commit=True)
+        first_result = await adv_handlers.get_name_model_stat(
+            Request({'type': 'http'}),
+            db_session,
+            car_info,
+        )
+        AdvertisementFactory(
+            name=car_info.name,
+            model=car_info.model,
+            price=5,
+            adv_date=date.today(),
+        )
+        adv_handlers.sync_refresh_stat(sync_db_session, pairs)
+        sync_db_session.commit()
+        cached_result = await adv_handlers.get_name_model_stat(
+            Request({'type': 'http'}),
+            db_session,
+            car_info,
+        )
+        await adv_handlers.refresh_stat(db_session, pairs, commit=True)
+        actual_result = await adv_handlers.get_name_model_stat(
+            Request({'type': 'http'}),
+            db_session,
+            car_info,
+        )
+        assert first_result['min_price'] == 10
+        assert cached_result == first_result
+        assert actual_result['min_price'] == 5
+        assert actual_result['num_day'] == 2
+
+    async def test_refresh_stat_overlapping(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+        sync_db_session: Session,
+    ) -> None:
+        """Test rollup refresh overwrites rows filled by concurrent refresh."""
+        car_info = AdvNameModelQuerySchema(
+            name=faker.pystr(min_chars=12),
+            model=faker.pystr(min_chars=12),
+        )
+        pairs = [(car_info.name.lower(), car_info.model.lower())]  # type: ignore
+        AdvertisementFactory(
+            name=car_info.name,
+            model=car_info.model,
+            price=10,
+            adv_date=date.today(),
+        )
+        adv_handlers.sync_refresh_stat(sync_db_session, pairs)
+        sync_db_session.execute(adv_stat_statements.fill_stat_statement(pairs))
+        sync_db_session.commit()
+        actual_result = await adv_handlers.get_name_model_stat(
+            Request({'type': 'http'}),
+            db_session,
+            car_info,
+        )
+        assert actual_result['min_price'] == 10
+        assert actual_result['num_day'] == 1
+
+    async def test_get_name_model_stat_without_data(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+    ) -> None:
+        """Test get_name_model_stat method without matching advertisements."""
+        AdvertisementFactory.create_batch(3)
+        actual_result = await adv_handlers.get_name_model_stat(
+            Request({'type': 'http'}),
+            db_session,
+            AdvNameModelQuerySchema(
+                name=faker.pystr(min_chars=12),
+                model=faker.pystr(min_chars=12),
+            ),
+        )
+        assert actual_result == {
+            'min_price': EMPTY_STAT_MIN_PRICE,
+            'max_price': EMPTY_STAT_MAX_PRICE,
+            'num_day': 0,
+            'num_week': 0,
+            'num_month': 0,
+        }
+
+
+class TestGetPriceDistribution:
+    """Class for testing get_price_distribution handler."""
+
+    async def test_get_price_distribution(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test get_price_distribution method."""
+        monkeypatch.setattr(Settings, 'PRICE_HISTOGRAM_BUCKETS', 4)
+        name = faker.pystr(min_chars=12)
+        model = faker.pystr(min_chars=12)
+        for price in range(1, 21):
+            AdvertisementFactory(name=name, model=model, price=price)
+        AdvertisementFactory.create_batch(3, name=name)
+        actual_result = await adv_handlers.get_price_distribution(
+            Request({'type': 'http'}),
+            db_session,
+            AdvNameModelQuerySchema(name=name.upper(), model=model),
+        )
+        assert actual_result['p10'] == pytest.approx(2.9)
+        assert actual_result['p25'] == pytest.approx(5.75)
+        assert actual_result['median'] == pytest.approx(10.5)
+        assert actual_result['p75'] == pytest.approx(15.25)
+        assert actual_result['p90'] == pytest.approx(18.1)
+        assert actual_result['histogram'] == [
+            {'lower_price': 1, 'upper_price': 6, 'adv_count': 5},
+            {'lower_price': 6, 'upper_price': 11, 'adv_count': 5},
+            {'lower_price': 11, 'upper_price': 16, 'adv_count': 5},
+            {'lower_price': 16, 'upper_price': 21, 'adv_count': 5},
+        ]
+
+    async def test_get_price_distribution_without_data(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+    ) -> None:
+        """Test get_price_distribution method without matching advertisements."""
+        actual_result = await adv_handlers.get_price_distribution(
+            Request({'type': 'http'}),
+            db_session,
+            AdvNameModelQuerySchema(
+                name=faker.pystr(min_chars=12),
+                model=faker.pystr(min_chars=12),
+            ),
+        )
+        assert actual_result == {
+            'p10': None,
+            'p25': None,
+            'median': None,
+            'p75': None,
+            'p90': None,
+            'histogram': [],
+        }
+
+
+class TestGetFacets:
+    """Class for testing get_facets handler."""
+
+    async def test_get_facets(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+    ) -> None:
+        """Test get_facets counts top values of requested facets in one query."""
+        name = faker.pystr(min_chars=12)
+        model = faker.pystr(min_chars=12)
+        for region, color in (
+            ('Dnipro', 'red'),
+            ('Dnipro', 'red'),
+            ('Dnipro', None),
+            ('Kyiv', 'red'),
+            ('Lviv', 'black'),
+        ):
+            AdvertisementFactory(name=name, model=model, region=region, color=color)
+        AdvertisementFactory(name=name, region='Kyiv')
+        actual_result = await adv_handlers.get_facets(
+            Request({'type': 'http'}),
+            db_session,
+            AdvFacetQuerySchema(name=name, model=model.upper(), top_k=2),
+            [AdvFacet.REGION, AdvFacet.COLOR, AdvFacet.MODEL, AdvFacet.REGION],
+        )
+        assert actual_result == {
+            'region': [
+                {'value': 'Dnipro', 'adv_count': 3},
+                {'value': 'Kyiv', 'adv_count': 1},
+            ],
+            'color': [
+                {'value': 'red', 'adv_count': 3},
+                {'value': 'black', 'adv_count': 1},
+            ],
+            'model': [{'value': model.lower(), 'adv_count': 5}],
+        }
+
+
+class TestGetPriceTrend:
+    """Class for testing get_price_trend handler."""
+
+    async def test_get_price_trend(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+    ) -> None:
+        """Test get_price_trend method groups prices by week."""
+        name = faker.pystr(min_chars=12)
+        monday = date(2024, 3, 4)
+        for price, adv_date in (
+            (10, monday),
+            (20, monday + timedelta(days=2)),
+            (60, monday + timedelta(days=6)),
+            (5, monday + timedelta(days=7)),
+            (50, monday + timedelta(days=28)),
+        ):
+            AdvertisementFactory(name=name, price=price, adv_date=adv_date)
+        AdvertisementFactory(name=name, price=1, adv_date=monday - timedelta(days=1))
+        actual_result = await adv_handlers.get_price_trend(
+            Request({'type': 'http'}),
+            db_session,
+            AdvTrendQuerySchema(
+                name=name,
+                model=None,
+                begin=monday.strftime('%Y-%m-%d'),
+                interval='week',
+            ),
+        )
+        assert actual_result == [
+            {
+                'bucket': monday,
+                'adv_count': 3,
+                'avg_price': 30,
+                'median_price': 20,
+                'min_price': 10,
+                'max_price': 60,
+            },
+            {
+                'bucket': monday + timedelta(days=7),
+                'adv_count': 1,
+                'avg_price': 5,
+                'median_price': 5,
+                'min_price': 5,
+                'max_price': 5,
+            },
+            {
+                'bucket': monday + timedelta(days=28),
+                'adv_count': 1,
+                'avg_price': 50,
+                'median_price': 50,
+                'min_price': 50,
+                'max_price': 50,
+            },
+        ]
+
 
 class TestBulkCreateAdv:
     """Class for testing bulk_create_adv handler."""
@@ -115,24 +503,489 @@ class TestBulkCreateAdv:
         faker: Faker,
         db_session: AsyncSession,
     ) -> None:
-        """Test bulk_create_adv handler."""
+        """Test bulk_create_adv handler copies advertisements and adds stat."""
         number: int = faker.random_int(min=3, max=5)
-        expected_result: list[CreateAdvIn | None] = []
-        for _ in range(number):
+        name = faker.pystr(min_chars=12)
+        model = faker.pystr(min_chars=12)
+        expected_result: list[CreateAdvIn] = []
+        for index in range(number):
             model_dict = factory.build(dict, FACTORY_CLASS=AdvertisementFactory)
             model_dict.pop('created_at')
+            model_dict.update(
+                url='{url}{index}'.format(url=model_dict['url'], index=index),
+                name=name,
+                model=model,
+                adv_date=date.today().strftime('%Y-%m-%d'),
+            )
             expected_result.append(CreateAdvIn(**model_dict))
-        await adv_handlers.bulk_create_adv(
+        actual_result = await adv_handlers.bulk_create_adv(
             Request({'type': 'http'}),
             db_session,
-            AdvInList(item_list=expected_result),
+            AdvInList(item_list=expected_result),  # type: ignore
+        )
+        saved_advs = await db_session.scalars(
+            select(Advertisement).where(
+                Advertisement.url.in_([adv.url for adv in expected_result]),
+            ),
         )
-        saved_advs = await adv_handlers.get_adv_period_list(
+        saved_by_url = {adv.url: adv for adv in saved_advs}
+        stat_result = await adv_handlers.get_name_model_stat(
             Request({'type': 'http'}),
             db_session,
-            AdvPeriodQuerySchema(),
+            AdvNameModelQuerySchema(name=name, model=model),
         )
-        assert isinstance(saved_advs, Sequence)
-        for index, elem in enumerate(saved_advs[-number:]):
+        assert actual_result is None
+        assert len(saved_by_url) == number
+        for elem in expected_result:
             for attr in ('name', 'price', 'url', 'model', 'adv_date'):
-                assert getattr(expected_result[index], attr) == getattr(elem, attr)
+                assert getattr(elem, attr) == getattr(saved_by_url[elem.url], attr)
+        assert stat_result['num_day'] == number
+        assert stat_result['min_price'] == min(adv.price for adv in expected_result)
+        assert stat_result['max_price'] == max(adv.price for adv in expected_result)
+
+    async def test_bulk_create_adv_returning(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+    ) -> None:
+        """Test bulk_create_adv handler returns created advertisements."""
+        expected_result: list[CreateAdvIn] = []
+        for _ in range(faker.random_int(min=3, max=5)):
+            model_dict = factory.build(dict, FACTORY_CLASS=AdvertisementFactory)
+            model_dict.pop('created_at')
+            expected_result.append(CreateAdvIn(**model_dict))
+        actual_result = await adv_handlers.bulk_create_adv(
+            Request({'type': 'http'}),
+            db_session,
+            AdvInList(item_list=expected_result),  # type: ignore
+            returning=True,
+        )
+        assert isinstance(actual_result, Sequence)
+        assert [adv.url for adv in actual_result] == [
+            adv.url for adv in expected_result
+        ]
+
+
+class TestUpsertAdv:
+    """Class for testing upsert_adv handler."""
+
+    def get_adv_data(self, faker: Faker, **adv_data: Any) -> CreateAdvIn:
+        """Get advertisement create schema with given data."""
+        model_dict = factory.build(dict, FACTORY_CLASS=AdvertisementFactory)
+        model_dict.pop('created_at')
+        model_dict.update(
+            adv_date=date.today().strftime('%Y-%m-%d'),
+            **adv_data,
+        )
+        return CreateAdvIn(**model_dict)
+
+    async def test_upsert_adv_new(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+        sync_db_session: Session,
+    ) -> None:
+        """Test upsert_adv adds new advertisements to statistics rollup."""
+        name = faker.pystr(min_chars=12)
+        model = faker.pystr(min_chars=12)
+        prices = [faker.random_int(min=10, max=100) for _ in range(3)]
+        for price in prices:
+            adv_handlers.upsert_adv(
+                sync_db_session,
+                self.get_adv_data(faker, name=name.upper(), model=model, price=price),
+            )
+        actual_result = await adv_handlers.get_name_model_stat(
+            Request({'type': 'http'}),
+            db_session,
+            AdvNameModelQuerySchema(name=name, model=model),
+        )
+        assert actual_result['min_price'] == min(prices)
+        assert actual_result['max_price'] == max(prices)
+        assert actual_result['num_day'] == len(prices)
+        assert actual_result['num_month'] == len(prices)
+
+    async def test_upsert_adv(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+        sync_db_session: Session,
+    ) -> None:
+        """Test upsert_adv updates advertisement with the same normalized url."""
+        name = faker.pystr(min_chars=12)
+        url_path = 'auto.ria.com/uk/auto_{uuid}.html'.format(uuid=faker.uuid4())
+        adv_handlers.upsert_adv(
+            sync_db_session,
+            self.get_adv_data(
+                faker,
+                url='https://{url_path}'.format(url_path=url_path),
+                name=name,
+                price=10,
+            ),
+        )
+        adv_handlers.upsert_adv(
+            sync_db_session,
+            self.get_adv_data(
+                faker,
+                url='http://www.{url_path}/?utm_source=x'.format(url_path=url_path),
+                name=name,
+                price=20,
+            ),
+        )
+        saved_advs = (
+            await db_session.scalars(
+                select(Advertisement).where(Advertisement.name == name),
+            )
+        ).all()
+        actual_result = await adv_handlers.get_name_model_stat(
+            Request({'type': 'http'}),
+            db_session,
+            AdvNameModelQuerySchema(name=name, model=None),
+        )
+        assert len(saved_advs) == 1
+        assert saved_advs[0].price == 20
+        assert saved_advs[0].url_key == url_path
+        assert actual_result['min_price'] == 20
+        assert actual_result['num_day'] == 1
+
+    def test_upsert_adv_unchanged(
+        self,
+        faker: Faker,
+        sync_db_session: Session,
+    ) -> None:
+        """Test upsert_adv only marks advertisement without changes as seen."""
+        adv_data = self.get_adv_data(faker)
+        adv_handlers.upsert_adv(sync_db_session, adv_data)
+        row_statement = select(
+            Advertisement.id,
+            Advertisement.created_at,
+            Advertisement.last_seen_at,
+        ).where(Advertisement.url == adv_data.url)
+        adv_id, created_at, last_seen_at = sync_db_session.execute(row_statement).one()
+        adv_handlers.upsert_adv(sync_db_session, adv_data)
+        saved_adv = sync_db_session.execute(row_statement).one()
+        assert (saved_adv.id, saved_adv.created_at) == (adv_id, created_at)
+        assert saved_adv.last_seen_at > last_seen_at
+
+
+class TestUpsertAdvs:
+    """Class for testing upsert_advs handler."""
+
+    async def test_upsert_advs(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+    ) -> None:
+        """Test upsert_advs inserts new and updates existing advertisements."""
+        name = faker.pystr(min_chars=12)
+        existing_adv = AdvertisementFactory(name=name, price=10)
+        adv_list: list[CreateAdvIn] = []
+        for url, price in (
+            (existing_adv.url, 30),
+            ('{url}/'.format(url=existing_adv.url), 40),
+            (faker.uri(), 50),
+        ):
+            model_dict = factory.build(dict, FACTORY_CLASS=AdvertisementFactory)
+            model_dict.pop('created_at')
+            model_dict.update(url=url, name=name, price=price)
+            adv_list.append(CreateAdvIn(**model_dict))
+        await adv_handlers.upsert_advs(db_session, adv_list, commit=True)
+        saved_prices = (
+            await db_session.scalars(
+                select(Advertisement.price)
+                .where(Advertisement.name == name)
+                .order_by(Advertisement.price),
+            )
+        ).all()
+        actual_result = await adv_handlers.get_name_model_stat(
+            Request({'type': 'http'}),
+            db_session,
+            AdvNameModelQuerySchema(name=name, model=None),
+        )
+        assert saved_prices == [40, 50]
+        assert actual_result['min_price'] == 40
+        assert actual_result['max_price'] == 50
+
+
+class TestDeleteOldAdv:
+    """Class for testing delete_old_adv handler."""
+
+    async def test_delete_old_adv(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+        sync_db_session: Session,
+    ) -> None:
+        """Test delete_old_adv handler recomputes statistics rollup."""
+        name = faker.pystr(min_chars=12)
+        model = faker.pystr(min_chars=12)
+        old_date = datetime.now(utc) - timedelta(days=1)
+        AdvertisementFactory(
+            name=name,
+            model=model,
+            price=1,
+            adv_date=date.today(),
+            created_at=old_date - timedelta(days=1),
+        )
+        AdvertisementFactory(
+            name=name,
+            model=model,
+            price=5,
+            adv_date=date.today(),
+            created_at=datetime.now(utc),
+        )
+        adv_handlers.sync_refresh_stat(
+            sync_db_session,
+            [(name.lower(), model.lower())],
+            commit=True,
+        )
+        adv_handlers.delete_old_adv(sync_db_session, old_date)
+        actual_result = await adv_handlers.get_name_model_stat(
+            Request({'type': 'http'}),
+            db_session,
+            AdvNameModelQuerySchema(name=name, model=model),
+        )
+        assert actual_result['min_price'] == 5
+        assert actual_result['max_price'] == 5
+        assert actual_result['num_day'] == 1
+
+    def test_delete_old_adv_keeps_seen(
+        self,
+        faker: Faker,
+        sync_db_session: Session,
+    ) -> None:
+        """Test delete_old_adv keeps old advertisements, upserted again since then."""
+        old_day = datetime.now(utc).date() - timedelta(days=6)
+        sync_db_session.execute(
+            adv_statements.create_partitions_statement(old_day, old_day),
+        )
+        sync_db_session.commit()
+        old_adv = AdvertisementFactory(
+            created_at=datetime.combine(old_day, time(hour=12), utc),
+        )
+        model_dict = factory.build(dict, FACTORY_CLASS=AdvertisementFactory)
+        model_dict.update(url=old_adv.url, price=old_adv.price)
+        adv_handlers.upsert_adv(sync_db_session, CreateAdvIn(**model_dict))
+        adv_handlers.delete_old_adv(
+            sync_db_session,
+            datetime.now(utc) - timedelta(days=1),
+        )
+        saved_advs = sync_db_session.execute(
+            select(Advertisement.id, Advertisement.created_at).where(
+                Advertisement.url_key == old_adv.url_key,
+            ),
+        ).all()
+        assert saved_advs == [(old_adv.id, old_adv.created_at)]
+
+    async def test_delete_old_adv_drops_partition(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+        sync_db_session: Session,
+    ) -> None:
+        """Test delete_old_adv drops whole daily partitions before old date day."""
+        name = faker.pystr(min_chars=12)
+        model = faker.pystr(min_chars=12)
+        old_day = datetime.now(utc).date() - timedelta(days=5)
+        partition_name = 'advertisement_p{day}'.format(day=old_day.strftime('%Y%m%d'))
+        sync_db_session.execute(
+            adv_statements.create_partitions_statement(old_day, old_day),
+        )
+        sync_db_session.commit()
+        AdvertisementFactory(
+            name=name,
+            model=model,
+            adv_date=date.today(),
+            created_at=datetime.combine(old_day, time(hour=12), utc),
+        )
+        adv_handlers.sync_refresh_stat(
+            sync_db_session,
+            [(name.lower(), model.lower())],
+            commit=True,
+        )
+        adv_handlers.delete_old_adv(
+            sync_db_session,
+            datetime.now(utc) - timedelta(days=1),
+        )
+        actual_result = await adv_handlers.get_name_model_stat(
+            Request({'type': 'http'}),
+            db_session,
+            AdvNameModelQuerySchema(name=name, model=model),
+        )
+        assert sync_db_session.scalar(select(func.to_regclass(partition_name))) is None
+        assert actual_result['num_month'] == 0
+
+    def test_delete_old_adv_exact_date(self, sync_db_session: Session) -> None:
+        """Test delete_old_adv deletes rows last seen just before old_date."""
+        old_date = datetime.now(utc) - timedelta(days=1)
+        old_adv = AdvertisementFactory(created_at=old_date - timedelta(minutes=1))
+        new_adv = AdvertisementFactory(created_at=old_date + timedelta(minutes=1))
+        adv_handlers.delete_old_adv(sync_db_session, old_date)
+        saved_ids = sync_db_session.scalars(
+            select(Advertisement.id).where(
+                Advertisement.id.in_([old_adv.id, new_adv.id]),
+            ),
+        ).all()
+        assert saved_ids == [new_adv.id]
+
+    def test_delete_old_adv_max_chunks(self, sync_db_session: Session) -> None:
+        """Test delete_old_adv stops after max_chunks full chunks."""
+        AdvertisementFactory.create_batch(
+            3,
+            created_at=datetime(1960, 1, 2, tzinfo=utc),
+        )
+        delete_report = adv_handlers.delete_old_adv(
+            sync_db_session,
+            datetime(1960, 1, 3, tzinfo=utc),
+            chunk_size=1,
+            max_chunks=2,
+        )
+        assert delete_report['deleted_count'] == 2
+        assert not delete_report['completed']
+        delete_report = adv_handlers.delete_old_adv(
+            sync_db_session,
+            datetime(1960, 1, 3, tzinfo=utc),
+            chunk_size=1,
+            max_chunks=2,
+        )
+        assert delete_report['deleted_count'] == 1
+        assert delete_report['completed']
+
+    def test_delete_old_adv_nothing_deleted(
+        self,
+        sync_db_session: Session,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test delete_old_adv keeps statistics cache without deleted rows."""
+        invalidations: list[None] = []
+        monkeypatch.setattr(
+            adv_stat_cache,
+            'sync_invalidate',
+            lambda: invalidations.append(None),
+        )
+        delete_report = adv_handlers.delete_old_adv(
+            sync_db_session,
+            datetime(1950, 1, 1, tzinfo=utc),
+            chunk_size=2,
+        )
+        assert delete_report['deleted_count'] == 0
+        assert not invalidations
+
+    async def test_delete_old_adv_chunked(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+        sync_db_session: Session,
+    ) -> None:
+        """Test delete_old_adv deletes default partition rows in chunks."""
+        name = faker.pystr(min_chars=12)
+        model = faker.pystr(min_chars=12)
+        number = faker.random_int(min=3, max=5)
+        for _ in range(number):
+            AdvertisementFactory(
+                name=name,
+                model=model,
+                adv_date=date.today(),
+                created_at=faker.date_time(tzinfo=utc, end_datetime='-30d'),
+            )
+        adv_handlers.sync_refresh_stat(
+            sync_db_session,
+            [(name.lower(), model.lower())],
+            commit=True,
+        )
+        delete_report = adv_handlers.delete_old_adv(
+            sync_db_session,
+            datetime.now(utc) - timedelta(days=1),
+            chunk_size=2,
+        )
+        saved_advs = sync_db_session.scalars(
+            select(Advertisement).where(Advertisement.name == name),
+        ).all()
+        actual_result = await adv_handlers.get_name_model_stat(
+            Request({'type': 'http'}),
+            db_session,
+            AdvNameModelQuerySchema(name=name, model=model),
+        )
+        assert not saved_advs
+        assert delete_report['deleted_count'] >= number
+        assert delete_report['rows_per_second'] >= 0
+        assert actual_result['num_day'] == 0
+
+
+class TestCreatePartitions:
+    """Class for testing create_partitions handler."""
+
+    def test_create_partitions(self, sync_db_session: Session) -> None:
+        """Test create_partitions creates daily partitions for days ahead."""
+        days_ahead = Settings.ADV_PARTITION_PREMAKE_DAYS + 3
+        adv_handlers.create_partitions(sync_db_session, days_ahead)
+        last_day = datetime.now(utc).date() + timedelta(days=days_ahead)
+        partition_name = 'advertisement_p{day}'.format(
+            day=last_day.strftime('%Y%m%d'),
+        )
+        assert sync_db_session.scalar(select(func.to_regclass(partition_name)))
+        adv_handlers.create_partitions(sync_db_session, days_ahead)
+
+    def test_create_partitions_moves_default_rows(
+        self,
+        sync_db_session: Session,
+    ) -> None:
+        """Test rows of default partition are moved to created partition."""
+        days_ahead = Settings.ADV_PARTITION_PREMAKE_DAYS + 30
+        last_day = datetime.now(utc).date() + timedelta(days=days_ahead)
+        adv = AdvertisementFactory(
+            created_at=datetime.combine(last_day, time(hour=12), utc),
+        )
+        adv_handlers.create_partitions(sync_db_session, days_ahead)
+        partition_name = sync_db_session.scalar(
+            select(literal_column('tableoid::regclass::text')).where(
+                Advertisement.id == adv.id,
+            ),
+        )
+        assert partition_name == 'advertisement_p{day}'.format(
+            day=last_day.strftime('%Y%m%d'),
+        )
+
+
+class TestGetAdvByUrl:
+    """Class for testing get_adv_by_url handler."""
+
+    async def test_get_adv_by_url(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+    ) -> None:
+        """Test get_adv_by_url method finds advertisement by url last segment."""
+        url_slug = '{slug}_{number}.html'.format(
+            slug=faker.slug(),
+            number=faker.random_int(),
+        )
+        adv_object = AdvertisementFactory(
+            url='https://auto.ria.com/uk/auto/{url_slug}/'.format(url_slug=url_slug),
+        )
+        actual_result = await adv_handlers.get_adv_by_url(
+            Request({'type': 'http'}),
+            db_session,
+            UrlSchema(url=url_slug.removesuffix('.html')),
+            ('id', 'url_slug'),
+        )
+        assert actual_result == {'id': adv_object.id, 'url_slug': url_slug}
+
+    async def test_get_adv_by_url_not_found(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+    ) -> None:
+        """Test get_adv_by_url method doesn't match part of url last segment."""
+        url_slug = '{slug}_{number}.html'.format(
+            slug=faker.slug(),
+            number=faker.random_int(),
+        )
+        AdvertisementFactory(
+            url='https://auto.ria.com/uk/auto/{url_slug}'.format(url_slug=url_slug),
+        )
+        actual_result = await adv_handlers.get_adv_by_url(
+            Request({'type': 'http'}),
+            db_session,
+            UrlSchema(url=url_slug[1:]),
+        )
+        assert actual_result is None
@@ -1,6 +1,6 @@
 """Test models."""
 
-from apps.advertisements.models import Advertisement
+from apps.advertisements.models import Advertisement, AdvertisementStat
 from tests.apps.advertisements.factories import AdvertisementFactory
 from tests.bases import BaseModelFactory
 
@@ -42,3 +42,25 @@ class TestAdvertisement:
         )
         actual_result = adv_object.__repr__()  # noqa
         assert expected_result == actual_result
+
+
+class TestAdvertisementStat:
+    """Class for testing AdvertisementStat model."""
+
+    def test_repr(self) -> None:
+        """Test __repr__ method."""
+        stat_object = AdvertisementStat(
+            id=1,
+            name='mazda',
+            model='6',
+            adv_count=2,
+            min_price=100,
+            max_price=200,
+        )
+        expected_result = ''.join(
+            (
+                'AdvertisementStat(id=1, name=mazda, model=6, ',
+                'adv_date=None, adv_count=2, min_price=100, max_price=200)',
+            ),
+        )
+        assert stat_object.__repr__() == expected_result  # noqa
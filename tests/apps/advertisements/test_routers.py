@@ -1,19 +1,71 @@
 """Module for testing advertisement apps."""
 
+import csv
+import json
+from datetime import date
 from typing import Sequence
 
+import factory
+import pytest
 from faker import Faker
 from fastapi import FastAPI, Request, status
 from httpx import AsyncClient
+from pytz import utc
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from apps.advertisements.adv_utilities import adv_stat_cache
 from apps.advertisements.handlers import adv_handlers
 from apps.advertisements.models import Advertisement
-from apps.advertisements.schemas import AdvPeriodQuerySchema
+from apps.advertisements.schemas import AdvNameModelQuerySchema, AdvPeriodQuerySchema
 from apps.common.enum import JSENDStatus
+from settings import Settings
 from tests.apps.advertisements.factories import AdvertisementFactory
 
 
+async def get_list_pages(
+    async_client: AsyncClient,
+    url: str,
+    query_params: dict,
+    access_token: str,
+) -> list[dict]:
+    """Get response json of every cursor page of list router."""
+    pages: list[dict] = []
+    while True:
+        actual_result = await async_client.get(
+            url=url,
+            params=query_params,
+            headers={'Authorization': 'Bearer {token}'.format(token=access_token)},
+        )
+        assert actual_result.status_code == status.HTTP_200_OK
+        pages.append(actual_result.json())
+        if pages[-1]['next_cursor'] is None:
+            return pages
+        query_params = {**query_params, 'cursor': pages[-1]['next_cursor']}
+
+
+async def create_adv(
+    async_client: AsyncClient,
+    url: str,
+    headers: dict,
+    car_info: AdvNameModelQuerySchema,
+    price: int,
+) -> int:
+    """Create today advertisement of car with given price by admin router."""
+    model_dict = factory.build(dict, FACTORY_CLASS=AdvertisementFactory)
+    for key in ('id', 'created_at', 'last_seen_at'):
+        model_dict.pop(key)
+    model_dict.update(
+        name=car_info.name,
+        model=car_info.model,
+        price=price,
+        adv_date=date.today().strftime('%Y-%m-%d'),
+    )
+    response = await async_client.post(url=url, json=model_dict, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()['data']['id']
+
+
 class TestGetAdvertisementByPeriod:
     """Class for testing get_advertisement_by_period router."""
 
@@ -22,10 +74,9 @@ class TestGetAdvertisementByPeriod:
         faker: Faker,
         async_client: AsyncClient,
         app_fixture: FastAPI,
-        db_session: AsyncSession,
         access_token: str,
     ) -> None:
-        """Test get_advertisement_by_period router."""
+        """Test get_advertisement_by_period router pages through period list."""
         number = faker.random_int(min=3, max=5)
         start_date = faker.date_between(start_date='-50d', end_date='-30d')
         end_date = faker.date_between(start_date='-20d', end_date='-10d')
@@ -33,45 +84,42 @@ class TestGetAdvertisementByPeriod:
             begin=start_date.strftime('%Y-%m-%d'),
             end=end_date.strftime('%Y-%m-%d'),
         )
-        gap: int = len(
-            await adv_handlers.get_adv_period_list(  # type: ignore
-                Request({'type': 'http'}),
-                db_session,
-                period,
-            ),
-        )
-        expected_result: list[Advertisement] = []
+        expected_result: dict[int, Advertisement] = {}
         for _ in range(1, number + 1):
-            expected_result.append(
-                AdvertisementFactory(
-                    adv_date=faker.date_between(start_date='-29d', end_date='-21d'),
-                ),
+            adv_object = AdvertisementFactory(
+                adv_date=faker.date_between(start_date='-29d', end_date='-21d'),
             )
+            expected_result[adv_object.id] = adv_object
             AdvertisementFactory(
                 adv_date=faker.date_between(start_date='-60d', end_date='-51d'),
             )
             AdvertisementFactory(adv_date=faker.date_between(start_date='-9d'))
-        actual_result = await async_client.get(
-            url=app_fixture.url_path_for('adv_period'),
-            params={'begin': period.begin, 'end': period.end},
-            headers={'Authorization': 'Bearer {token}'.format(token=access_token)},
+        pages = await get_list_pages(
+            async_client,
+            app_fixture.url_path_for('adv_period'),
+            {'begin': period.begin, 'end': period.end, 'limit': 2},
+            access_token,
         )
-        response_json = actual_result.json()
-        actual_data = response_json['data']
-        assert actual_result.status_code == status.HTTP_200_OK
-        assert response_json['status'] == JSENDStatus.SUCCESS
-        assert response_json['message'] == ''.join(
-            (
-                'Get advertisements list with begin - {begin}'.format(
-                    begin=period.begin,
+        actual_data: list[dict] = []
+        for response_json in pages:
+            assert response_json['status'] == JSENDStatus.SUCCESS
+            assert response_json['message'] == ''.join(
+                (
+                    'Get advertisements list with begin - {begin}'.format(
+                        begin=period.begin,
+                    ),
+                    ' and end - {end} period'.format(end=period.end),
                 ),
-                ' and end - {end} period'.format(end=period.end),
-            ),
-        )
-        assert response_json['code'] == status.HTTP_200_OK
-        assert isinstance(actual_data, Sequence)
-        for index, elem in enumerate(expected_result):
-            for key, key_val in actual_data[index + gap].items():
+            )
+            assert response_json['code'] == status.HTTP_200_OK
+            assert isinstance(response_json['data'], Sequence)
+            assert len(response_json['data']) <= 2
+            actual_data.extend(response_json['data'])
+        sort_keys = [(elem['adv_date'], elem['id']) for elem in actual_data]
+        assert sort_keys == sorted(set(sort_keys))
+        actual_by_id = {elem['id']: elem for elem in actual_data}
+        for elem_id, elem in expected_result.items():
+            for key, key_val in actual_by_id[elem_id].items():
                 if key == 'adv_date':
                     assert getattr(elem, key).strftime('%Y-%m-%d') == key_val
                 elif key == 'created_at':
@@ -80,3 +128,497 @@ class TestGetAdvertisementByPeriod:
                     )
                 else:
                     assert getattr(elem, key) == key_val
+
+    async def test_get_adv_by_period_invalid_cursor(
+        self,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        access_token: str,
+    ) -> None:
+        """Test get_advertisement_by_period router with invalid cursor."""
+        actual_result = await async_client.get(
+            url=app_fixture.url_path_for('adv_period'),
+            params={'cursor': 'invalid'},
+            headers={'Authorization': 'Bearer {token}'.format(token=access_token)},
+        )
+        assert actual_result.status_code == status.HTTP_400_BAD_REQUEST
+        assert actual_result.json()['status'] == JSENDStatus.FAIL
+
+    async def test_get_advertisement_by_period_fields(
+        self,
+        faker: Faker,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        access_token: str,
+    ) -> None:
+        """Test get_advertisement_by_period router returns only given fields."""
+        adv_date = faker.date_between(start_date='-29d', end_date='-21d')
+        advs = AdvertisementFactory.create_batch(3, adv_date=adv_date)
+        pages = await get_list_pages(
+            async_client,
+            app_fixture.url_path_for('adv_period'),
+            {
+                'begin': adv_date.strftime('%Y-%m-%d'),
+                'end': adv_date.strftime('%Y-%m-%d'),
+                'fields': 'price,id,price',
+                'limit': 2,
+            },
+            access_token,
+        )
+        actual_data = [elem for page in pages for elem in page['data']]
+        assert all(set(elem) == {'price', 'id'} for elem in actual_data)
+        expected_data = [{'price': adv.price, 'id': adv.id} for adv in advs]
+        assert [elem for elem in actual_data if elem in expected_data] == sorted(
+            expected_data,
+            key=lambda elem: elem['id'],
+        )
+
+    async def test_get_adv_by_period_invalid_fields(
+        self,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        access_token: str,
+    ) -> None:
+        """Test get_advertisement_by_period router with unknown field."""
+        actual_result = await async_client.get(
+            url=app_fixture.url_path_for('adv_period'),
+            params={'fields': 'id,search_vector'},
+            headers={'Authorization': 'Bearer {token}'.format(token=access_token)},
+        )
+        assert actual_result.status_code == status.HTTP_400_BAD_REQUEST
+        assert actual_result.json()['status'] == JSENDStatus.FAIL
+
+
+class TestSearchAdvertisement:
+    """Class for testing search_advertisement router."""
+
+    async def test_search_advertisement(
+        self,
+        faker: Faker,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        access_token: str,
+    ) -> None:
+        """Test search_advertisement router finds advertisements by word prefix."""
+        word = faker.pystr(min_chars=12, max_chars=12)
+        adv = AdvertisementFactory(seller='{word} 066 666-66-66'.format(word=word))
+        actual_result = await async_client.get(
+            url=app_fixture.url_path_for('adv_search'),
+            params={'q': word[:-2]},
+            headers={'Authorization': 'Bearer {token}'.format(token=access_token)},
+        )
+        assert actual_result.status_code == status.HTTP_200_OK
+        actual_ids = [elem['id'] for elem in actual_result.json()['data']]
+        assert actual_ids == [adv.id]
+        assert actual_result.json()['next_cursor'] is None
+
+    async def test_search_advertisement_fields(
+        self,
+        faker: Faker,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        access_token: str,
+    ) -> None:
+        """Test search_advertisement router returns only given fields."""
+        word = faker.pystr(min_chars=12, max_chars=12)
+        advs = AdvertisementFactory.create_batch(
+            3,
+            seller='{word} 066 666-66-66'.format(word=word),
+        )
+        pages = await get_list_pages(
+            async_client,
+            app_fixture.url_path_for('adv_search'),
+            {'q': word, 'fields': 'url', 'limit': 2},
+            access_token,
+        )
+        actual_data = [elem for page in pages for elem in page['data']]
+        assert sorted(actual_data, key=lambda elem: elem['url']) == sorted(
+            ({'url': adv.url} for adv in advs),
+            key=lambda elem: elem['url'],
+        )
+
+    async def test_search_advertisement_without_words(
+        self,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        access_token: str,
+    ) -> None:
+        """Test search_advertisement router rejects search string without words."""
+        actual_result = await async_client.get(
+            url=app_fixture.url_path_for('adv_search'),
+            params={'q': '&!'},
+            headers={'Authorization': 'Bearer {token}'.format(token=access_token)},
+        )
+        assert actual_result.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class TestExportAdvertisementByPeriod:
+    """Class for testing export_advertisement_by_period router."""
+
+    async def test_export_advertisement_by_period_ndjson(
+        self,
+        faker: Faker,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        access_token: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test export_advertisement_by_period router streams ndjson in batches."""
+        monkeypatch.setattr(Settings, 'EXPORT_BATCH_SIZE', 2)
+        adv_date = faker.date_between(start_date='+300d', end_date='+400d')
+        expected_ids = [
+            adv.id for adv in AdvertisementFactory.create_batch(5, adv_date=adv_date)
+        ]
+        actual_result = await async_client.get(
+            url=app_fixture.url_path_for('adv_period_export'),
+            params={
+                'begin': adv_date.strftime('%Y-%m-%d'),
+                'end': adv_date.strftime('%Y-%m-%d'),
+            },
+            headers={'Authorization': 'Bearer {token}'.format(token=access_token)},
+        )
+        assert actual_result.status_code == status.HTTP_200_OK
+        assert actual_result.headers['content-type'] == 'application/x-ndjson'
+        actual_data = [json.loads(line) for line in actual_result.text.splitlines()]
+        assert [elem['id'] for elem in actual_data] == expected_ids
+        assert {elem['adv_date'] for elem in actual_data} == {
+            adv_date.strftime('%Y-%m-%d'),
+        }
+
+    async def test_export_advertisement_by_period_csv(
+        self,
+        faker: Faker,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        access_token: str,
+    ) -> None:
+        """Test export_advertisement_by_period router streams csv."""
+        adv_date = faker.date_between(start_date='+300d', end_date='+400d')
+        expected_result = AdvertisementFactory.create_batch(3, adv_date=adv_date)
+        actual_result = await async_client.get(
+            url=app_fixture.url_path_for('adv_period_export'),
+            params={
+                'begin': adv_date.strftime('%Y-%m-%d'),
+                'end': adv_date.strftime('%Y-%m-%d'),
+                'file_format': 'csv',
+            },
+            headers={'Authorization': 'Bearer {token}'.format(token=access_token)},
+        )
+        assert actual_result.status_code == status.HTTP_200_OK
+        assert actual_result.headers['content-type'].startswith('text/csv')
+        actual_data = list(csv.DictReader(actual_result.text.splitlines()))
+        assert len(actual_data) == len(expected_result)
+        for elem, actual_elem in zip(expected_result, actual_data):
+            assert actual_elem['id'] == str(elem.id)
+            assert actual_elem['url'] == elem.url
+            assert actual_elem['price'] == str(elem.price)
+
+    @pytest.mark.parametrize('file_format', ['ndjson', 'csv'])
+    async def test_export_advertisement_by_period_null_date(
+        self,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        access_token: str,
+        db_session: AsyncSession,
+        file_format: str,
+    ) -> None:
+        """Test export_advertisement_by_period router exports null adv_date rows."""
+        adv_object = AdvertisementFactory()
+        await db_session.execute(
+            update(Advertisement)
+            .where(Advertisement.id == adv_object.id)
+            .values(adv_date=None),
+        )
+        await db_session.commit()
+        actual_result = await async_client.get(
+            url=app_fixture.url_path_for('adv_period_export'),
+            params={'file_format': file_format},
+            headers={'Authorization': 'Bearer {token}'.format(token=access_token)},
+        )
+        assert actual_result.status_code == status.HTTP_200_OK
+        lines = actual_result.text.splitlines()
+        if file_format == 'csv':
+            actual_data = list(csv.DictReader(lines))
+            null_date = ''
+        else:
+            actual_data = [json.loads(line) for line in lines]
+            null_date = None
+        actual_elem = next(
+            elem for elem in actual_data if str(elem['id']) == str(adv_object.id)
+        )
+        assert actual_elem['adv_date'] == null_date
+        assert actual_elem['url'] == adv_object.url
+
+
+class TestGetAdvertisementPriceStat:
+    """Class for testing get_advertisement_price_stat router."""
+
+    async def test_get_advertisement_price_stat(
+        self,
+        faker: Faker,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        access_token: str,
+    ) -> None:
+        """Test get_advertisement_price_stat router."""
+        name = faker.pystr(min_chars=12)
+        model = faker.pystr(min_chars=12)
+        AdvertisementFactory.create_batch(3, name=name, model=model, price=100)
+        actual_result = await async_client.get(
+            url=app_fixture.url_path_for('adv_price_stat'),
+            params={'name': name, 'model': model},
+            headers={'Authorization': 'Bearer {token}'.format(token=access_token)},
+        )
+        response_json = actual_result.json()
+        assert actual_result.status_code == status.HTTP_200_OK
+        assert response_json['status'] == JSENDStatus.SUCCESS
+        assert response_json['data']['median'] == 100
+        assert response_json['data']['histogram'][0]['adv_count'] == 3
+        assert (
+            len(response_json['data']['histogram']) == Settings.PRICE_HISTOGRAM_BUCKETS
+        )
+
+
+class TestAdvertisementConditionalGet:
+    """Class for testing conditional GET of advertisement read routers."""
+
+    async def test_get_advertisement_stat_not_modified(
+        self,
+        faker: Faker,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        access_token: str,
+    ) -> None:
+        """Test get_advertisement_stat router returns 304 for unchanged data."""
+        headers = {'Authorization': 'Bearer {token}'.format(token=access_token)}
+        query_params = {'name': faker.pystr(min_chars=12), 'model': faker.pystr()}
+        url = app_fixture.url_path_for('adv_stat')
+        response = await async_client.get(url=url, params=query_params, headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        etag = response.headers['ETag']
+        last_modified = response.headers['Last-Modified']
+        response = await async_client.get(
+            url=url,
+            params=query_params,
+            headers={**headers, 'If-None-Match': etag},
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not response.content
+        assert response.headers['ETag'] == etag
+        response = await async_client.get(
+            url=url,
+            params=query_params,
+            headers={**headers, 'If-Modified-Since': last_modified},
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        response = await async_client.get(
+            url=url,
+            params={**query_params, 'model': faker.pystr()},
+            headers={**headers, 'If-None-Match': etag},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+    async def test_get_advertisement_stat_invalidated(
+        self,
+        faker: Faker,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        access_token: str,
+    ) -> None:
+        """Test get_advertisement_stat router changes ETag after invalidation."""
+        headers = {'Authorization': 'Bearer {token}'.format(token=access_token)}
+        query_params = {'name': faker.pystr(min_chars=12), 'model': faker.pystr()}
+        url = app_fixture.url_path_for('adv_stat')
+        response = await async_client.get(
+            url=url,
+            params=query_params,
+            headers=headers,
+        )
+        etag = response.headers['ETag']
+        await adv_stat_cache.invalidate()
+        response = await async_client.get(
+            url=url,
+            params=query_params,
+            headers={**headers, 'If-None-Match': etag},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers['ETag'] != etag
+
+    async def test_get_advertisement_by_period_not_modified(
+        self,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        access_token: str,
+    ) -> None:
+        """Test get_advertisement_by_period router returns 304 with weak ETag."""
+        headers = {'Authorization': 'Bearer {token}'.format(token=access_token)}
+        url = app_fixture.url_path_for('adv_period')
+        response = await async_client.get(url=url, headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        response = await async_client.get(
+            url=url,
+            headers={
+                **headers,
+                'If-None-Match': '"other", {etag}'.format(
+                    etag=response.headers['ETag'].removeprefix('W/'),
+                ),
+            },
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+class TestGetAdvertisementTrendStat:
+    """Class for testing get_advertisement_trend_stat router."""
+
+    async def test_get_advertisement_trend_stat(
+        self,
+        faker: Faker,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        access_token: str,
+    ) -> None:
+        """Test get_advertisement_trend_stat router."""
+        name = faker.pystr(min_chars=12)
+        model = faker.pystr(min_chars=12)
+        price_dates = (
+            (10, date(2024, 3, 4)),
+            (15, date(2024, 3, 31)),
+        )
+        for price, adv_date in price_dates:
+            AdvertisementFactory(name=name, model=model, price=price, adv_date=adv_date)
+        actual_result = await async_client.get(
+            url=app_fixture.url_path_for('adv_trend_stat'),
+            params={'name': name, 'model': model, 'interval': 'month'},
+            headers={'Authorization': 'Bearer {token}'.format(token=access_token)},
+        )
+        response_json = actual_result.json()
+        assert actual_result.status_code == status.HTTP_200_OK
+        assert response_json['status'] == JSENDStatus.SUCCESS
+        assert response_json['data'] == [
+            {
+                'bucket': '2024-03-01',
+                'adv_count': 2,
+                'avg_price': 12.5,
+                'median_price': 12.5,
+                'min_price': 10,
+                'max_price': 15,
+            },
+        ]
+
+
+class TestGetAdvertisementFacetStat:
+    """Class for testing get_advertisement_facet_stat router."""
+
+    async def test_get_advertisement_facet_stat(
+        self,
+        faker: Faker,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        access_token: str,
+    ) -> None:
+        """Test get_advertisement_facet_stat router returns requested facets."""
+        name = faker.pystr(min_chars=12)
+        adv = AdvertisementFactory(name=name)
+        actual_result = await async_client.get(
+            url=app_fixture.url_path_for('adv_facet_stat'),
+            params={'name': name, 'model': adv.model, 'facets': ['salon', 'region']},
+            headers={'Authorization': 'Bearer {token}'.format(token=access_token)},
+        )
+        assert actual_result.status_code == status.HTTP_200_OK
+        assert actual_result.json()['data'] == {
+            'salon': [{'value': adv.salon, 'adv_count': 1}],
+            'region': [{'value': adv.region, 'adv_count': 1}],
+        }
+
+
+class TestAdminAdvertisementRouters:
+    """Class for testing admin advertisement routers."""
+
+    async def test_create_and_delete_advertisement(
+        self,
+        faker: Faker,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        db_session: AsyncSession,
+        admin_access_token: str,
+    ) -> None:
+        """Test admin create and delete routers keep statistics rollup in sync."""
+        headers = {'Authorization': 'Bearer {token}'.format(token=admin_access_token)}
+        car_info = AdvNameModelQuerySchema(
+            name=faker.pystr(min_chars=12),
+            model=faker.pystr(min_chars=12),
+        )
+        url = app_fixture.url_path_for('create_advertisement_admin')
+        created_ids = [
+            await create_adv(async_client, url, headers, car_info, 10),
+            await create_adv(async_client, url, headers, car_info, 20),
+        ]
+        stat_data = await adv_handlers.get_name_model_stat(
+            Request({'type': 'http'}),
+            db_session,
+            car_info,
+        )
+        assert stat_data['min_price'] == 10
+        assert stat_data['num_day'] == 2
+        response = await async_client.delete(
+            url=app_fixture.url_path_for(
+                'delete_advertisement',
+                instance_id=created_ids[0],
+            ),
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_200_OK
+        stat_data = await adv_handlers.get_name_model_stat(
+            Request({'type': 'http'}),
+            db_session,
+            car_info,
+        )
+        assert stat_data['min_price'] == 20
+        assert stat_data['num_day'] == 1
+
+    async def test_read_advertisement_fields(
+        self,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        admin_access_token: str,
+    ) -> None:
+        """Test admin read and list routers return only given fields."""
+        headers = {'Authorization': 'Bearer {token}'.format(token=admin_access_token)}
+        adv = AdvertisementFactory()
+        response = await async_client.get(
+            url=app_fixture.url_path_for('read_advertisement', instance_id=adv.id),
+            params={'fields': 'name,model'},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['data'] == {'name': adv.name, 'model': adv.model}
+        response = await async_client.get(
+            url=app_fixture.url_path_for('read_advertisement_list'),
+            params={'fields': 'id'},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert {'id': adv.id} in response.json()['data']
+
+    async def test_delete_old_advertisements(
+        self,
+        faker: Faker,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        admin_access_token: str,
+    ) -> None:
+        """Test delete_old_adv router deletes old advertisements in chunks."""
+        number = faker.random_int(min=3, max=5)
+        for _ in range(number):
+            AdvertisementFactory(
+                created_at=faker.date_time(tzinfo=utc, end_datetime='-30d'),
+            )
+        response = await async_client.delete(
+            url=app_fixture.url_path_for('delete_old_adv'),
+            params={'days': 1, 'chunk_size': 2, 'chunk_sleep': 0},
+            headers={
+                'Authorization': 'Bearer {token}'.format(token=admin_access_token),
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['data']['deleted_count'] >= number
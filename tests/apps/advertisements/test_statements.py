@@ -0,0 +1,189 @@
+"""Test advertisement statements use advertisement and rollup table indexes."""
+
+from datetime import date, datetime
+
+import pytest
+from pytz import utc
+from sqlalchemy import Executable, text
+from sqlalchemy.orm import Session
+
+from apps.advertisements.schemas import (
+    AdvNameModelQuerySchema,
+    AdvPeriodQuerySchema,
+    AdvSearchQuerySchema,
+    UrlSchema,
+)
+from apps.advertisements.statements import adv_stat_statements, adv_statements
+from settings import Settings
+
+
+def get_query_plan(session: Session, statement: Executable) -> str:
+    """Get EXPLAIN query plan of statement with sequential scans disabled.
+
+    Test table is tiny, so sequential scan is always cheaper without it.
+    Default partition is never pruned, so plans are checked for its indexes.
+    """
+    compiled = statement.compile(dialect=session.get_bind().dialect)
+    session.execute(text('SET LOCAL enable_seqscan = off'))
+    plan_rows = session.connection().exec_driver_sql(
+        'EXPLAIN {statement}'.format(statement=compiled),
+        compiled.params,
+    )
+    return '\n'.join(plan_row[0] for plan_row in plan_rows)
+
+
+class TestAdvStatementsIndexes:
+    """Class for testing AdvStatements query plans."""
+
+    def test_period_list_statement(self, sync_db_session: Session) -> None:
+        """Test period_list_statement page uses adv_date and id index."""
+        statement = adv_statements.period_list_statement(
+            period=AdvPeriodQuerySchema(begin='2024-01-01', end='2024-02-01'),
+            after=(date(2024, 1, 10), 1),
+            limit=100,
+        )
+        query_plan = get_query_plan(sync_db_session, statement)
+        assert 'advertisement_default_adv_date_id_idx' in query_plan
+        assert 'Sort  (' not in query_plan
+
+    @pytest.mark.parametrize(
+        'name, model',
+        [('Mazda', '6'), ('Mazda', None)],
+    )
+    def test_name_model_stat_statement(
+        self,
+        sync_db_session: Session,
+        name: str,
+        model: str | None,
+    ) -> None:
+        """Test rollup name_model_stat_statement uses name, model, date key."""
+        statement = adv_stat_statements.name_model_stat_statement(
+            car_info=AdvNameModelQuerySchema(name=name, model=model),
+            stat_dates=(
+                date(2024, 1, 10),
+                date(2024, 1, 4),
+                date(2023, 12, 11),
+            ),
+        )
+        assert 'advertisement_stat_name_key' in get_query_plan(
+            sync_db_session,
+            statement,
+        )
+
+    def test_fill_stat_statement(self, sync_db_session: Session) -> None:
+        """Test per pair rollup recompute uses lower(name)/lower(model) index."""
+        statement = adv_stat_statements.fill_stat_statement([('mazda', '6')])
+        assert 'advertisement_default_lower_lower1_idx' in get_query_plan(
+            sync_db_session,
+            statement,
+        )
+
+    def test_search_statement(self, sync_db_session: Session) -> None:
+        """Test search_statement uses search_vector gin index."""
+        statement = adv_statements.search_statement(
+            search=AdvSearchQuerySchema(q='Mazda dnipro'),
+            after=(0.5, 1),
+            limit=100,
+        )
+        assert 'advertisement_default_search_vector_idx' in get_query_plan(
+            sync_db_session,
+            statement,
+        )
+
+    def test_search_statement_trigram(
+        self,
+        sync_db_session: Session,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test trigram search_statement uses name and model trigram index."""
+        monkeypatch.setattr(Settings, 'SEARCH_TRIGRAM_ENABLED', True)
+        statement = adv_statements.search_statement(
+            search=AdvSearchQuerySchema(q='Mazda 6'),
+            limit=100,
+        )
+        compiled = str(statement.compile(dialect=sync_db_session.get_bind().dialect))
+        assert "lower(advertisement.name || ' ' || advertisement.model)" in compiled
+        trigram_index = sync_db_session.execute(
+            text(
+                'SELECT index_class.relname FROM pg_inherits '
+                'JOIN pg_class index_class ON index_class.oid = inhrelid '
+                "WHERE inhparent = to_regclass('advertisement_name_model_trgm_idx') "
+                "AND index_class.relname LIKE 'advertisement_default%'",
+            ),
+        ).scalar()
+        if trigram_index is None:
+            pytest.skip('pg_trgm extension is not available')
+        assert trigram_index in get_query_plan(sync_db_session, statement)
+
+    def test_delete_old_statement(self, sync_db_session: Session) -> None:
+        """Test delete_old_statement scans only default partition before all days."""
+        statement = adv_statements.delete_old_statement(
+            datetime(2024, 1, 1, tzinfo=utc),
+        )
+        query_plan = get_query_plan(sync_db_session, statement)
+        assert 'advertisement_default' in query_plan
+        assert 'advertisement_p' not in query_plan
+
+    def test_get_adv_by_url_statement(self, sync_db_session: Session) -> None:
+        """Test get_adv_by_url_statement uses url_slug index."""
+        statement = adv_statements.get_adv_by_url_statement(
+            UrlSchema(url='some_adv_123'),
+        )
+        assert 'advertisement_default_url_slug_idx' in get_query_plan(
+            sync_db_session,
+            statement,
+        )
+
+
+class TestAdvStatementsCache:
+    """Class for testing hot AdvStatements are cached lambda statements."""
+
+    def test_period_list_statement(self) -> None:
+        """Test period_list_statement is cached by shape with bound values."""
+        statements = [
+            adv_statements.period_list_statement(
+                period=AdvPeriodQuerySchema(begin=begin),
+                after=(after_date, after_id),
+                limit=limit,
+            )
+            for begin, after_date, after_id, limit in (
+                ('2024-01-01', date(2024, 1, 10), 1, 10),
+                ('2024-02-01', date(2024, 2, 10), 2, 20),
+            )
+        ]
+        cache_keys = [statement._generate_cache_key() for statement in statements]
+        assert cache_keys[0].key == cache_keys[1].key  # type: ignore
+        assert [
+            list(statement.compile().params.values()) for statement in statements
+        ] == [
+            [date(2024, 1, 1), date(2024, 1, 10), 1, 10],
+            [date(2024, 2, 1), date(2024, 2, 10), 2, 20],
+        ]
+        other_statement = adv_statements.period_list_statement(
+            period=AdvPeriodQuerySchema(end='2024-01-01'),
+            limit=10,
+        )
+        assert (
+            other_statement._generate_cache_key().key  # type: ignore
+            != cache_keys[0].key  # type: ignore
+        )
+
+    def test_get_adv_by_url_statement(self) -> None:
+        """Test get_adv_by_url_statement is cached by fields with bound url."""
+        statements = [
+            adv_statements.get_adv_by_url_statement(UrlSchema(url=url), fields)
+            for url, fields in (
+                ('first_adv_1', None),
+                ('second_adv_2', None),
+                ('second_adv_2', ['id']),
+            )
+        ]
+        cache_keys = [
+            statement._generate_cache_key().key  # type: ignore
+            for statement in statements
+        ]
+        assert cache_keys[0] == cache_keys[1]
+        assert cache_keys[1] != cache_keys[2]
+        assert [
+            list(statement.compile().params.values()) for statement in statements
+        ] == [['first_adv_1.html'], ['second_adv_2.html'], ['second_adv_2.html']]
@@ -0,0 +1 @@
+"""Init module for test common package."""
@@ -0,0 +1,70 @@
+"""Test cache module functionality."""
+
+from faker import Faker
+
+from apps.common.cache import LocalTTLCache, VersionedCache
+
+
+class TestLocalTTLCache:
+    """Test LocalTTLCache class."""
+
+    def test_lru_eviction(self, faker: Faker) -> None:
+        """Test least recently used entry is evicted over max size."""
+        cache = LocalTTLCache(max_size=2, ttl=60)
+        first, second, third = (faker.pystr() for _ in range(3))
+        cache.set(first, 1)
+        cache.set(second, 2)
+        assert cache.get(first) == 1
+        cache.set(third, 3)
+        assert cache.get(second) is None
+        assert cache.get(first) == 1
+        assert cache.get(third) == 3
+
+    def test_ttl_expiration(self, faker: Faker) -> None:
+        """Test expired entry is not returned."""
+        cache = LocalTTLCache(max_size=2, ttl=60)
+        key = faker.pystr()
+        cache.set(key, 1, ttl=-1)
+        assert cache.get(key) is None
+
+
+class TestVersionedCache:
+    """Test VersionedCache class."""
+
+    async def test_get_or_create(self, faker: Faker) -> None:
+        """Test value is created once and recreated after invalidation."""
+        cache = VersionedCache(
+            namespace=faker.pystr(),
+            max_size=10,
+            ttl=60,
+            redis_enabled=False,
+        )
+        calls: list[int] = []
+
+        async def create() -> dict:  # noqa: WPS430
+            """Create value."""
+            calls.append(1)
+            return {'calls': len(calls)}
+
+        key = faker.pystr()
+        assert await cache.get_or_create(key, create) == {'calls': 1}
+        assert await cache.get_or_create(key, create) == {'calls': 1}
+        cache.sync_invalidate()
+        assert await cache.get_or_create(key, create) == {'calls': 2}
+        await cache.invalidate()
+        assert await cache.get_or_create(key, create) == {'calls': 3}
+
+    async def test_get_watermark(self, faker: Faker) -> None:
+        """Test watermark is changed by invalidation."""
+        cache = VersionedCache(
+            namespace=faker.pystr(),
+            max_size=10,
+            ttl=3600,
+            redis_enabled=False,
+        )
+        version, modified = await cache.get_watermark()  # type: ignore
+        assert await cache.get_watermark() == (version, modified)
+        await cache.invalidate()
+        next_version, next_modified = await cache.get_watermark()  # type: ignore
+        assert next_version != version
+        assert next_modified >= modified
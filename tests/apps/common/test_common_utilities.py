@@ -0,0 +1,48 @@
+"""Test common utilities module functionality."""
+
+import pytest
+from faker import Faker
+from jose import JWTError, jwt
+from pydantic import ValidationError
+
+from apps.authorization.auth_utilities import create_access_token
+from apps.common.common_utilities import get_token_data
+
+
+class TestGetTokenData:
+    """Test get_token_data function."""
+
+    def test_get_token_data_cached(
+        self,
+        faker: Faker,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test verified token data is read from cache without decoding."""
+        email = faker.email()
+        token = create_access_token(subject=email)
+        token_data = get_token_data(token)
+        assert token_data.sub == email
+
+        def decode(*args: object, **kwargs: object) -> None:  # noqa: WPS430
+            """Fail on decoding."""
+            raise JWTError('Token is decoded')
+
+        monkeypatch.setattr(jwt, 'decode', decode)
+        assert get_token_data(token) == token_data
+        with pytest.raises(ValidationError):
+            token_data.sub = faker.email()
+        with pytest.raises(JWTError):
+            get_token_data(token, access=False)
+        with pytest.raises(JWTError):
+            get_token_data(create_access_token(subject=email, expires_delta=10))
+
+    def test_get_token_data_not_verified(self, faker: Faker) -> None:
+        """Test not verified token data is not cached."""
+        token = jwt.encode(
+            {'exp': 2000000000, 'sub': faker.email()},
+            'wrong key',
+            'HS256',
+        )
+        for _ in range(2):
+            with pytest.raises(JWTError):
+                get_token_data(token)
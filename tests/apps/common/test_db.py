@@ -0,0 +1,213 @@
+"""Test db module functionality."""
+
+from datetime import date
+from typing import Any, Awaitable, Callable
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch  # noqa
+from fastapi import Request
+from sqlalchemy import NullPool, event, func, insert, select, text, union
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from apps.advertisements.handlers import adv_handlers
+from apps.advertisements.models import Advertisement
+from apps.advertisements.schemas import (
+    AdvPeriodQuerySchema,
+    AdvTrendQuerySchema,
+    UrlSchema,
+)
+from apps.common.db import (
+    REPLICA_READS,
+    STICKY_PRIMARY,
+    RoutingSession,
+    replica_reads,
+    replica_set,
+)
+from apps.common.orm_services import statement_executor as executor
+from apps.common.schemas import PageQuerySchema
+from settings import Settings
+
+
+def get_routing_session(async_db_engine: AsyncEngine) -> AsyncSession:
+    """Get routing session with given primary engine."""
+    return async_sessionmaker(
+        bind=async_db_engine,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+    )()
+
+
+@replica_reads
+async def read_missing_function(session: AsyncSession) -> Any:
+    """Read missing function on replica."""
+    return await executor.execute_fetchall_statement(
+        session,
+        select(func.missing_function()),
+    )
+
+
+@replica_reads
+async def read_missing_function_on_primary(session: AsyncSession) -> Any:
+    """Read one on replica, then missing function on primary."""
+    await executor.execute_fetchall_statement(session, select(1))
+    return await executor.execute_fetchall_statement(
+        session,
+        text('SELECT missing_function()'),
+    )
+
+
+class TestRoutingSession:
+    """Test RoutingSession class."""
+
+    async def test_get_bind(
+        self,
+        async_db_engine: AsyncEngine,
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """Test replica reads go to replica until commit, other ones to primary."""
+        replica_engine = create_async_engine(
+            url=Settings.POSTGRES_DSN_ASYNC,
+            poolclass=NullPool,
+        )
+        monkeypatch.setattr(replica_set, 'engines', [replica_engine])
+        async with get_routing_session(async_db_engine) as session:
+            sync_session = session.sync_session
+            statement = select(Advertisement)
+            assert (
+                sync_session.get_bind(clause=statement) is async_db_engine.sync_engine
+            )
+            session.info[REPLICA_READS] = True
+            assert sync_session.get_bind(clause=statement) is replica_engine.sync_engine
+            assert (
+                sync_session.get_bind(clause=statement.with_for_update())
+                is async_db_engine.sync_engine
+            )
+            assert (
+                sync_session.get_bind(clause=union(select(1), select(2)))
+                is replica_engine.sync_engine
+            )
+            assert (
+                sync_session.get_bind(clause=text('SELECT 1'))
+                is async_db_engine.sync_engine
+            )
+            assert sync_session.get_bind(clause=statement) is replica_engine.sync_engine
+            await executor.execute_fetchall_statement(session, select(1))
+            await session.commit()
+            assert (
+                sync_session.get_bind(clause=statement) is async_db_engine.sync_engine
+            )
+        async with get_routing_session(async_db_engine) as session:
+            session.info[REPLICA_READS] = True
+            assert (
+                session.sync_session.get_bind(clause=insert(Advertisement))
+                is async_db_engine.sync_engine
+            )
+            assert (
+                session.sync_session.get_bind(clause=select(Advertisement))
+                is async_db_engine.sync_engine
+            )
+        await replica_engine.dispose()
+
+    async def test_replica_reads_handlers(
+        self,
+        async_db_engine: AsyncEngine,
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """Test lambda and plain statements of replica reads handlers go to replica."""
+        replica_engine = create_async_engine(
+            url=Settings.POSTGRES_DSN_ASYNC,
+            poolclass=NullPool,
+        )
+        monkeypatch.setattr(replica_set, 'engines', [replica_engine])
+        monkeypatch.setattr(replica_set, '_unhealthy_until', {})
+        replica_statements: list[str] = []
+
+        @event.listens_for(replica_engine.sync_engine, 'before_cursor_execute')
+        def record_statement(  # noqa: WPS430
+            conn: object,
+            cursor: object,
+            statement: str,
+            *args: object,
+        ) -> None:
+            """Record statement, sent to replica."""
+            replica_statements.append(statement)
+
+        request = Request({'type': 'http'})
+        today = date.today().isoformat()
+        async with get_routing_session(async_db_engine) as session:
+            await adv_handlers.get_adv_period_page(
+                request,
+                session,
+                AdvPeriodQuerySchema(begin=today, end=today),
+                PageQuerySchema(limit=10),
+            )
+            await adv_handlers.get_adv_by_url(
+                request,
+                session,
+                UrlSchema(url='auto_replica_123'),
+            )
+            await adv_handlers.get_price_trend(
+                request,
+                session,
+                AdvTrendQuerySchema(
+                    name='replica',
+                    model='replica',
+                    begin=today,
+                    end=today,
+                ),
+            )
+            assert not session.info.get(STICKY_PRIMARY)
+        assert len(replica_statements) == 3
+        await replica_engine.dispose()
+
+    async def test_replica_reads_fallback(
+        self,
+        async_db_engine: AsyncEngine,
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """Test replica reads handler is rerun on primary, if replica fails."""
+        replica_engine = create_async_engine(
+            url=Settings.POSTGRES_DSN_ASYNC.set(port=1),  # type: ignore
+            poolclass=NullPool,
+        )
+        monkeypatch.setattr(replica_set, 'engines', [replica_engine])
+        monkeypatch.setattr(replica_set, '_unhealthy_until', {})
+
+        @replica_reads
+        async def read_one(session: AsyncSession) -> int:  # noqa: WPS430
+            """Read one."""
+            return (await executor.execute_fetchall_statement(session, select(1)))[0][0]
+
+        async with get_routing_session(async_db_engine) as session:
+            assert await read_one(session) == 1
+        assert replica_set.get_engine() is None
+        await replica_engine.dispose()
+
+    @pytest.mark.parametrize(
+        'read_handler',
+        [read_missing_function, read_missing_function_on_primary],
+    )
+    async def test_replica_reads_statement_error(
+        self,
+        async_db_engine: AsyncEngine,
+        monkeypatch: MonkeyPatch,
+        read_handler: Callable[[AsyncSession], Awaitable[Any]],
+    ) -> None:
+        """Test statement errors don't mark replica unhealthy."""
+        replica_engine = create_async_engine(
+            url=Settings.POSTGRES_DSN_ASYNC,
+            poolclass=NullPool,
+        )
+        monkeypatch.setattr(replica_set, 'engines', [replica_engine])
+        monkeypatch.setattr(replica_set, '_unhealthy_until', {})
+        async with get_routing_session(async_db_engine) as session:
+            with pytest.raises(ProgrammingError):
+                await read_handler(session)
+        assert replica_set.get_engine() is replica_engine
+        await replica_engine.dispose()
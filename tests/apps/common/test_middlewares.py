@@ -0,0 +1,139 @@
+"""Test middlewares module functionality."""
+
+import gzip
+import zlib
+
+import brotli
+from faker import Faker
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from typing_extensions import AsyncIterator
+
+from apps.common.middlewares import (
+    GZIP_WBITS,
+    CompressionMiddleware,
+    GzipEncoder,
+    negotiate_encoding,
+)
+
+
+def get_compressed_app(text: str) -> FastAPI:
+    """Get app with compression middleware, returning given text."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get('/text/')
+    async def get_text() -> PlainTextResponse:  # noqa: WPS430
+        """Get text."""
+        return PlainTextResponse(text)
+
+    @app.get('/stream/')
+    async def get_stream() -> StreamingResponse:  # noqa: WPS430
+        """Get text as stream of lines."""
+
+        async def stream_lines() -> AsyncIterator[str]:  # noqa: WPS430
+            """Stream text lines."""
+            for line in text.splitlines(keepends=True):
+                yield line
+
+        return StreamingResponse(stream_lines())
+
+    return app
+
+
+class TestNegotiateEncoding:
+    """Test negotiate_encoding function."""
+
+    def test_negotiate_encoding(self) -> None:
+        """Test encoding is chosen by Accept-Encoding qualities."""
+        assert negotiate_encoding('gzip, deflate') == 'gzip'
+        assert negotiate_encoding('gzip, deflate, br') == 'br'
+        assert negotiate_encoding('br;q=0.5, gzip') == 'gzip'
+        assert negotiate_encoding('deflate;q=1, *;q=0.5') == 'br'
+        assert negotiate_encoding('gzip;q=0, *') == 'br'
+        assert negotiate_encoding('br;q=0, gzip;q=0, *') is None
+        assert negotiate_encoding('identity') is None
+        assert negotiate_encoding('') is None
+
+
+class TestCompressionMiddleware:
+    """Test CompressionMiddleware class."""
+
+    async def test_compress_response(self, faker: Faker) -> None:
+        """Test only responses not smaller than minimum size are compressed."""
+        text = faker.text(max_nb_chars=1000)
+        async with AsyncClient(
+            transport=ASGITransport(app=get_compressed_app(text)),
+            base_url='http://test',
+        ) as client:
+            response = await client.get('/text/', headers={'Accept-Encoding': 'gzip'})
+            assert response.headers['Content-Encoding'] == 'gzip'
+            assert response.headers['Vary'] == 'Accept-Encoding'
+            assert int(response.headers['Content-Length']) < len(text)
+            assert response.text == text
+            response = await client.get(
+                '/text/',
+                headers={'Accept-Encoding': 'identity'},
+            )
+            assert 'Content-Encoding' not in response.headers
+            assert response.text == text
+        async with AsyncClient(
+            transport=ASGITransport(app=get_compressed_app(text[:50])),
+            base_url='http://test',
+        ) as client:
+            response = await client.get('/text/', headers={'Accept-Encoding': 'gzip'})
+            assert 'Content-Encoding' not in response.headers
+            assert response.text == text[:50]
+
+    async def test_compress_streaming_response(self, faker: Faker) -> None:
+        """Test streaming response is compressed chunk by chunk."""
+        text = '\n'.join(faker.sentences(nb=20))
+        async with AsyncClient(
+            transport=ASGITransport(app=get_compressed_app(text)),
+            base_url='http://test',
+        ) as client:
+            async with client.stream(
+                'GET',
+                '/stream/',
+                headers={'Accept-Encoding': 'gzip'},
+            ) as response:
+                assert response.headers['Content-Encoding'] == 'gzip'
+                assert 'Content-Length' not in response.headers
+                compressed_body = b''.join(
+                    [chunk async for chunk in response.aiter_raw()],
+                )
+        assert gzip.decompress(compressed_body).decode() == text
+
+    async def test_compress_response_brotli(self, faker: Faker) -> None:
+        """Test response is compressed with brotli, if client prefers it."""
+        text = faker.text(max_nb_chars=1000)
+        async with AsyncClient(
+            transport=ASGITransport(app=get_compressed_app(text)),
+            base_url='http://test',
+        ) as client:
+            async with client.stream(
+                'GET',
+                '/text/',
+                headers={'Accept-Encoding': 'gzip;q=0.5, br'},
+            ) as response:
+                assert response.headers['Content-Encoding'] == 'br'
+                compressed_body = b''.join(
+                    [chunk async for chunk in response.aiter_raw()],
+                )
+        assert brotli.decompress(compressed_body).decode() == text
+
+
+class TestGzipEncoder:
+    """Test GzipEncoder class."""
+
+    def test_compress(self, faker: Faker) -> None:
+        """Test every compressed chunk is decompressed without next ones."""
+        encoder = GzipEncoder(level=6)
+        decompressor = zlib.decompressobj(GZIP_WBITS)
+        for chunk in faker.sentences(nb=5):
+            assert (
+                decompressor.decompress(encoder.compress(chunk.encode(), finish=False))
+                == chunk.encode()
+            )
+        encoder.compress(b'', finish=True)
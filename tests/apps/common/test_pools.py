@@ -0,0 +1,35 @@
+"""Test pools module functionality."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from apps.common.pools import MeasuredQueuePool, get_pool_stat
+from settings import Settings
+
+
+class TestMeasuredQueuePool:
+    """Test MeasuredQueuePool class."""
+
+    def test_wait_stats(self) -> None:
+        """Test checkouts, timeouts and checked out connections are reported."""
+        engine = create_engine(
+            url=Settings.POSTGRES_DSN,
+            poolclass=MeasuredQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.1,
+        )
+        with engine.connect():
+            pool_stat = get_pool_stat('test', engine)
+            assert pool_stat['checked_out'] == 1
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+        pool_stat = get_pool_stat('test', engine)
+        engine.dispose()
+        assert pool_stat['name'] == 'test'
+        assert pool_stat['checked_out'] == 0
+        assert pool_stat['checked_in'] == 1
+        assert pool_stat['checkouts'] == 2
+        assert pool_stat['timeouts'] == 1
+        assert pool_stat['max_wait_ms'] >= 100
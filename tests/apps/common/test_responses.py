@@ -0,0 +1,40 @@
+"""Test responses module functionality."""
+
+import json
+
+from faker import Faker
+from pytz import utc
+
+from apps.advertisements.schemas import AdvOut
+from apps.common.responses import get_jsend_response
+from apps.common.schemas import JSENDPageOutSchema
+
+
+class TestGetJsendResponse:
+    """Test get_jsend_response function."""
+
+    def test_get_jsend_response(self, faker: Faker) -> None:
+        """Test response renders like validated JSEND page schema."""
+        adv_data = {
+            'id': faker.random_int(),
+            'url': faker.url(),
+            'name': faker.pystr(),
+            'price': faker.random_int(),
+            'model': faker.pystr(),
+            'region': faker.city(),
+            'run': faker.random_int(),
+            'color': faker.color_name(),
+            'salon': faker.pystr(),
+            'seller': faker.name(),
+            'adv_date': faker.date_object(),
+            'created_at': faker.date_time(tzinfo=utc),
+        }
+        cursor = faker.pystr()
+        message = faker.sentence()
+        response = get_jsend_response([adv_data], message, next_cursor=cursor)
+        expected_result = JSENDPageOutSchema[AdvOut](
+            data=[AdvOut(**adv_data)],
+            message=message,
+            next_cursor=cursor,
+        ).model_dump(mode='json')
+        assert json.loads(response.body) == expected_result
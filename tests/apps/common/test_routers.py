@@ -0,0 +1,32 @@
+"""Test common apps routers."""
+
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+
+from apps.common.enum import JSENDStatus
+from settings import Settings
+
+
+class TestGetDbPoolStat:
+    """Class for testing get_db_pool_stat router."""
+
+    async def test_get_db_pool_stat(
+        self,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        admin_access_token: str,
+    ) -> None:
+        """Test get_db_pool_stat router returns primary engines pools statistics."""
+        response = await async_client.get(
+            url=app_fixture.url_path_for('db_pool_stat'),
+            headers={
+                'Authorization': 'Bearer {token}'.format(token=admin_access_token),
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['status'] == JSENDStatus.SUCCESS
+        assert [pool_stat['name'] for pool_stat in response.json()['data']] == [
+            'primary',
+            'primary sync',
+        ]
+        assert response.json()['data'][0]['size'] == Settings.POSTGRES_POOL_SIZE
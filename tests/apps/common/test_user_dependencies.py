@@ -0,0 +1,34 @@
+"""Test user dependencies module functionality."""
+
+import pytest
+from faker import Faker
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.authorization.auth_utilities import create_access_token
+from apps.common.exceptions import BackendError
+from apps.common.user_dependencies import get_user, user_cache
+from apps.user.models import User
+from tests.apps.user.factories import UserFactory
+
+
+class TestGetUser:
+    """Test get_user function."""
+
+    async def test_get_user_cached(
+        self,
+        faker: Faker,
+        db_session: AsyncSession,
+    ) -> None:
+        """Test user principal is read from cache until its invalidation."""
+        user: User = UserFactory(email=faker.email(), is_admin=True)
+        token = create_access_token(subject=user.email)
+        cached_user = await get_user(token, db_session, is_admin=True)
+        assert (cached_user.id, cached_user.email) == (user.id, user.email)
+        delete_statement = delete(User).where(User.id == user.id)
+        await db_session.execute(delete_statement)
+        cached_user = await get_user(token, db_session, is_admin=True)
+        assert cached_user.id == user.id
+        await user_cache.invalidate()
+        with pytest.raises(BackendError):
+            await get_user(token, db_session)
@@ -15,3 +15,12 @@ async def access_token(
     """Get access validation token."""
     user: User = UserFactory(email=faker.email())
     return create_access_token(subject=user.email)
+
+
+@pytest.fixture(scope='function')
+async def admin_access_token(
+    faker: Faker,
+) -> str:
+    """Get admin access validation token."""
+    user: User = UserFactory(email=faker.email(), is_admin=True)
+    return create_access_token(subject=user.email)
@@ -0,0 +1,40 @@
+"""Test user apps routers."""
+
+from faker import Faker
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+
+from apps.authorization.auth_utilities import create_access_token
+from apps.user.models import User
+from tests.apps.user.factories import UserFactory
+
+
+class TestAdminUserRouters:
+    """Class for testing admin user routers."""
+
+    async def test_delete_user_invalidates_cache(
+        self,
+        faker: Faker,
+        async_client: AsyncClient,
+        app_fixture: FastAPI,
+        admin_access_token: str,
+    ) -> None:
+        """Test deleted user token is rejected, though user has been cached."""
+        user: User = UserFactory(email=faker.email())
+        headers = {
+            'Authorization': 'Bearer {token}'.format(
+                token=create_access_token(subject=user.email),
+            ),
+        }
+        url = app_fixture.url_path_for('adv_period')
+        response = await async_client.get(url=url, headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        response = await async_client.delete(
+            url=app_fixture.url_path_for('delete_user', instance_id=str(user.id)),
+            headers={
+                'Authorization': 'Bearer {token}'.format(token=admin_access_token),
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        response = await async_client.get(url=url, headers=headers)
+        assert response.status_code != status.HTTP_200_OK
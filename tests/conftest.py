@@ -21,9 +21,12 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
+from apps.advertisements.adv_utilities import adv_stat_cache
+from apps.common.common_utilities import token_cache
 from apps.common.db import async_session_factory as AsyncSessionFactory  # noqa
 from apps.common.db import session_factory as SessionFactory  # noqa
 from apps.common.dependencies import get_async_session, get_session
+from apps.common.user_dependencies import user_cache
 from settings import Settings
 from tests.apps.advertisements.factories import AdvertisementFactory
 from tests.apps.user.factories import UserFactory
@@ -129,6 +132,28 @@ def no_http_requests(monkeypatch_session: MonkeyPatch) -> None:  # noqa
     )
 
 
+@pytest.fixture(scope='session', autouse=True)
+def disable_cache_redis_tier(monkeypatch_session: MonkeyPatch) -> None:
+    """Use only in-process tiers of caches, for not sharing them with other runs."""
+    monkeypatch_session.setattr(
+        target=adv_stat_cache,
+        name='redis_enabled',
+        value=False,
+    )
+    monkeypatch_session.setattr(
+        target=user_cache,
+        name='redis_enabled',
+        value=False,
+    )
+
+
+@pytest.fixture(scope='function', autouse=True)
+def clear_user_cache() -> None:
+    """Clear cached user principals, since users are rolled back after tests."""
+    user_cache.local_cache.clear()
+    token_cache.clear()
+
+
 @pytest.fixture(scope='session', autouse=True)
 def custom_event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     """Create asyncio (uvloop) for tests runtime.